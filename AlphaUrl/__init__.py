@@ -0,0 +1,41 @@
+"""
+Alpha Vantage client.
+
+    from AlphaUrl import Alpha_url
+    av = Alpha_url(api_key)
+
+The names below are imported from their modules on first access, so
+`import AlphaUrl` stays cheap and, say, asyncio is only loaded by code that
+touches AsyncAlpha_url. See AlphaUrl.startup for the import-time budget.
+"""
+import importlib
+
+_EXPORTS = {
+    'Alpha_url': 'client',
+    'AsyncAlpha_url': 'aio',
+    'AlphaVantageError': 'errors',
+    'ApiError': 'errors',
+    'RateLimitError': 'errors',
+    'QuotaExceededError': 'errors',
+    'RateLimiter': 'limits',
+    'RetryPolicy': 'retry',
+    'DiskCache': 'cache',
+    'MemoryCache': 'cache',
+    'FetchResult': 'batch',
+    'split_results': 'batch',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | _EXPORTS.keys())
@@ -0,0 +1,412 @@
+"""
+asyncio client with the same endpoint surface as Alpha_url.
+
+    async with AsyncAlpha_url(api_key, max_concurrency=200) as av:
+        frames = await asyncio.gather(*(av.get_daily_data(t) for t in tickers))
+
+Every public Alpha_url method that talks to the API is mirrored as a
+coroutine with the same name, parameters and return value. Endpoints of the
+table in AlphaUrl.endpoints dispatch through the same request building and
+parsing as the blocking client (_call); the single-request helpers listed in
+MIRRORED (as_series, price_series) run against a replay transport that hands
+the request over to the event loop and then runs the blocking code on the
+downloaded body. Helpers without I/O (series_name, the iter_* parameter
+builders) are shared with Alpha_url as they are.
+
+Requires aiohttp (pip install aiohttp).
+"""
+import asyncio
+import codecs
+import csv
+import functools
+import inspect
+import os
+
+from .client import Alpha_url, _build_response, _open_store, _bulk_quote_chunks, _merge_bulk_quotes, DEFAULT_TIMEOUT
+from .batch import FetchResult, call_args
+from .cache import DiskCache, MemoryCache, query_items, request_key
+from .endpoints import ENDPOINTS, FAMILIES, LazyEndpoints, install
+from .errors import AlphaVantageError
+from .limits import RateLimiter
+from .retry import RetryPolicy, response_error, retry_exceptions
+
+DEFAULT_MAX_CONCURRENCY = 100
+MIRRORED = ('as_series', 'price_series')  # Alpha_url methods whose only I/O is one request
+SHARED = ('series_name',)  # Alpha_url methods without I/O, used as they are
+
+
+async def _csv_rows(head, content):
+    """ rows of a CSV body streamed as byte chunks (head already read). Lines
+    are handed to the parser whole records at a time: a quoted field may hold
+    a newline, and a record ends where the count of quotes seen is even """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    pending, record, quotes = '', [], 0
+
+    async def chunks():
+        yield head
+        async for chunk in content:
+            yield chunk
+
+    async for chunk in chunks():
+        lines = (pending + decoder.decode(chunk)).split('\n')
+        pending = lines.pop()
+        for line in lines:
+            record.append(line + '\n')
+            quotes += line.count('"')
+            if quotes % 2 == 0:
+                for row in csv.reader(record):
+                    if row:
+                        yield row
+                record, quotes = [], 0
+    record.append(pending + decoder.decode(b'', final=True))
+    for row in csv.reader(record):
+        if row:
+            yield row
+
+
+class _Deferred(Exception):
+    """ raised by _Replay._get to hand the pending request to the event loop """
+    def __init__(self, url, params):
+        super().__init__(url)
+        self.url = url
+        self.params = params
+
+
+class _Replay(Alpha_url):
+    """
+    Alpha_url that never touches the network. The first _get raises _Deferred
+    with the request; once the event loop has fetched it the method is run
+    again and _get returns that response (or raises the transport error).
+    Only one request per call can be replayed, see MIRRORED.
+    """
+    def __init__(self, client):
+        self.api_key = client.api_key
+        self.base_url = client.base_url
+        self.analytics_url = client.analytics_url
+        self.store = client.store
+        self.outcome = None
+        self.request = None
+
+    def _get(self, url, params=None):
+        if self.outcome is None:
+            self.request = (url, params)
+            raise _Deferred(url, params)
+        if (url, params) != self.request:
+            raise RuntimeError(f"replayed method sent a second request ({url}), give it its own coroutine")
+        self.request = None  # consumed: a repeat of the same request is a second one too
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return self.outcome
+
+    def _iter_csv(self, url, params=None):
+        response = self._get(url, params)
+        response.raise_for_status()
+        return csv.reader(response.text.splitlines())
+
+
+class AsyncAlpha_url(metaclass=LazyEndpoints):
+    def __init__(self, api_key=None, max_concurrency=DEFAULT_MAX_CONCURRENCY, pool_size=None, timeout=DEFAULT_TIMEOUT,
+                 calls_per_minute=None, calls_per_day=None, limiter=None, cache_dir=None, cache=None,
+                 memory_cache_bytes=None, retry=None, store_dir=None, store=None):
+        """
+        max_concurrency: requests allowed in flight at once on this client.
+        pool_size:       keep-alive connections kept open (default: max_concurrency).
+        timeout:         seconds or (connect, read) tuple, as for Alpha_url.
+        calls_per_minute / calls_per_day / limiter:
+                         quota budgets, as for Alpha_url; requests await budget
+                         before taking a concurrency slot.
+        cache_dir / cache / memory_cache_bytes:
+                         response caches, as for Alpha_url. Concurrent identical
+                         requests share a single call.
+        retry:           RetryPolicy, as for Alpha_url.
+        store_dir / store:
+                         local columnar store for store_series(), as for Alpha_url.
+        """
+        self.api_key = api_key or os.getenv("ALPHA_API_KEY")
+        self.base_url = 'https://www.alphavantage.co/query?function='
+        self.analytics_url = 'https://alphavantageapi.co/timeseries/'
+        self.timeout = timeout
+        self.pool_size = pool_size or max_concurrency
+        self.limiter = limiter or RateLimiter(calls_per_minute, calls_per_day)
+        self.cache = cache or (DiskCache(cache_dir) if cache_dir else None)
+        self.memory_cache = MemoryCache(memory_cache_bytes) if memory_cache_bytes else None
+        self._inflight = {}  # request key -> Future of (status_code, content, headers)
+        self.retry = retry or RetryPolicy()
+        self.store = store or _open_store(store_dir)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._session = None
+
+    def __getattr__(self, name):
+        """ endpoint coroutines are generated a family at a time on first access, as on Alpha_url """
+        endpoint = ENDPOINTS.get(name)
+        if endpoint is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        type(self).load_endpoints(endpoint.family)
+        return getattr(self, name)
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | ENDPOINTS.keys())
+
+    @classmethod
+    def load_endpoints(cls, *families):
+        """ Alpha_url.load_endpoints for the coroutine methods """
+        for family in families or FAMILIES:
+            install(cls, family, _endpoint_coroutine)
+
+    def _open_session(self):
+        import aiohttp
+
+        if isinstance(self.timeout, tuple):
+            connect, read = self.timeout
+            timeout = aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+        else:
+            timeout = aiohttp.ClientTimeout(total=self.timeout)
+        connector = aiohttp.TCPConnector(limit=self.pool_size, limit_per_host=0, keepalive_timeout=30)
+        self._session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        return self._session
+
+    async def _get(self, url, params=None):
+        """ async transport entry point, returns a fully read requests.Response """
+        if params:
+            params = [(k, str(v)) for k, v in query_items(params) if v is not None]
+        key, family = request_key(url, params)
+        hit = self.memory_cache.get(key) if self.memory_cache is not None else None
+        if hit is None:
+            flight = self._inflight.get(key)
+            if flight is None:
+                flight = self._inflight[key] = asyncio.ensure_future(self._fetch(url, params, key, family))
+                flight.add_done_callback(lambda _: self._inflight.pop(key, None))
+            hit = await asyncio.shield(flight)
+        return _build_response(url, *hit)
+
+    async def _fetch(self, url, params, key, family):
+        """ disk cache, then quota and network; returns (status_code, content, headers) """
+        hit = self.cache.get(key) if self.cache is not None else None
+        if hit is None:
+            hit = await self._send(url, params)
+            if self.cache is not None:
+                self.cache.set(key, family, *hit)
+        if self.memory_cache is not None:
+            self.memory_cache.set(key, family, *hit)
+        return hit
+
+    async def _request(self, url, params):
+        """ one attempt: (status_code, content, headers) with aiohttp errors mapped to requests' """
+        import aiohttp
+        import requests
+
+        await self.limiter.acquire_async()
+        async with self._semaphore:
+            session = self._session or self._open_session()
+            try:
+                async with session.get(url, params=params) as resp:
+                    return resp.status, await resp.read(), dict(resp.headers)
+            except asyncio.TimeoutError as e:
+                raise requests.exceptions.Timeout(e)
+            except aiohttp.ClientError as e:
+                raise requests.exceptions.ConnectionError(e)
+
+    async def _send(self, url, params):
+        """ _request under the retry policy; throttle and error bodies raise """
+        attempt = 0
+        while True:
+            try:
+                hit = await self._request(url, params)
+            except retry_exceptions() as e:
+                if not self.retry.should_retry(attempt, error=e):
+                    raise
+            else:
+                error = response_error(hit[0], hit[1])
+                if error is None and not self.retry.should_retry(attempt, hit[0]):
+                    return hit
+                if error is not None and not self.retry.should_retry(attempt, error=error):
+                    raise error
+            await asyncio.sleep(self.retry.delay(attempt))
+            attempt += 1
+
+    async def _call(self, method, *args, **kwargs):
+        """ coroutine form of Alpha_url._call """
+        endpoint = ENDPOINTS[method]
+        url, query = endpoint.request(self, *args, **kwargs)
+        response = await self._get(url, query)
+        response.raise_for_status()
+        return endpoint.parse(response, query)
+
+    def remaining_quota(self):
+        """ calls that can be sent right now, e.g. {'minute': 70, 'day': 24800} """
+        return self.limiter.remaining()
+
+    async def fetch_many(self, method, params_list):
+        """
+        Coroutine form of Alpha_url.fetch_many: every item is scheduled at once
+        and max_concurrency / the rate limiter pace them. Returns FetchResult
+        items in input order.
+        """
+        if isinstance(method, str):
+            method = getattr(self, method)
+
+        async def run(params):
+            args, kwargs = call_args(params)
+            try:
+                return FetchResult(params, await method(*args, **kwargs), None)
+            except Exception as e:
+                return FetchResult(params, None, e)
+
+        return list(await asyncio.gather(*(run(p) for p in params_list)))
+
+    async def _iter_csv(self, url, params=None):
+        """ async form of Alpha_url._iter_csv: rows are parsed line by line as the body arrives """
+        import aiohttp
+        import requests
+
+        if params:
+            params = [(k, str(v)) for k, v in query_items(params) if v is not None]
+        attempt = 0
+        while True:
+            error = None
+            started = False  # once rows went out the request can no longer be retried
+            await self.limiter.acquire_async()
+            async with self._semaphore:
+                session = self._session or self._open_session()
+                try:
+                    async with session.get(url, params=params) as resp:
+                        head = await resp.content.readline()
+                        if resp.status >= 400 and not self.retry.should_retry(attempt, resp.status):
+                            _build_response(str(resp.url), resp.status, head + await resp.read()).raise_for_status()
+                        if head[:1] == b'{':
+                            error = response_error(resp.status, head + await resp.read())
+                        if error is None and resp.status < 400:
+                            started = True
+                            async for row in _csv_rows(head, resp.content):
+                                yield row
+                            return
+                except asyncio.TimeoutError as e:
+                    error = requests.exceptions.Timeout(e)
+                except aiohttp.ClientError as e:
+                    error = requests.exceptions.ConnectionError(e)
+            if error is not None and (started or not self.retry.should_retry(attempt, error=error)):
+                raise error
+            await asyncio.sleep(self.retry.delay(attempt))
+            attempt += 1
+
+    async def iter_rows(self, function, **params):
+        """ async generator form of Alpha_url.iter_rows """
+        params = dict(params, apikey=self.api_key, datatype='csv')
+        header = None
+        async for row in self._iter_csv(f'{self.base_url}{function}', params):
+            if header is None:
+                header = row
+            else:
+                yield dict(zip(header, row))
+
+    async def backfill_intraday(self, ticker, interval, start, end, adjusted=True, extended_hours=True):
+        """ Alpha_url.backfill_intraday with every month in flight at once """
+        from .series import month_range, stitch_months
+
+        payloads = await asyncio.gather(*(
+            self.get_intraday_data(ticker, interval, adjusted=adjusted, extended_hours=extended_hours,
+                                   month=month, outputsize='full', datatype='csv')
+            for month in month_range(start, end)))
+        return stitch_months(payloads, start, end)
+
+    async def options_history(self, ticker, start, end):
+        """ Alpha_url.options_history with every day in flight at once """
+        from .options import OptionChain, trading_days
+
+        async def day_chain(day):
+            return OptionChain.from_csv(await self._historical_options_csv(ticker, day))
+
+        return OptionChain.concat(await asyncio.gather(*(day_chain(day) for day in trading_days(start, end))))
+
+    async def option_chain(self, ticker):
+        """ coroutine form of Alpha_url.option_chain """
+        from .options import IndexedChain, OptionChain
+
+        return IndexedChain(OptionChain.from_csv(await self._realtime_options_csv(ticker)))
+
+    async def store_series(self, method, *args, **kwargs):
+        """ coroutine form of Alpha_url.store_series """
+        if self.store is None:
+            raise AlphaVantageError("No store configured, pass store_dir= to the client")
+        symbol, name = self.series_name(method, *args, **kwargs)
+        self.store.write(symbol, name, await self.as_series(method, *args, **kwargs))
+        return self.store.read(symbol, name)
+
+    async def refresh_series(self, method, *args, **kwargs):
+        """ coroutine form of Alpha_url.refresh_series """
+        from .store import compact_reaches, needs_full_history
+
+        if self.store is None:
+            raise AlphaVantageError("No store configured, pass store_dir= to the client")
+        if 'outputsize' not in inspect.signature(getattr(self, method)).parameters:
+            raise ValueError(f"{method} has no compact output, use store_series")
+        symbol, name = self.series_name(method, *args, **kwargs)
+        stored = self.store.read(symbol, name)
+        kwargs.pop('outputsize', None)
+        if compact_reaches(stored, Alpha_url._interval(self, method, *args, **kwargs)):
+            compact = await self.as_series(method, *args, outputsize='compact', **kwargs)
+            if not needs_full_history(stored, compact):
+                self.store.write(symbol, name, compact)
+                return self.store.read(symbol, name)
+        self.store.write(symbol, name, await self.as_series(method, *args, outputsize='full', **kwargs))
+        return self.store.read(symbol, name)
+
+    @property
+    def local(self):
+        """ Alpha_url.local with coroutine methods """
+        from .local import AsyncLocalIndicators
+
+        return AsyncLocalIndicators(self)
+
+    async def realtime_bulk_quotes(self, tickers):
+        """ Alpha_url.realtime_bulk_quotes: all 100-symbol chunks in flight at once """
+        chunks = _bulk_quote_chunks(tickers)
+        payloads = await asyncio.gather(*(self._bulk_quotes_chunk(chunk) for chunk in chunks))
+        return _merge_bulk_quotes(chunks, payloads)
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+
+def _mirror(name):
+    method = getattr(Alpha_url, name)
+
+    @functools.wraps(method)
+    async def endpoint(self, *args, **kwargs):
+        import requests
+
+        replay = _Replay(self)
+        try:
+            return method(replay, *args, **kwargs)
+        except _Deferred as pending:
+            try:
+                replay.outcome = await self._get(pending.url, pending.params)
+            except requests.exceptions.RequestException as e:
+                replay.outcome = e
+        return method(replay, *args, **kwargs)
+
+    return endpoint
+
+
+def _endpoint_coroutine(endpoint):
+    async def method(self, *args, **kwargs):
+        return await self._call(endpoint.method, *args, **kwargs)
+    return endpoint.bind(method, AsyncAlpha_url)
+
+
+for _name in dir(Alpha_url):
+    if _name.startswith('_') or _name in vars(AsyncAlpha_url) or _name in ENDPOINTS:
+        continue
+    if _name in SHARED or _name.startswith('iter_'):
+        # row iterators only build parameters and return self.iter_rows(...)
+        setattr(AsyncAlpha_url, _name, getattr(Alpha_url, _name))
+    elif _name in MIRRORED:
+        setattr(AsyncAlpha_url, _name, _mirror(_name))
@@ -0,0 +1,446 @@
+"""
+Return analytics computed locally: the CALCULATIONS of the Alpha Intelligence
+analytics endpoints (advanced_analytics_fixed_window and
+advanced_analytics_sliding_window).
+
+    av.local.advanced_analytics_fixed_window('AAPL,MSFT,IBM', '2023-07-01', '2023-08-31',
+                                             'MEAN,STDDEV(annualized=True),CORRELATION(method=KENDALL)')
+    av.local.advanced_analytics_sliding_window('AAPL,MSFT', '2year', calculations='MEAN,CORRELATION',
+                                               window_size=20)
+
+The prices of all symbols are aligned on their common timestamps into one
+symbols x time matrix and each calculation runs over the whole matrix at
+once, so there is no cap on the number of symbols. Results come back in the
+endpoint's layout, {'meta_data': ..., 'payload': {'RETURNS_CALCULATIONS': ...}},
+with NumPy values.
+
+Requires numpy.
+"""
+import bisect
+import re
+
+import numpy as np
+
+PERIODS_PER_YEAR = {'DAILY': 252, 'WEEKLY': 52, 'MONTHLY': 12}
+TRADING_MINUTES_PER_YEAR = 252 * 390
+
+FIXED_WINDOW = ('MIN', 'MAX', 'MEAN', 'MEDIAN', 'CUMULATIVE_RETURN', 'VARIANCE', 'STDDEV', 'MAX_DRAWDOWN',
+                'HISTOGRAM', 'AUTOCORRELATION', 'COVARIANCE', 'CORRELATION')
+SLIDING_WINDOW = ('MEAN', 'MEDIAN', 'CUMULATIVE_RETURN', 'VARIANCE', 'STDDEV', 'COVARIANCE', 'CORRELATION')
+
+RANGE_UNITS = {'minute': 60, 'hour': 3600, 'day': 86400, 'week': 7 * 86400}
+
+
+def unprefixed(value, prefix):
+    """ the endpoint method takes '&OHLC=close' style arguments, accept those too """
+    value = str(value)
+    return value[len(prefix):] if value.upper().startswith(prefix.upper()) else value
+
+
+def symbols_of(tickers):
+    """ 'AAPL,MSFT', '&SYMBOLS=AAPL,MSFT' or a list -> ['AAPL', 'MSFT'] """
+    if isinstance(tickers, str):
+        tickers = unprefixed(tickers, '&SYMBOLS=').split(',')
+    return [t.strip().upper() for t in tickers if t.strip()]
+
+
+def _option(value):
+    if value.lower() in ('true', 'false'):
+        return value.lower() == 'true'
+    try:
+        return int(value)
+    except ValueError:
+        return value.upper()
+
+
+def parse_calculations(calculations):
+    """ 'MEAN,STDDEV(annualized=True),HISTOGRAM(bins=20)' ->
+    [('MEAN', {}), ('STDDEV', {'annualized': True}), ('HISTOGRAM', {'bins': 20})] """
+    if not isinstance(calculations, str):
+        calculations = ','.join(calculations)
+    parsed = []
+    for name, args in re.findall(r'([A-Za-z_]+)\s*(?:\(([^)]*)\))?', unprefixed(calculations, '&CALCULATIONS=')):
+        options = {}
+        for arg in filter(None, (a.strip() for a in args.split(','))):
+            key, _, value = arg.partition('=')
+            options[key.strip().lower()] = _option(value.strip())
+        parsed.append((name.upper(), options))
+    return parsed
+
+
+def _label(name, options):
+    if not options:
+        return name
+    return f"{name}({','.join(f'{k}={v}' for k, v in options.items())})"
+
+
+def periods_per_year(interval):
+    """ return observations per year of an INTERVAL ('DAILY', '5min', ...) """
+    interval = unprefixed(interval, '&INTERVAL=').upper()
+    if interval.endswith('MIN'):
+        return TRADING_MINUTES_PER_YEAR / int(interval[:-3])
+    return PERIODS_PER_YEAR[interval]
+
+
+def align(series, ohlc='close'):
+    """ {symbol: TimeSeries} -> (symbols, timestamps, prices) with prices a
+    symbols x time matrix over the timestamps every series has """
+    ohlc = unprefixed(ohlc, '&OHLC=').lower()
+    symbols = list(series)
+    timestamps = None
+    for ts in series.values():
+        timestamps = ts.timestamps if timestamps is None else np.intersect1d(timestamps, ts.timestamps)
+    prices = np.empty((len(symbols), len(timestamps)))
+    for row, ts in enumerate(series.values()):
+        prices[row] = ts[ohlc][np.searchsorted(ts.timestamps, timestamps)]
+    return symbols, np.asarray(timestamps, dtype=np.int64), prices
+
+
+def select_range(timestamps, prices, range1=None, range2=None):
+    """
+    Columns inside the endpoint's RANGE: 'full', a trailing '{N}day' ('minute',
+    'hour', 'week', 'month', 'year') or a start and end date. A date-only end
+    includes that whole day.
+    """
+    range1 = unprefixed(range1, '&RANGE=') if range1 is not None else None
+    range2 = unprefixed(range2, '&RANGE=') if range2 is not None else None
+    if not len(timestamps) or range1 in (None, '', 'full'):
+        return timestamps, prices
+    relative = re.fullmatch(r'(\d+)\s*(minute|hour|day|week|month|year)s?', range1.strip().lower())
+    if relative:
+        count, unit = int(relative.group(1)), relative.group(2)
+        last = np.datetime64(int(timestamps[-1]), 's')
+        if unit in ('month', 'year'):
+            months = count * (12 if unit == 'year' else 1)
+            day = last.astype('datetime64[D]')
+            offset = last - day.astype('datetime64[M]').astype('datetime64[s]')
+            start = (day.astype('datetime64[M]') - months).astype('datetime64[s]') + offset
+        else:
+            start = last - np.timedelta64(count * RANGE_UNITS[unit], 's')
+        keep = timestamps >= start.astype(np.int64)
+        return timestamps[keep], prices[:, keep]
+    start = np.datetime64(range1, 's').astype(np.int64)
+    keep = timestamps >= start
+    if range2:
+        end = np.datetime64(range2)
+        keep &= timestamps <= ((end + 1).astype('datetime64[s]') - 1).astype(np.int64)
+    return timestamps[keep], prices[:, keep]
+
+
+def returns_of(prices):
+    """ simple returns between consecutive observations, symbols x (time - 1) """
+    return prices[:, 1:] / prices[:, :-1] - 1.0
+
+
+def ranks(matrix):
+    """ average ranks (ties share the mean of their positions) along each row """
+    out = np.empty(matrix.shape)
+    for row, values in enumerate(matrix):
+        _, inverse, counts = np.unique(values, return_inverse=True, return_counts=True)
+        out[row] = (np.cumsum(counts) - (counts - 1) / 2.0)[inverse]
+    return out
+
+
+def pearson(matrix):
+    return np.corrcoef(matrix) if len(matrix) > 1 else np.ones((len(matrix), len(matrix)))
+
+
+_BLOCK = 16  # runs counted pair by pair before merging
+
+
+def _inversions(values):
+    """
+    Pairs i < j with values[i] > values[j] in each row of non-negative ints
+    below values.shape[1]: runs of _BLOCK are counted directly, then merged
+    bottom-up, every row and run at once. A merge tags each value with the
+    half it came from and sorts (a radix sort for 16-bit values), so where the
+    right half's values land says how many left ones each passed.
+    """
+    rows, count = values.shape
+    width = max(_BLOCK, 1 << max(count - 1, 0).bit_length())
+    dtype = np.int16 if count < 2 ** 14 else np.int64
+    merged = np.full((rows, width), count, dtype)  # padding sorts last, inverts nothing
+    merged[:, :count] = values
+    runs = merged.reshape(-1, _BLOCK)
+    total = np.zeros(rows, np.int64)
+    for offset in range(1, _BLOCK):
+        total += np.count_nonzero((runs[:, :-offset] > runs[:, offset:]).reshape(rows, -1), axis=1)
+    merged = np.sort(runs, axis=1)
+    half = _BLOCK
+    while half < width:
+        side = np.repeat(np.arange(2, dtype=dtype), half)
+        tagged = np.sort((merged.reshape(-1, 2 * half) << 1) | side, axis=1, kind='stable')
+        # the k-th right value landing at p passed half - (p - k) left ones (ties stay behind)
+        landed = (tagged & 1).astype(np.float64) @ np.arange(2 * half, dtype=np.float64)
+        merges = width // (2 * half)
+        total += merges * (half * half + half * (half - 1) // 2) - landed.reshape(rows, -1).sum(axis=1).astype(np.int64)
+        merged = tagged >> 1
+        half *= 2
+    return total
+
+
+def _tied_pairs(sorted_keys):
+    """ pairs of equal values in each row of sorted keys """
+    index = np.arange(sorted_keys.shape[1])
+    starts = np.where(np.diff(sorted_keys, axis=1, prepend=-1) != 0, index, 0)
+    return (index - np.maximum.accumulate(starts, axis=1)).sum(axis=1)
+
+
+def _kendall_products(matrix):
+    """ tau-b as products of sign(x[j] - x[i]) over all pairs i < j of observations,
+    one observation offset at a time: O(T²) but matrix products, the cheaper
+    way for short series """
+    count = matrix.shape[1]
+    product = np.zeros((len(matrix), len(matrix)))
+    for offset in range(1, count):
+        signs = np.sign(matrix[:, offset:] - matrix[:, :-offset])
+        product += signs @ signs.T
+    scale = np.sqrt(np.diag(product))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return product / np.outer(scale, scale)
+
+
+def _kendall_knight(matrix):
+    """ tau-b by Knight's method: order the observations by x (then y) and the
+    discordant pairs are the inversions left in y, O(T log T) per pair. Each
+    row is paired with all the following ones at once """
+    symbols, count = matrix.shape
+    ranked = np.empty(matrix.shape, np.int64)
+    ties = np.empty(symbols)
+    for row, values in enumerate(matrix):
+        _, ranked[row], counts = np.unique(values, return_inverse=True, return_counts=True)
+        ties[row] = (counts * (counts - 1) / 2).sum()
+    pairs = count * (count - 1) / 2.0
+    tau = np.empty((symbols, symbols))
+    for row in range(symbols):
+        others = ranked[row:]
+        if ties[row]:
+            keys = ranked[row] * count + others
+            order = np.argsort(keys, axis=1, kind='stable')
+            discordant = _inversions(np.take_along_axis(others, order, axis=1))
+            joint = _tied_pairs(np.take_along_axis(keys, order, axis=1))
+        else:
+            # no ties in x: one ordering serves every y
+            discordant = _inversions(others[:, np.argsort(ranked[row])])
+            joint = 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            tau[row, row:] = tau[row:, row] = (pairs - ties[row] - ties[row:] + joint - 2 * discordant) / \
+                np.sqrt((pairs - ties[row]) * (pairs - ties[row:]))
+    missing = np.isnan(matrix).any(axis=1)
+    tau[missing] = tau[:, missing] = np.nan
+    return tau
+
+
+def kendall(matrix):
+    """
+    Kendall tau-b between every pair of rows. Short series (a sliding window,
+    a year of days for many symbols) go through the sign products, whose
+    T² / 2 comparisons are matrix products; long ones through Knight's merge
+    sort, whose cost grows as T log T. Rows holding NaN give NaN.
+    """
+    symbols, count = matrix.shape
+    # relative costs measured on both paths: the products run at BLAS speed
+    # until the symbols outgrow it, the merge sort pays per pair
+    products = count * count * symbols * (1 + symbols / 420.0)
+    knight = count * symbols * (1.3 * (symbols + 1) * np.log2(max(count, 2)) + 200)
+    return _kendall_products(matrix) if products <= knight else _kendall_knight(matrix)
+
+
+def correlation(matrix, method='PEARSON'):
+    method = str(method).upper()
+    if method == 'KENDALL':
+        return kendall(matrix)
+    if method == 'SPEARMAN':
+        return pearson(ranks(matrix))
+    if method == 'PEARSON':
+        return pearson(matrix)
+    raise ValueError(f"Unknown correlation method: {method}")
+
+
+def covariance(matrix):
+    """ population covariance between rows """
+    centered = matrix - matrix.mean(axis=1, keepdims=True)
+    return centered @ centered.T / matrix.shape[1]
+
+
+def autocorrelation(returns, lag=1):
+    """ correlation of each row with itself lag observations earlier """
+    head, tail = returns[:, lag:], returns[:, :-lag]
+    head = head - head.mean(axis=1, keepdims=True)
+    tail = tail - tail.mean(axis=1, keepdims=True)
+    return (head * tail).sum(axis=1) / np.sqrt((head * head).sum(axis=1) * (tail * tail).sum(axis=1))
+
+
+def max_drawdown(prices):
+    """ (drawdown, peak column, trough column) per row: the largest fall from a running peak """
+    peaks = np.maximum.accumulate(prices, axis=1)
+    drawdowns = prices / peaks - 1.0
+    troughs = drawdowns.argmin(axis=1)
+    deepest = drawdowns[np.arange(len(prices)), troughs]
+    starts = np.array([prices[row, :trough + 1].argmax() for row, trough in enumerate(troughs)], dtype=np.int64)
+    return deepest, starts, troughs
+
+
+def _dates(timestamps):
+    return [str(d) for d in timestamps.astype('datetime64[s]').astype('datetime64[D]')]
+
+
+def fixed_window(symbols, timestamps, prices, calculations, interval='DAILY', ohlc='close'):
+    """ the CALCULATIONS over aligned prices (see align / select_range), in the endpoint's layout """
+    returns = returns_of(prices)
+
+    def per_symbol(values):
+        return dict(zip(symbols, values))
+
+    results = {}
+    for name, options in parse_calculations(calculations):
+        annualize = periods_per_year(interval) if options.get('annualized') else 1
+        if name == 'MIN':
+            value = per_symbol(returns.min(axis=1))
+        elif name == 'MAX':
+            value = per_symbol(returns.max(axis=1))
+        elif name == 'MEAN':
+            value = per_symbol(returns.mean(axis=1))
+        elif name == 'MEDIAN':
+            value = per_symbol(np.median(returns, axis=1))
+        elif name == 'CUMULATIVE_RETURN':
+            value = per_symbol(prices[:, -1] / prices[:, 0] - 1.0)
+        elif name == 'VARIANCE':
+            value = per_symbol(returns.var(axis=1) * annualize)
+        elif name == 'STDDEV':
+            value = per_symbol(returns.std(axis=1) * np.sqrt(annualize))
+        elif name == 'MAX_DRAWDOWN':
+            deepest, starts, troughs = max_drawdown(prices)
+            dates = _dates(timestamps)
+            value = {symbol: {'max_drawdown': deepest[row],
+                              'drawdown_range': {'start_drawdown': dates[starts[row]],
+                                                 'end_drawdown': dates[troughs[row]]}}
+                     for row, symbol in enumerate(symbols)}
+        elif name == 'HISTOGRAM':
+            value = {}
+            for row, symbol in enumerate(symbols):
+                counts, edges = np.histogram(returns[row], options.get('bins', 10))
+                value[symbol] = {'bin_count': counts, 'bin_edges': edges}
+        elif name == 'AUTOCORRELATION':
+            value = per_symbol(autocorrelation(returns, options.get('lag', 1)))
+        elif name == 'COVARIANCE':
+            value = {'index': symbols, 'covariance': covariance(returns) * annualize}
+        elif name == 'CORRELATION':
+            value = {'index': symbols, 'correlation': correlation(returns, options.get('method', 'PEARSON'))}
+        else:
+            raise ValueError(f"Unknown calculation: {name}")
+        results[_label(name, options)] = value
+    dates = _dates(timestamps) or [None]
+    meta = {'symbols': ','.join(symbols), 'min_dt': dates[0], 'max_dt': dates[-1],
+            'ohlc': unprefixed(ohlc, '&OHLC=').lower(), 'interval': unprefixed(interval, '&INTERVAL=').upper()}
+    return {'meta_data': meta, 'payload': {'RETURNS_CALCULATIONS': results}}
+
+
+def _window_sums(matrix, window):
+    """ sum of every window of columns, from one running sum: O(n) per row """
+    total = np.cumsum(matrix, axis=-1)
+    sums = total[..., window - 1:].copy()
+    sums[..., 1:] -= total[..., :-window]
+    return sums
+
+
+def rolling_mean(returns, window):
+    return _window_sums(returns, window) / window
+
+
+def rolling_variance(returns, window):
+    """ population variance of every window, from running sums of x and x**2.
+    Rows are centered first so the two sums do not cancel out """
+    centered = returns - returns.mean(axis=-1, keepdims=True)
+    mean = _window_sums(centered, window) / window
+    return np.maximum(_window_sums(centered * centered, window) / window - mean * mean, 0.0)
+
+
+def rolling_covariance(returns, window):
+    """ windows x symbols x symbols population covariance, from running sums of
+    every pairwise product: O(symbols² x T) time. The products and their running
+    sums are symbols x symbols x T float64 arrays held at once, about
+    3 x 8 x symbols² x T bytes at the peak (100 symbols over 10 years of days:
+    600 MB); the result is windows x symbols² itself """
+    centered = returns - returns.mean(axis=1, keepdims=True)
+    means = _window_sums(centered, window) / window
+    products = _window_sums(centered[:, None, :] * centered[None, :, :], window) / window
+    return np.moveaxis(products - means[:, None, :] * means[None, :, :], -1, 0)
+
+
+def rolling_correlation(returns, window, method='PEARSON'):
+    """ windows x symbols x symbols correlation. Pearson comes from the running
+    covariance (see its memory bound). The rank methods are not incremental:
+    one entering observation can shift every rank in the window, so each
+    window is ranked and correlated again, O(windows x cost of correlation()
+    on window columns) """
+    method = str(method).upper()
+    if method == 'PEARSON':
+        covariances = rolling_covariance(returns, window)
+        scale = np.sqrt(np.diagonal(covariances, axis1=1, axis2=2))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return covariances / (scale[:, :, None] * scale[:, None, :])
+    windows = returns.shape[1] - window + 1
+    return np.array([correlation(returns[:, i:i + window], method) for i in range(windows)])
+
+
+def rolling_median(returns, window):
+    """ median of every window, keeping each window sorted: one bisect insertion
+    and one removal per step instead of sorting every window. The searches are
+    O(log window) but the list shifts under them are O(window) memmoves, so a
+    row costs O(T x window) element moves in C plus O(T) Python steps; for the
+    window sizes the endpoint takes that beats heaps with lazy deletion, whose
+    O(log window) steps all run in Python """
+    out = np.empty((len(returns), returns.shape[1] - window + 1))
+    middle = window // 2
+    for row, values in enumerate(returns.tolist()):
+        ordered = sorted(values[:window])
+        for i in range(out.shape[1]):
+            if i:
+                del ordered[bisect.bisect_left(ordered, values[i - 1])]
+                bisect.insort(ordered, values[i + window - 1])
+            out[row, i] = ordered[middle] if window % 2 else (ordered[middle - 1] + ordered[middle]) / 2.0
+    return out
+
+
+def sliding_window(symbols, timestamps, prices, calculations, window_size=20, interval='DAILY', ohlc='close'):
+    """
+    The running CALCULATIONS over aligned prices, each window holding
+    window_size returns. Every result is aligned with meta_data['dates'], the
+    date each window ends on: {symbol: array} per symbol, and windows x symbols
+    x symbols arrays for COVARIANCE / CORRELATION.
+    """
+    window = int(unprefixed(window_size, '&WINDOW_SIZE='))
+    returns = returns_of(prices)
+    if not 1 < window <= returns.shape[1]:
+        raise ValueError(f"window_size must be between 2 and the {returns.shape[1]} returns in range")
+
+    def per_symbol(values):
+        return dict(zip(symbols, values))
+
+    results = {}
+    for name, options in parse_calculations(calculations):
+        annualize = periods_per_year(interval) if options.get('annualized') else 1
+        if name == 'MEAN':
+            value = per_symbol(rolling_mean(returns, window))
+        elif name == 'MEDIAN':
+            value = per_symbol(rolling_median(returns, window))
+        elif name == 'CUMULATIVE_RETURN':
+            value = per_symbol(prices[:, window:] / prices[:, :-window] - 1.0)
+        elif name == 'VARIANCE':
+            value = per_symbol(rolling_variance(returns, window) * annualize)
+        elif name == 'STDDEV':
+            value = per_symbol(np.sqrt(rolling_variance(returns, window) * annualize))
+        elif name == 'COVARIANCE':
+            value = {'index': symbols, 'covariance': rolling_covariance(returns, window) * annualize}
+        elif name == 'CORRELATION':
+            value = {'index': symbols,
+                     'correlation': rolling_correlation(returns, window, options.get('method', 'PEARSON'))}
+        else:
+            raise ValueError(f"Unknown running calculation: {name}")
+        results[f'RUNNING_{_label(name, options)}'] = value
+    dates = _dates(timestamps[window:])
+    meta = {'symbols': ','.join(symbols), 'min_dt': dates[0], 'max_dt': dates[-1],
+            'ohlc': unprefixed(ohlc, '&OHLC=').lower(), 'interval': unprefixed(interval, '&INTERVAL=').upper(),
+            'window_size': window, 'dates': dates}
+    return {'meta_data': meta, 'payload': {'RETURNS_CALCULATIONS': results}}
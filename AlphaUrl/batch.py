@@ -0,0 +1,25 @@
+import collections
+
+
+class FetchResult(collections.namedtuple('FetchResult', 'params value error')):
+    """ outcome of one fetch_many item: value on success, the exception otherwise """
+    __slots__ = ()
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+def call_args(params):
+    """ (args, kwargs) of a fetch_many item: a dict of keyword arguments, a
+    tuple of positional arguments or a single first argument such as a ticker """
+    if isinstance(params, dict):
+        return (), params
+    if isinstance(params, tuple):
+        return params, {}
+    return (params,), {}
+
+
+def split_results(results):
+    """ (successes, failures) of a fetch_many result list """
+    return [r for r in results if r.ok], [r for r in results if not r.ok]
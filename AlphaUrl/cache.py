@@ -0,0 +1,262 @@
+"""
+Response caches shared by Alpha_url and AsyncAlpha_url.
+
+Responses are keyed on the normalized request (host, path and sorted query
+parameters without apikey), so the same call made by any job, any client or
+after a restart is served from disk. Each entry expires according to the
+family of its endpoint (see CACHE_TTLS) and the file is kept under max_bytes
+by evicting the least recently used entries.
+
+    av = Alpha_url(api_key, cache_dir='~/.cache/alphaurl')
+
+MemoryCache is the process-local counterpart, an LRU bounded by body bytes
+that sits in front of the disk cache. SingleFlight collapses concurrent
+identical requests into one network call.
+"""
+import collections
+import os
+import threading
+import time
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+from .endpoints import ENDPOINTS
+from .retry import api_message
+
+MINUTE = 60
+DAY = 24 * 60 * MINUTE
+WEEK = 7 * DAY
+
+# seconds an entry of each family stays fresh
+CACHE_TTLS = {
+    'realtime': MINUTE,
+    'intraday': 5 * MINUTE,
+    'daily': DAY,
+    'macro': 2 * WEEK,
+    'fundamentals': 2 * WEEK,
+    'static': 52 * WEEK,
+}
+
+# functions the endpoint table (AlphaUrl.endpoints) does not cover
+FUNCTION_FAMILIES = {
+    'GLOBAL_QUOTE': 'realtime',
+}
+FUNCTION_FAMILIES.update({e.function: e.cache for e in ENDPOINTS.values() if e.cache})
+
+
+def cache_family(function, params):
+    """ TTL family of a request: fixed per function, otherwise (technical
+    indicators, macro and commodity series sampled daily) from its interval.
+    Slices of a month that is already over never change again """
+    month = params.get('month')
+    if month and month < time.strftime('%Y-%m', time.gmtime()):
+        return 'static'
+    interval = params.get('interval', '').lower()
+    family = FUNCTION_FAMILIES.get(function)
+    if family == 'macro' and interval in ('daily', 'weekly'):
+        return 'daily'
+    if family == 'daily' and function == 'HISTORICAL_OPTIONS' and params.get('date'):
+        return 'static'
+    if family:
+        return family
+    if interval.endswith('min'):
+        return 'intraday'
+    return 'daily'
+
+
+def query_items(params):
+    """ (name, value) pairs of request params given as a dict or as pairs (repeated names) """
+    if not params:
+        return []
+    return list(params.items() if isinstance(params, dict) else params)
+
+
+def request_key(url, params=None):
+    """ (cache key, TTL family) of a request; apikey is never part of the key """
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k.lower() != 'apikey']
+    query += [(k, str(v)) for k, v in query_items(params) if v is not None and k.lower() != 'apikey']
+    query.sort()
+    args = {k.lower(): v for k, v in query}
+    function = args.get('function') or parts.path.rsplit('/', 1)[-1].upper()
+    key = f'{parts.netloc}{parts.path}?{urlencode(query)}'
+    return key, cache_family(function, args)
+
+
+class DiskCache:
+    def __init__(self, path, max_bytes=512 * 1024 * 1024, ttls=None):
+        """
+        path:      directory holding the cache database (created if missing).
+        max_bytes: total body size kept on disk before least recently used
+                   entries are evicted.
+        ttls:      overrides for CACHE_TTLS, e.g. {'daily': 6 * 3600}.
+        """
+        import sqlite3
+
+        path = os.path.expanduser(path)
+        os.makedirs(path, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.ttls = dict(CACHE_TTLS, **(ttls or {}))
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(os.path.join(path, 'responses.sqlite'), timeout=30, check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        # INSERT OR REPLACE fires the delete trigger of the row it replaces
+        self._db.execute('PRAGMA recursive_triggers=ON')
+        self._db.execute('BEGIN IMMEDIATE')
+        self._db.execute('CREATE TABLE IF NOT EXISTS responses ('
+                         'key TEXT PRIMARY KEY, expires REAL, accessed REAL, size INTEGER, '
+                         'status INTEGER, content_type TEXT, content BLOB)')
+        self._db.execute('CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)')
+        # total body size, kept by every process writing to the file
+        self._db.execute('CREATE TABLE IF NOT EXISTS totals (id INTEGER PRIMARY KEY CHECK (id = 0), size INTEGER)')
+        self._db.execute('INSERT OR IGNORE INTO totals SELECT 0, COALESCE(SUM(size), 0) FROM responses')
+        self._db.execute('CREATE TRIGGER IF NOT EXISTS responses_insert AFTER INSERT ON responses '
+                         'BEGIN UPDATE totals SET size = size + NEW.size; END')
+        self._db.execute('CREATE TRIGGER IF NOT EXISTS responses_delete AFTER DELETE ON responses '
+                         'BEGIN UPDATE totals SET size = size - OLD.size; END')
+        self._db.commit()
+
+    def _total_size(self):
+        return self._db.execute('SELECT size FROM totals').fetchone()[0]
+
+    def get(self, key):
+        """ (status_code, content, headers) of a fresh entry, or None """
+        now = time.time()
+        with self._lock:
+            row = self._db.execute('SELECT expires, status, content_type, content FROM responses WHERE key = ?',
+                                   (key,)).fetchone()
+            if row is None:
+                return None
+            expires, status, content_type, content = row
+            if expires < now:
+                self._db.execute('DELETE FROM responses WHERE key = ?', (key,))
+                self._db.commit()
+                return None
+            self._db.execute('UPDATE responses SET accessed = ? WHERE key = ?', (now, key))
+            self._db.commit()
+        return status, content, {'Content-Type': content_type} if content_type else {}
+
+    def set(self, key, family, status_code, content, headers):
+        if status_code != 200 or api_message(content) is not None:
+            return
+        now = time.time()
+        with self._lock:
+            self._db.execute('BEGIN IMMEDIATE')
+            try:
+                self._db.execute('INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)',
+                                 (key, now + self.ttls[family], now, len(content), status_code,
+                                  headers.get('Content-Type'), content))
+                # read in the write transaction, so it counts what other processes wrote
+                if self._total_size() > self.max_bytes:
+                    self._evict(now)
+                self._db.commit()
+            except BaseException:
+                self._db.rollback()
+                raise
+
+    def _evict(self, now):
+        """ drop expired entries, then least recently used ones down to 90% of
+        max_bytes; runs inside the transaction of set() """
+        self._db.execute('DELETE FROM responses WHERE expires < ?', (now,))
+        size = self._total_size()
+        target = self.max_bytes * 0.9
+        rows = self._db.execute('SELECT key, size FROM responses ORDER BY accessed').fetchall()
+        doomed = []
+        for key, row_size in rows:
+            if size <= target:
+                break
+            doomed.append((key,))
+            size -= row_size
+        self._db.executemany('DELETE FROM responses WHERE key = ?', doomed)
+
+    def clear(self):
+        with self._lock:
+            self._db.execute('DELETE FROM responses')
+            self._db.commit()
+
+    def close(self):
+        self._db.close()
+
+
+class MemoryCache:
+    def __init__(self, max_bytes=64 * 1024 * 1024, ttls=None):
+        """
+        max_bytes: total body size kept in memory; least recently used entries
+                   are dropped first.
+        ttls:      overrides for CACHE_TTLS, as for DiskCache.
+        """
+        self.max_bytes = max_bytes
+        self.ttls = dict(CACHE_TTLS, **(ttls or {}))
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()  # key -> (expires, status, content, headers)
+        self._size = 0
+
+    def get(self, key):
+        """ (status_code, content, headers) of a fresh entry, or None """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                self._size -= len(entry[2])
+                return None
+            self._entries.move_to_end(key)
+            return entry[1:]
+
+    def set(self, key, family, status_code, content, headers):
+        if status_code != 200 or len(content) > self.max_bytes or api_message(content) is not None:
+            return
+        entry = (time.monotonic() + self.ttls[family], status_code, content, dict(headers))
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old[2])
+            self._entries[key] = entry
+            self._size += len(content)
+            while self._size > self.max_bytes:
+                _, dropped = self._entries.popitem(last=False)
+                self._size -= len(dropped[2])
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Runs fn once per key at a time: threads asking for a key that is already
+    being fetched wait for that fetch and share its result (or exception).
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights = {}
+
+    def do(self, key, fn):
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+        try:
+            flight.result = fn()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result
@@ -0,0 +1,528 @@
+import codecs
+import csv
+import os
+import itertools
+import threading
+import time
+
+from .batch import FetchResult, call_args
+from .endpoints import ENDPOINTS, FAMILIES, LazyEndpoints, install
+from .cache import DiskCache, MemoryCache, SingleFlight, request_key
+from .errors import AlphaVantageError
+from .limits import RateLimiter
+from .retry import RetryPolicy, response_error, retry_exceptions
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = (5, 60)  # (connect, read) seconds
+BULK_QUOTE_LIMIT = 100  # symbols per REALTIME_BULK_QUOTES call
+STREAM_CHUNK_SIZE = 64 * 1024
+PRICE_METHODS = {'daily': 'get_daily_data', 'weekly': 'get_weekly_data', 'monthly': 'get_monthly_data'}
+
+
+def _build_response(url, status_code, content, headers=None):
+    """ requests.Response around an already downloaded body, so endpoint methods
+    can parse it (text / json() / raise_for_status) exactly like a live one """
+    import http.client
+    import requests
+    from requests.structures import CaseInsensitiveDict
+
+    response = requests.Response()
+    response.url = url
+    response.status_code = status_code
+    response.reason = http.client.responses.get(status_code, '')
+    response._content = content
+    response.headers = CaseInsensitiveDict(headers or {})
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    return response
+
+
+def _bulk_quote_chunks(tickers):
+    """ de-duplicated tickers split into REALTIME_BULK_QUOTES sized lists """
+    if isinstance(tickers, str):
+        tickers = [tickers]
+
+    # Validate input
+    if not tickers or not isinstance(tickers, (list, tuple)):
+        raise ValueError("Tickers must be a non-empty string or list of strings.")
+
+    tickers = list(dict.fromkeys(tickers))
+    return [tickers[i:i + BULK_QUOTE_LIMIT] for i in range(0, len(tickers), BULK_QUOTE_LIMIT)]
+
+
+def _merge_bulk_quotes(chunks, payloads):
+    """ {symbol: quote} from the 'data' lists of several REALTIME_BULK_QUOTES responses,
+    in the order the tickers were asked for (symbols the API spells differently last) """
+    quotes = {}
+    for payload in payloads:
+        for quote in payload.get('data', []):
+            quotes[quote['symbol']] = quote
+    merged = {ticker: quotes.pop(ticker) for chunk in chunks for ticker in chunk if ticker in quotes}
+    merged.update(quotes)
+    return merged
+
+
+def _peek_error(response, chunks):
+    """ response_error() for a streamed response. A JSON notice in place of CSV is
+    small, so it is read whole; otherwise returns the first chunk, unconsumed
+    chunks follow in the iterator. Returns (error, head) """
+    head = next(chunks, b'')
+    if response.status_code != 200 or head[:1] != b'{':
+        return None, head
+    return response_error(response.status_code, head + b''.join(chunks)), head
+
+
+def _iter_lines(chunks, encoding):
+    """ decoded text lines of a stream of byte chunks, line ends kept so the csv
+    reader sees newlines inside quoted fields """
+    pending = ''
+    for text in codecs.iterdecode(chunks, encoding):
+        lines = (pending + text).split('\n')
+        pending = lines.pop()
+        yield from (line + '\n' for line in lines)
+    if pending:
+        yield pending
+
+
+def _open_store(store_dir):
+    if not store_dir:
+        return None
+    from .store import SeriesStore
+
+    return SeriesStore(store_dir)
+
+
+class Alpha_url(metaclass=LazyEndpoints):
+    def __init__(self,api_key=None, pool_size=DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT, session=None,
+                 calls_per_minute=None, calls_per_day=None, limiter=None, cache_dir=None, cache=None,
+                 memory_cache_bytes=None, retry=None, store_dir=None, store=None):
+        """
+        pool_size: number of keep-alive connections kept open per host
+                   (www.alphavantage.co and alphavantageapi.co each get their own pool).
+                   Threads beyond pool_size wait for a free connection instead of
+                   opening throwaway ones.
+        timeout:   default timeout for every request, seconds or (connect, read) tuple.
+        session:   optional pre-configured requests.Session to share between clients
+                   (default: one is built, and requests imported, on the first request).
+        calls_per_minute / calls_per_day:
+                   quota of your API key; requests wait for budget before they are
+                   sent instead of burning calls on throttle responses (None = unlimited).
+        limiter:   optional RateLimiter to share one quota between several clients.
+        cache_dir: directory of a persistent response cache (see AlphaUrl.cache);
+                   repeated calls are served from disk until their TTL expires.
+        cache:     optional DiskCache instance, instead of cache_dir.
+        memory_cache_bytes:
+                   size of an in-process LRU cache in front of the disk cache
+                   (None = disabled). Concurrent identical requests are always
+                   coalesced into a single call whose result every caller gets.
+        retry:     RetryPolicy for throttle bodies, connection errors and 429/5xx
+                   answers (default: 5 retries with exponential backoff and jitter).
+                   Error bodies raise AlphaVantageError subclasses instead of
+                   being returned as data.
+        store_dir: directory of a local columnar store (see AlphaUrl.store) that
+                   store_series() merges fetched series into. Requires numpy.
+        store:     optional SeriesStore instance, instead of store_dir.
+        """
+        self.api_key = api_key or os.getenv("ALPHA_API_KEY")
+        self.base_url = 'https://www.alphavantage.co/query?function='
+        self.analytics_url = 'https://alphavantageapi.co/timeseries/'
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self._session = session
+        self._session_lock = threading.Lock()
+        self.limiter = limiter or RateLimiter(calls_per_minute, calls_per_day)
+        self.cache = cache or (DiskCache(cache_dir) if cache_dir else None)
+        self.memory_cache = MemoryCache(memory_cache_bytes) if memory_cache_bytes else None
+        self._inflight = SingleFlight()
+        self.retry = retry or RetryPolicy()
+        self.store = store or _open_store(store_dir)
+
+    def __getattr__(self, name):
+        """ endpoint methods are generated a family at a time on first access, see AlphaUrl.endpoints """
+        endpoint = ENDPOINTS.get(name)
+        if endpoint is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        type(self).load_endpoints(endpoint.family)
+        return getattr(self, name)
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | ENDPOINTS.keys())
+
+    @classmethod
+    def load_endpoints(cls, *families):
+        """ generate the endpoint methods of families (default: all) now rather than
+        on first access, e.g. so that help(Alpha_url) lists them """
+        for family in families or FAMILIES:
+            install(cls, family, _endpoint_method)
+
+    @property
+    def session(self):
+        """ the requests.Session, built on first use """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._build_session(self.pool_size)
+        return self._session
+
+    @session.setter
+    def session(self, session):
+        self._session = session
+
+    @staticmethod
+    def _build_session(pool_size):
+        """ requests.Session with a connection pool sized for concurrent use """
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=pool_size, pool_block=True)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def _get(self, url, params=None):
+        """ single transport entry point shared by every endpoint method """
+        key, family = request_key(url, params)
+        if self.memory_cache is not None:
+            hit = self.memory_cache.get(key)
+            if hit is not None:
+                return _build_response(url, *hit)
+        status_code, content, headers = self._inflight.do(key, lambda: self._fetch(url, params, key, family))
+        return _build_response(url, status_code, content, headers)
+
+    def _fetch(self, url, params, key, family):
+        """ disk cache, then quota and network; returns (status_code, content, headers) """
+        hit = self.cache.get(key) if self.cache is not None else None
+        if hit is None:
+            hit = self._send(url, params)
+            if self.cache is not None:
+                self.cache.set(key, family, *hit)
+        if self.memory_cache is not None:
+            self.memory_cache.set(key, family, *hit)
+        return hit
+
+    def _send(self, url, params, stream=False):
+        """ one request under the rate limiter and retry policy. Returns (status_code,
+        content, headers), or (response, body chunks) when streaming; throttle and
+        error bodies raise """
+        attempt = 0
+        while True:
+            delay = self.limiter.reserve()
+            if delay > 0:
+                time.sleep(delay)
+            try:
+                response = self.session.get(url, params=params, timeout=self.timeout, stream=stream)
+            except retry_exceptions() as e:
+                if not self.retry.should_retry(attempt, error=e):
+                    raise
+            else:
+                if stream:
+                    chunks = response.iter_content(STREAM_CHUNK_SIZE)
+                    error, head = _peek_error(response, chunks)
+                    body = itertools.chain([head], chunks)
+                else:
+                    error = response_error(response.status_code, response.content)
+                if error is None and not self.retry.should_retry(attempt, response.status_code):
+                    if stream:
+                        return response, body
+                    return response.status_code, response.content, response.headers
+                response.close()
+                if error is not None and not self.retry.should_retry(attempt, error=error):
+                    raise error
+            time.sleep(self.retry.delay(attempt))
+            attempt += 1
+
+    def _call(self, method, *args, **kwargs):
+        """
+        The one request path of every endpoint in AlphaUrl.endpoints: the query
+        is built from the table entry, sent through _get (caches, coalescing,
+        quota, retries) and the body parsed into the entry's output shape.
+        """
+        endpoint = ENDPOINTS[method]
+        url, query = endpoint.request(self, *args, **kwargs)
+        response = self._get(url, query)
+        response.raise_for_status()
+        return endpoint.parse(response, query)
+
+    def remaining_quota(self):
+        """ calls that can be sent right now, e.g. {'minute': 70, 'day': 24800} """
+        return self.limiter.remaining()
+
+    def fetch_many(self, method, params_list, max_workers=None):
+        """
+        Call one endpoint method for many parameter sets in parallel.
+
+            results = av.fetch_many('get_daily_adjusted_data', tickers)
+            failed = [r.params for r in results if not r.ok]
+
+        method:      method name or bound method of this client.
+        params_list: each item is a dict of keyword arguments, a tuple of
+                     positional arguments or a single first argument (a ticker).
+        max_workers: threads dispatching calls (default: pool_size). The rate
+                     limiter still decides how fast calls actually go out.
+
+        Returns a list of FetchResult(params, value, error) in input order; an
+        item that raises carries its exception and the batch carries on.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        if isinstance(method, str):
+            method = getattr(self, method)
+
+        def run(params):
+            args, kwargs = call_args(params)
+            try:
+                return FetchResult(params, method(*args, **kwargs), None)
+            except Exception as e:
+                return FetchResult(params, None, e)
+
+        with ThreadPoolExecutor(max_workers or self.pool_size) as pool:
+            return list(pool.map(run, params_list))
+
+    def as_series(self, method, *args, **kwargs):
+        """
+        Call a time series endpoint method and return its payload as a columnar
+        TimeSeries (int64 epoch timestamps, float64 open/high/low/close/volume...).
+
+            ts = av.as_series('get_daily_adjusted_data', 'IBM')
+            ts.between('2020-01-01', '2020-12-31').close
+
+        Works for get_*_data, fx_*, crypto_intraday, digital_currency_* and the
+        commodity / economic methods. Requires numpy (see AlphaUrl.series).
+        """
+        from .series import TimeSeries
+
+        payload = getattr(self, method)(*args, **kwargs)
+        if payload is None:
+            raise AlphaVantageError(f"{method} returned no data")
+        return TimeSeries.parse(payload)
+
+    def store_series(self, method, *args, **kwargs):
+        """
+        as_series() merged into the local store (store_dir=...); returns the
+        stored series, as memory-mapped columns.
+
+            av.store_series('get_daily_adjusted_data', 'IBM')
+            av.store_series('get_intraday_data', 'IBM', '5min', month='2024-01')
+            av.store.read('IBM', 'intraday_5min')
+
+        Series are stored per symbol under the method name without its get_ /
+        _data affixes plus the interval, see series_name().
+        """
+        if self.store is None:
+            raise AlphaVantageError("No store configured, pass store_dir= to the client")
+        symbol, name = self.series_name(method, *args, **kwargs)
+        self.store.write(symbol, name, self.as_series(method, *args, **kwargs))
+        return self.store.read(symbol, name)
+
+    def refresh_series(self, method, *args, **kwargs):
+        """
+        Bring a stored series up to date with as little transfer as possible.
+
+            av.refresh_series('get_daily_adjusted_data', 'IBM')
+            av.refresh_series('get_intraday_data', 'IBM', '5min')
+
+        For methods taking outputsize (get_daily_data, get_daily_adjusted_data,
+        get_intraday_data): when the last 100 points can cover the gap since the
+        newest stored row, only outputsize='compact' is requested and merged in
+        place. The full history is fetched instead when nothing is stored yet,
+        the gap is longer, or the overlapping rows changed (a split or dividend
+        rewrote adjusted history). Returns the stored series.
+        """
+        import inspect
+        from .store import compact_reaches, needs_full_history
+
+        if self.store is None:
+            raise AlphaVantageError("No store configured, pass store_dir= to the client")
+        if 'outputsize' not in inspect.signature(getattr(self, method)).parameters:
+            raise ValueError(f"{method} has no compact output, use store_series")
+        symbol, name = self.series_name(method, *args, **kwargs)
+        stored = self.store.read(symbol, name)
+        kwargs.pop('outputsize', None)
+        if compact_reaches(stored, self._interval(method, *args, **kwargs)):
+            compact = self.as_series(method, *args, outputsize='compact', **kwargs)
+            if not needs_full_history(stored, compact):
+                self.store.write(symbol, name, compact)
+                return self.store.read(symbol, name)
+        self.store.write(symbol, name, self.as_series(method, *args, outputsize='full', **kwargs))
+        return self.store.read(symbol, name)
+
+    def _interval(self, method, *args, **kwargs):
+        import inspect
+
+        return inspect.signature(getattr(self, method)).bind(*args, **kwargs).arguments.get('interval')
+
+    def price_series(self, ticker, interval='daily', month=None):
+        """
+        OHLCV TimeSeries of a ticker at an indicator interval ('1min' .. '60min',
+        'daily', 'weekly', 'monthly'): the stored copy when the store holds one,
+        otherwise fetched through the caches. The local indicators run on it.
+        """
+        if interval in PRICE_METHODS:
+            method, args, kwargs = PRICE_METHODS[interval], (ticker,), {}
+        else:
+            method, args, kwargs = 'get_intraday_data', (ticker, interval), {'month': month}
+        if self.store is not None and not month:
+            stored = self.store.read(*self.series_name(method, *args))
+            if stored is not None and len(stored):
+                return stored
+        return self.as_series(method, *args, **kwargs)
+
+    @property
+    def local(self):
+        """ technical indicators computed locally from price_series(), see AlphaUrl.local """
+        from .local import LocalIndicators
+
+        return LocalIndicators(self)
+
+    def series_name(self, method, *args, **kwargs):
+        """ (symbol, name) a call is stored under, e.g. ('IBM', 'intraday_5min') or ('EURUSD', 'fx_daily') """
+        import inspect
+
+        bound = inspect.signature(getattr(self, method)).bind(*args, **kwargs)
+        bound.apply_defaults()
+        values = bound.arguments
+        symbol = next((values[p] for p in ('ticker', 'symbol', 'from_symbol') if values.get(p)), method)
+        symbol += next((values[p] for p in ('to_symbol', 'market') if values.get(p)), '')
+        name = method.removeprefix('get_').removesuffix('_data')
+        if values.get('interval'):
+            name += f"_{values['interval']}"
+        return symbol.upper(), name
+
+    def _iter_csv(self, url, params=None):
+        """ stream a CSV body and yield parsed rows (lists) while it downloads.
+        Quota and retries apply; the caches are bypassed since the body is never held whole """
+        response, body = self._send(url, params, stream=True)
+        with response:
+            response.raise_for_status()
+            for row in csv.reader(_iter_lines(body, response.encoding or 'utf-8')):
+                if row:
+                    yield row
+
+    def iter_rows(self, function, **params):
+        """
+        Stream any CSV endpoint and yield one dict per row as the body arrives,
+        so peak memory stays flat however large the response is.
+
+            for bar in av.iter_rows('TIME_SERIES_INTRADAY', symbol='IBM', interval='1min', outputsize='full'):
+                ...
+
+        See also iter_intraday_rows, iter_listing_and_delisting_status and
+        iter_historical_options.
+        """
+        params = dict(params, apikey=self.api_key, datatype='csv')
+        rows = self._iter_csv(f'{self.base_url}{function}', params)
+        try:
+            header = next(rows, None)
+            for row in rows:
+                yield dict(zip(header, row))
+        finally:
+            rows.close()
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def backfill_intraday(self, ticker, interval, start, end, adjusted=True, extended_hours=True, max_workers=None):
+        """
+        Intraday history over any date range, as one continuous TimeSeries.
+
+            ts = av.backfill_intraday('IBM', '1min', '2020-01-01', '2023-12-31')
+
+        The range is split into one get_intraday_data(month=...) call per month;
+        the calls run in parallel under the rate limiter and the slices are
+        stitched, de-duplicated at month boundaries and trimmed to [start, end].
+
+        With a disk cache (cache_dir=...) every month that is already over is
+        kept for good, so re-running after a crash or extending the range only
+        fetches months that were never downloaded. Requires numpy.
+        """
+        from .series import month_range, stitch_months
+
+        months = month_range(start, end)
+        params = [dict(ticker=ticker, interval=interval, adjusted=adjusted, extended_hours=extended_hours,
+                       month=month, outputsize='full', datatype='csv') for month in months]
+        results = self.fetch_many('get_intraday_data', params, max_workers=max_workers)
+        for result in results:
+            if not result.ok:
+                raise result.error
+        return stitch_months([result.value for result in results], start, end)
+
+    def iter_intraday_rows(self, ticker, interval, adjusted=True, extended_hours=True, month=None, outputsize='full'):
+        """ streaming form of get_intraday_data, one dict per bar (newest first) """
+        return self.iter_rows('TIME_SERIES_INTRADAY', symbol=ticker, interval=interval,
+                              adjusted='true' if adjusted else 'false',
+                              extended_hours='true' if extended_hours else 'false',
+                              month=month, outputsize=outputsize)
+
+    def realtime_bulk_quotes(self,tickers, max_workers=None):
+        """ live price for any number of tickers, returned as {symbol: quote}
+
+        The endpoint takes at most 100 symbols per call, so longer lists are split
+        into 100-symbol requests that are sent concurrently (under the rate limiter)
+        and merged.
+        """
+        chunks = _bulk_quote_chunks(tickers)
+        results = self.fetch_many(self._bulk_quotes_chunk, chunks, max_workers=max_workers)
+        for result in results:
+            if not result.ok:
+                raise result.error
+        return _merge_bulk_quotes(chunks, (result.value for result in results))
+
+    def options_history(self, ticker, start, end, max_workers=None):
+        """
+        Option chains of a ticker on every trading day from start to end, as one
+        columnar OptionChain (see AlphaUrl.options).
+
+            chain = av.options_history('IBM', '2015-01-01', '2024-12-31')
+            chain.on('2024-06-14')['delta']
+
+        One historical_options call per weekday, sent in parallel under the rate
+        limiter; each day is parsed into compact columns as it arrives. A
+        holiday answered with the previous session is kept once.
+
+        With a disk cache (cache_dir=...) every past day is kept for good, so
+        extending the range or re-running after a crash only fetches the days
+        that were never downloaded. Requires numpy.
+        """
+        from .options import OptionChain, trading_days
+
+        def day_chain(day):
+            return OptionChain.from_csv(self._historical_options_csv(ticker, day))
+
+        results = self.fetch_many(day_chain, trading_days(start, end), max_workers=max_workers)
+        for result in results:
+            if not result.ok:
+                raise result.error
+        return OptionChain.concat(result.value for result in results)
+
+    def option_chain(self, ticker):
+        """
+        Current option chain of a ticker (one realtime_options call), parsed
+        column-wise and indexed for repeated queries (see AlphaUrl.options).
+
+            chain = av.option_chain('IBM')
+            chain.select(dte=(30, 45), type='put', delta=(-0.4, -0.2))
+        """
+        from .options import IndexedChain, OptionChain
+
+        return IndexedChain(OptionChain.from_csv(self._realtime_options_csv(ticker)))
+
+    def iter_historical_options(self, ticker, date=None):
+        """ streaming form of historical_options, one dict per contract """
+        return self.iter_rows('HISTORICAL_OPTIONS', symbol=ticker, date=date)
+
+    def iter_listing_and_delisting_status(self, date=None, state=None):
+        """ streaming form of listing_and_delisting_status, one dict per symbol """
+        return self.iter_rows('LISTING_STATUS', date=date, state=state)
+
+
+def _endpoint_method(endpoint):
+    def method(self, *args, **kwargs):
+        return self._call(endpoint.method, *args, **kwargs)
+    return endpoint.bind(method, Alpha_url)
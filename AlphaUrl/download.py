@@ -0,0 +1,353 @@
+"""
+Resumable bulk downloads from the command line.
+
+    python -m AlphaUrl.download tickers.txt get_daily_adjusted_data company_overview \\
+        --out data/ --calls-per-minute 75
+    python -m AlphaUrl.download listing.csv get_intraday_data:interval=5min,month=2024-01 \\
+        --store store/ --calls-per-minute 150 --calls-per-day 20000
+
+The universe file holds one symbol per line ('#' comments allowed) or is a CSV
+with a symbol column, such as the listing_and_delisting_status output. Every
+endpoint spec, a method name with optional name=value arguments, is called
+once per symbol (the symbol is its first argument) through one Alpha_url, so
+the calls run in parallel under the quota, retries and caches of the client.
+
+Results go to --out as one file per call, <out>/<spec>/<SYMBOL>.csv or .json,
+or, for CSV series with --store, into the local columnar store (see
+AlphaUrl.store). Files are written to a temporary name and renamed, and each
+finished call is then appended to the checkpoint journal and flushed to disk,
+so after a crash, Ctrl-C or a spent daily quota the same command only makes
+the calls that never completed. Failed calls are retried by the next run.
+
+Live progress (calls done, calls/min, MB/s and ETA) goes to stderr.
+"""
+import argparse
+import collections
+import csv
+import json
+import os
+import sys
+import time
+
+from .client import Alpha_url
+from .endpoints import ENDPOINTS, TABLE
+from .errors import QuotaExceededError
+
+JOURNAL = 'download.journal'
+REPORT_EVERY = 0.5  # seconds between progress lines on a terminal, 10x that otherwise
+
+Task = collections.namedtuple('Task', 'key method symbol kwargs')
+DownloadReport = collections.namedtuple('DownloadReport', 'done skipped failed remaining quota_spent')
+
+
+def read_universe(path):
+    """ symbols of a universe file, de-duplicated, in file order """
+    with open(path, newline='') as f:
+        lines = [line.strip() for line in f if line.strip() and not line.lstrip().startswith('#')]
+    if lines and ',' in lines[0]:
+        rows = csv.DictReader(lines)
+        column = next((name for name in rows.fieldnames if name.strip().lower() in ('symbol', 'ticker')), None)
+        if column is None:
+            raise ValueError(f"{path} has no symbol column")
+        lines = [row[column].strip() for row in rows if row[column]]
+    return list(dict.fromkeys(symbol.upper() for symbol in lines))
+
+
+def parse_spec(text):
+    """ 'get_intraday_data:interval=5min,month=2024-01' -> ('get_intraday_data', {'interval': '5min', ...}) """
+    method, _, arguments = text.partition(':')
+    kwargs = {}
+    for argument in filter(None, arguments.split(',')):
+        name, sep, value = argument.partition('=')
+        if not sep:
+            raise ValueError(f"Argument {argument!r} of {text!r} is not name=value")
+        kwargs[name.strip()] = value.strip()
+    return method.strip(), kwargs
+
+
+def spec_label(method, kwargs):
+    """ directory name of a spec's files, e.g. get_intraday_data-interval=5min-month=2024-01 """
+    return '-'.join([method] + [f'{name}={value}' for name, value in kwargs.items()])
+
+
+def is_series(method, kwargs):
+    """ whether a spec answers a CSV table, which TimeSeries (and so the store) can hold """
+    endpoint = ENDPOINTS.get(method)
+    if endpoint is None or endpoint.output != TABLE:
+        return False
+    return str(kwargs.get('datatype', dict(endpoint.params).get('datatype'))).endswith('csv')
+
+
+def _write_file(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f'{path}.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+class Journal:
+    def __init__(self, path):
+        """
+        Append-only checkpoint journal, one JSON line per finished call.
+
+        path: journal file, created if missing. A torn last line (crash while
+              writing it) is ignored.
+        """
+        self.path = path
+        self.done = set()
+        if os.path.exists(path):
+            with open(path) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if entry.get('ok'):
+                        self.done.add(entry['key'])
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, 'a')
+        if self._file.tell():
+            with open(path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    self._file.write('\n')  # end a torn line so the next entry starts its own
+
+    def record(self, key, ok, size=0, error=None):
+        """ append the outcome of a call and flush it to disk """
+        entry = {'key': key, 'ok': ok, 'bytes': size, 'at': round(time.time(), 3)}
+        if error is not None:
+            entry['error'] = f'{type(error).__name__}: {error}'
+        self._file.write(json.dumps(entry) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        if ok:
+            self.done.add(key)
+
+    def close(self):
+        self._file.close()
+
+
+class Throughput:
+    def __init__(self, total, skipped=0):
+        """
+        Running totals of a download.
+
+        total:   calls of the whole job.
+        skipped: calls already completed by earlier runs.
+        """
+        self.total = total
+        self.skipped = skipped
+        self.calls = 0
+        self.failed = 0
+        self.bytes = 0
+        self.started = time.monotonic()
+
+    def add(self, size=0, ok=True):
+        self.calls += 1
+        self.bytes += size
+        self.failed += not ok
+
+    def line(self):
+        """ e.g. '1234/10000 calls  74.8 calls/min  0.41 MB/s  ETA 01:57:02  2 failed' """
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        rate = self.calls / elapsed
+        left = self.total - self.skipped - self.calls
+        eta = time.strftime('%H:%M:%S', time.gmtime(left / rate)) if rate and left else '--:--:--'
+        if rate and left / rate >= 86400:
+            eta = f'{left / rate / 86400:.1f} days'
+        text = (f'{self.skipped + self.calls}/{self.total} calls  {rate * 60:.1f} calls/min  '
+                f'{self.bytes / elapsed / 1e6:.2f} MB/s  ETA {eta}')
+        return text + (f'  {self.failed} failed' if self.failed else '')
+
+
+class BulkDownload:
+    def __init__(self, client, symbols, specs, out_dir=None, journal=None, max_workers=None):
+        """
+        client:      Alpha_url the calls go through (its store_dir receives series).
+        symbols:     symbols every spec is called for.
+        specs:       (method, {arguments}) pairs, see parse_spec().
+        out_dir:     directory of the per call files; needed for every spec the
+                     client's store cannot take.
+        journal:     checkpoint journal path (default: download.journal in
+                     out_dir, or in the store directory).
+        max_workers: threads dispatching calls (default: the client's pool_size).
+        """
+        self.client = client
+        self.out_dir = out_dir
+        self.max_workers = max_workers or client.pool_size
+        self.throughput = None  # Throughput of the current / last run()
+        self.tasks = []
+        for method, kwargs in specs:
+            if not is_series(method, kwargs) or client.store is None:
+                if out_dir is None:
+                    raise ValueError(f"{method} needs out_dir" + (" (not a CSV series)" if client.store else ""))
+            label = spec_label(method, kwargs)
+            self.tasks += [Task(f'{label} {symbol}', method, symbol, kwargs) for symbol in symbols]
+        if journal is None:
+            journal = os.path.join(out_dir if out_dir is not None else client.store.path, JOURNAL)
+        self.journal = Journal(journal)
+
+    def pending(self):
+        """ tasks the journal has no completed record of """
+        return [task for task in self.tasks if task.key not in self.journal.done]
+
+    def _run_task(self, task):
+        """ fetch and write one call; returns the payload size in bytes """
+        payload = getattr(self.client, task.method)(task.symbol, **task.kwargs)
+        if isinstance(payload, str):
+            data = payload.encode('utf-8')
+        else:
+            data = json.dumps(payload).encode('utf-8')
+        if self.client.store is not None and is_series(task.method, task.kwargs):
+            from .series import TimeSeries
+
+            symbol, name = self.client.series_name(task.method, task.symbol, **task.kwargs)
+            self.client.store.write(symbol, name, TimeSeries.parse(payload))
+        else:
+            ext = 'csv' if isinstance(payload, str) else 'json'
+            label = spec_label(task.method, task.kwargs)
+            _write_file(os.path.join(self.out_dir, label, f'{task.symbol}.{ext}'), data)
+        return len(data)
+
+    def run(self, report=None):
+        """
+        Make every pending call, journaling each as it finishes. report, if
+        given, is called with the Throughput after every call. When the daily
+        quota is spent no further call is started and the rest stays pending.
+        Ctrl-C does the same: calls already sent are waited for and journaled
+        (their quota is spent), then KeyboardInterrupt is re-raised. Returns a
+        DownloadReport.
+        """
+        from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+
+        pending = self.pending()
+        throughput = self.throughput = Throughput(len(self.tasks), len(self.tasks) - len(pending))
+        quota_spent = False
+        collected = set()
+        pool = ThreadPoolExecutor(self.max_workers)
+        futures = {pool.submit(self._run_task, task): task for task in pending}
+        try:
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                finished = self._collect(future, futures[future])
+                collected.add(future)
+                if not finished:
+                    # calls already sent still finish and are journaled, the rest stay pending
+                    quota_spent = True
+                    for queued in futures:
+                        queued.cancel()
+                    continue
+                if report is not None:
+                    report(throughput)
+        except KeyboardInterrupt:
+            for queued in futures:
+                queued.cancel()
+            running = [future for future in futures if future not in collected and not future.cancelled()]
+            wait(running)
+            for future in running:
+                self._collect(future, futures[future])
+            raise
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+        return DownloadReport(throughput.calls - throughput.failed, throughput.skipped, throughput.failed,
+                              len(self.pending()), quota_spent)
+
+    def _collect(self, future, task):
+        """ journal a finished call; False when it was refused for the daily quota """
+        try:
+            size = future.result()
+        except QuotaExceededError:
+            return False
+        except Exception as e:
+            self.journal.record(task.key, False, error=e)
+            self.throughput.add(ok=False)
+        else:
+            self.journal.record(task.key, True, size)
+            self.throughput.add(size)
+        return True
+
+    def close(self):
+        self.journal.close()
+
+
+class _Progress:
+    """ report callback that rewrites one stderr line, or prints a line every few seconds when not on a terminal """
+    def __init__(self, stream=sys.stderr):
+        self.stream = stream
+        self.tty = stream.isatty()
+        self.every = REPORT_EVERY if self.tty else REPORT_EVERY * 10
+        self.last = 0.0
+        self.shown = None
+
+    def __call__(self, throughput, final=False):
+        now = time.monotonic()
+        if not final and now - self.last < self.every:
+            return
+        line = throughput.line()
+        if final and line == self.shown and not self.tty:
+            return
+        self.last, self.shown = now, line
+        end = '\n' if final or not self.tty else ''
+        self.stream.write(('\r' if self.tty else '') + line + end)
+        self.stream.flush()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m AlphaUrl.download', description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('universe', help='symbols, one per line, or a CSV with a symbol column')
+    parser.add_argument('specs', nargs='+', metavar='spec', help='method[:name=value,...], e.g. sma:interval=daily')
+    parser.add_argument('--out', help='directory of the per call files')
+    parser.add_argument('--store', help='local store directory for CSV series')
+    parser.add_argument('--journal', help=f'checkpoint journal (default: {JOURNAL} in --out or --store)')
+    parser.add_argument('--api-key', help='Alpha Vantage key (default: $ALPHA_API_KEY)')
+    parser.add_argument('--calls-per-minute', type=int, help='quota per minute of the key')
+    parser.add_argument('--calls-per-day', type=int, help='quota per day of the key')
+    parser.add_argument('--workers', type=int, default=10, help='parallel calls (default: 10)')
+    parser.add_argument('--cache-dir', help='response cache directory, see AlphaUrl.cache')
+    args = parser.parse_args(argv)
+    if not args.out and not args.store:
+        parser.error('pass --out and / or --store')
+
+    try:
+        symbols = read_universe(args.universe)
+        specs = [parse_spec(spec) for spec in args.specs]
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    client = Alpha_url(args.api_key, pool_size=args.workers, calls_per_minute=args.calls_per_minute,
+                       calls_per_day=args.calls_per_day, cache_dir=args.cache_dir, store_dir=args.store)
+    for method, kwargs in specs:
+        if method.startswith('_') or not callable(getattr(client, method, None)):
+            parser.error(f'unknown method {method}')
+        try:
+            client.series_name(method, symbols[0] if symbols else '', **kwargs)
+        except TypeError as e:
+            parser.error(f'{method}: {e}')
+
+    try:
+        job = BulkDownload(client, symbols, specs, args.out, args.journal, args.workers)
+    except ValueError as e:
+        parser.error(str(e))
+    progress = _Progress()
+    with client:
+        try:
+            report = job.run(progress)
+        except KeyboardInterrupt:
+            sys.stderr.write(f'\ninterrupted, {len(job.pending())} calls left; run the same command to resume\n')
+            return 130
+        finally:
+            job.close()
+    if job.throughput.calls:
+        progress(job.throughput, final=True)
+    sys.stderr.write(f'{report.done} calls done, {report.skipped} done before, {report.failed} failed, '
+                     f'{report.remaining} left\n')
+    if report.quota_spent:
+        sys.stderr.write('the daily quota is spent; run the same command to resume\n')
+    return 0 if not report.remaining else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
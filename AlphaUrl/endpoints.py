@@ -0,0 +1,488 @@
+"""
+Declarative table of the Alpha Vantage endpoints exposed by Alpha_url.
+
+Every Endpoint names the client method, the API function, the host it is sent
+to, the method's arguments with their defaults, the shape of the answer and the
+cache family of its responses. Alpha_url and AsyncAlpha_url generate one method
+per entry and every one of them goes through the client's _call(), so the
+connection pool, quota, retries, caches and request coalescing apply to all
+endpoints alike.
+
+    from AlphaUrl.endpoints import ENDPOINTS
+    ENDPOINTS['sma'].function, ENDPOINTS['sma'].params
+    ENDPOINTS['sma'].request(av, 'IBM', 'daily', 20)     # (url, query pairs)
+
+Conventions shared by every endpoint:
+- ticker is sent as symbol and output_size as outputsize; on the analytics
+  host parameters are sent upper case (tickers as SYMBOLS, range1 and range2
+  both as RANGE).
+- None leaves a parameter out, booleans are sent as true / false and lists
+  are joined with commas.
+- The '&name=value' spelling of an argument ('&datatype=csv', '&sort=LATEST',
+  '&OHLC=close') is still accepted and sent as value.
+- TABLE endpoints return the CSV text for datatype='csv' and the parsed JSON
+  otherwise, JSON endpoints the parsed JSON and RECORDS endpoints a list of
+  dicts (one per CSV row), or the parsed JSON for datatype='json'.
+- HTTP errors raise requests.HTTPError, error bodies AlphaVantageError.
+
+Endpoints are grouped in FAMILIES (core, options, news, analytics,
+fundamentals, fx, crypto, commodities, economics, indicators). The clients
+generate the methods of a family the first time one of them is looked up,
+so importing the package or calling a single endpoint never builds the other
+hundred; load_endpoints() generates them up front (e.g. before help()).
+Signatures are built on first use too, which keeps inspect out of the import.
+"""
+import csv
+import io
+
+QUERY = 'query'          # www.alphavantage.co/query?function=<function>
+ANALYTICS = 'analytics'  # alphavantageapi.co/timeseries/<function>
+
+TABLE, JSON, RECORDS = 'table', 'json', 'records'
+
+REQUIRED = object()  # default of an argument that has none
+
+# argument -> query parameter on each host; None: accepted, never sent
+QUERY_NAMES = {
+    QUERY: {'ticker': 'symbol', 'output_size': 'outputsize', 'apikey': None},
+    ANALYTICS: {'tickers': 'SYMBOLS', 'range1': 'RANGE', 'range2': 'RANGE'},
+}
+
+
+def _args(*required, **optional):
+    """ ((argument, default), ...) in signature order """
+    return tuple((name, REQUIRED) for name in required) + tuple(optional.items())
+
+
+def _format(value):
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (list, tuple)):
+        return ','.join(str(v) for v in value)
+    value = str(value)
+    if value.startswith('&') and '=' in value:
+        value = value.split('=', 1)[1]
+    return value
+
+
+class Endpoint:
+    def __init__(self, method, function, params, output=TABLE, cache=None, host=QUERY, names=None, doc=''):
+        """
+        method:   name of the client method.
+        function: API function (query host) or path (analytics host).
+        params:   ((argument, default), ...) of the method, REQUIRED when there is no default.
+        output:   TABLE, JSON or RECORDS (see the module docstring).
+        cache:    TTL family of the responses (see AlphaUrl.cache); None lets
+                  the interval decide.
+        host:     QUERY or ANALYTICS.
+        names:    {argument: query parameter} beyond the host's QUERY_NAMES.
+        doc:      docstring of the generated method.
+
+        family, the FAMILIES group of the endpoint, is set by the table.
+        """
+        self.method = method
+        self.function = function
+        self.params = params
+        self.output = output
+        self.cache = cache
+        self.host = host
+        self.names = dict(QUERY_NAMES[host], **(names or {}))
+        self.doc = doc
+        self.family = None
+        self._signature = None
+
+    def __repr__(self):
+        return f'Endpoint({self.method!r}, {self.function!r})'
+
+    @property
+    def signature(self):
+        """ inspect.Signature of the method, built on first use """
+        if self._signature is None:
+            import inspect
+
+            self._signature = inspect.Signature([
+                inspect.Parameter(name, inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                                  default=inspect.Parameter.empty if default is REQUIRED else default)
+                for name, default in self.params])
+        return self._signature
+
+    def _query_name(self, argument):
+        name = self.names.get(argument, argument)
+        if name is not None and self.host == ANALYTICS:
+            name = name.upper()
+        return name
+
+    def request(self, client, *args, **kwargs):
+        """ (url, query pairs) of a call, on the client's hosts with its API key """
+        bound = self.signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        root = client.analytics_url if self.host == ANALYTICS else client.base_url
+        query = [(self._query_name(name), _format(value)) for name, value in bound.arguments.items()
+                 if value is not None and self._query_name(name) is not None]
+        query.append(('apikey', client.api_key))
+        return f'{root}{self.function}', query
+
+    def parse(self, response, query):
+        """ the response body in this endpoint's output shape """
+        datatype = dict(query).get('datatype', 'json' if self.output == JSON else 'csv')
+        if self.output == JSON or datatype == 'json':
+            return response.json()
+        if self.output == RECORDS:
+            return list(csv.DictReader(io.StringIO(response.text)))
+        return response.text
+
+    def bind(self, function, owner):
+        """ give function, the generated client method, this endpoint's name,
+        signature and docstring """
+        import inspect
+
+        self_param = inspect.Parameter('self', inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        function.__name__ = self.method
+        function.__qualname__ = f'{owner.__name__}.{self.method}'
+        function.__doc__ = self.doc
+        function.__signature__ = self.signature.replace(parameters=[self_param, *self.signature.parameters.values()])
+        return function
+
+
+_ANALYTICS_DOC = """
+        RANGE (range1, range2): full, {N}day, {N}week, {N}month, {N}year, plus
+        {N}minute and {N}hour for intraday series, or two dates such as
+        '2023-07-01' and '2023-08-31' (or '2020-12-01T00:04:00' and
+        '2020-12-06T23:59:59'). Premium keys take 50 tickers per request.
+
+        ohlc:     open / high / low / close.
+        interval: 1min, 5min, 15min, 30min, 60min, DAILY, WEEKLY or MONTHLY.
+"""
+
+_FIXED_WINDOW_DOC = """
+        Return analytics of several tickers over one range.
+""" + _ANALYTICS_DOC + """
+        calculations, a comma separated list of:
+        MIN: The minimum return (largest negative or smallest positive) for all values in the series
+        MAX: The maximum return for all values in the series
+        MEAN: The mean of all returns in the series
+        MEDIAN: The median of all returns in the series
+        CUMULATIVE_RETURN: The total return from the beginning to the end of the series range
+        VARIANCE: The population variance of returns in the series range. VARIANCE(annualized=True) normalizes it to an annual value.
+        STDDEV: The population standard deviation of returns in the series range. STDDEV(annualized=True) normalizes it to an annual value.
+        MAX_DRAWDOWN: Largest peak to trough interval for each symbol in the series range
+        HISTOGRAM: The returns of each symbol placed in bins, 10 by default: HISTOGRAM(bins=20).
+        AUTOCORRELATION: The autocorrelation of each symbol at lag 1 by default: AUTOCORRELATION(lag=2).
+        COVARIANCE: Covariance matrix of the symbols, COVARIANCE(annualized=True) for an annual value.
+        CORRELATION: Correlation matrix of the symbols, PEARSON by default: CORRELATION(method=KENDALL) or CORRELATION(method=SPEARMAN).
+        """
+
+_SLIDING_WINDOW_DOC = """
+        Return analytics of several tickers over a window of window_size
+        points moved across the range.
+""" + _ANALYTICS_DOC + """
+        calculations, a comma separated list of MEAN, MEDIAN,
+        CUMULATIVE_RETURN, VARIANCE, STDDEV, COVARIANCE and CORRELATION, with
+        the options of advanced_analytics_fixed_window.
+        """
+
+_NEWS_DOC = """
+        Market news and sentiment, newest first by default.
+
+        tickers:   comma separated symbols the articles mention.
+        topics:    blockchain, earnings, ipo, mergers_and_acquisitions,
+                   financial_markets, economy_fiscal, economy_monetary,
+                   economy_macro, energy_transportation, finance,
+                   life_sciences, manufacturing, real_estate,
+                   retail_wholesale, technology.
+        time_from / time_to: YYYYMMDDTHHMM, e.g. 20220410T0130.
+        sort:      LATEST, EARLIEST or RELEVANCE.
+        limit:     articles returned, up to 1000.
+        """
+
+def _table(method, function, *required, cache=None, doc='', **optional):
+    """ Endpoint answering CSV or JSON as datatype asks """
+    return Endpoint(method, function, _args(*required, **optional), TABLE, cache, doc=doc)
+
+
+FAMILIES = {
+    'core': (
+        _table('get_intraday_data', 'TIME_SERIES_INTRADAY', 'ticker', 'interval', adjusted=True, extended_hours=True,
+               month=None, outputsize='full', datatype='csv', cache='intraday',
+               doc=""" Get intraday data for a given ticker """),
+        _table('get_daily_data', 'TIME_SERIES_DAILY', 'ticker', outputsize='full', datatype='csv',
+               doc=""" Get daily data for a given ticker """),
+        _table('get_daily_adjusted_data', 'TIME_SERIES_DAILY_ADJUSTED', 'ticker', outputsize='full', datatype='csv',
+               doc=""" Get daily adjusted data for a given ticker """),
+        _table('get_weekly_data', 'TIME_SERIES_WEEKLY', 'ticker', datatype='csv',
+               doc=""" Get weekly data for a given ticker """),
+        _table('get_weekly_adjusted_data', 'TIME_SERIES_WEEKLY_ADJUSTED', 'ticker', datatype='csv',
+               doc=""" Get weekly adjusted data for a given ticker """),
+        _table('get_monthly_data', 'TIME_SERIES_MONTHLY', 'ticker', datatype='csv',
+               doc=""" Get monthly data for a given ticker """),
+        _table('get_monthly_adjusted_data', 'TIME_SERIES_MONTHLY_ADJUSTED', 'ticker', datatype='csv',
+               doc=""" Get monthly adjusted data for a given ticker """),
+        Endpoint('_bulk_quotes_chunk', 'REALTIME_BULK_QUOTES', _args('tickers'), JSON, 'realtime',
+                 names={'tickers': 'symbol'}, doc=""" one REALTIME_BULK_QUOTES call for up to 100 tickers """),
+        Endpoint('search_endpoint', 'SYMBOL_SEARCH', _args(datatype='csv', keywords='tesco'), RECORDS,
+                 doc=""" search query for identifying tickers """),
+        Endpoint('global_market_open_and_close_status', 'MARKET_STATUS', (), JSON, 'realtime',
+                 doc=""" current status (open / closed) of the major trading venues """),
+    ),
+    'options': (
+        Endpoint('realtime_options', 'REALTIME_OPTIONS', _args('ticker', datatype='csv'), RECORDS, 'realtime',
+                 doc=""" realtime option chain of a ticker """),
+        Endpoint('historical_options', 'HISTORICAL_OPTIONS', _args('ticker', datatype='csv', date=None), RECORDS,
+                 'daily', doc=""" option chain of a ticker on a date (the previous session by default).
+        Any date later than 2008-01-01 is accepted. For example, date=2017-11-15 """),
+        _table('_historical_options_csv', 'HISTORICAL_OPTIONS', 'ticker', 'date', datatype='csv', cache='daily',
+               doc=""" CSV text of one historical_options call, parsed column-wise by options_history """),
+        _table('_realtime_options_csv', 'REALTIME_OPTIONS', 'ticker', datatype='csv', cache='realtime',
+               doc=""" CSV text of one realtime_options call, parsed column-wise by option_chain """),
+    ),
+    'news': (
+        Endpoint('market_news_and_sentiment', 'NEWS_SENTIMENT',
+                 _args(topics=None, time_from=None, time_to=None, sort='LATEST', limit=None, tickers=None), JSON,
+                 'intraday', doc=_NEWS_DOC),
+        Endpoint('top_gainers_losers_and_mostly_actively_traded_tickers_us', 'TOP_GAINERS_LOSERS', (), JSON,
+                 'realtime', doc=""" top 20 gainers, losers and most actively traded US tickers """),
+    ),
+    'fundamentals': (
+        Endpoint('insider_transactions', 'INSIDER_TRANSACTIONS', _args('ticker'), JSON, 'fundamentals',
+                 doc=""" insider transactions of a company """),
+        Endpoint('company_overview', 'OVERVIEW', _args('ticker'), JSON, 'fundamentals',
+                 doc=""" company information, financial ratios and key metrics """),
+        Endpoint('etf_profile_and_holdings', 'ETF_PROFILE', _args('ticker'), JSON, 'fundamentals',
+                 doc=""" ETF key metrics, sector allocation and holdings """),
+        Endpoint('corporate_action_dividends', 'DIVIDENDS', _args('ticker'), JSON, 'fundamentals',
+                 doc=""" historical and declared dividends """),
+        Endpoint('corporate_action_splits', 'SPLITS', _args('ticker'), JSON, 'fundamentals',
+                 doc=""" historical split events """),
+        Endpoint('income_statement', 'INCOME_STATEMENT', _args('ticker'), JSON, 'fundamentals',
+                 doc=""" annual and quarterly income statements """),
+        Endpoint('balance_sheet', 'BALANCE_SHEET', _args('ticker'), JSON, 'fundamentals',
+                 doc=""" annual and quarterly balance sheets """),
+        Endpoint('cash_flow', 'CASH_FLOW', _args('ticker'), JSON, 'fundamentals',
+                 doc=""" annual and quarterly cash flows """),
+        Endpoint('earnings', 'EARNINGS', _args('ticker'), JSON, 'fundamentals',
+                 doc=""" annual and quarterly earnings per share """),
+        Endpoint('listing_and_delisting_status', 'LISTING_STATUS', _args(date=None, state=None), RECORDS,
+                 doc="""
+        list of active or delisted symbols on that particular date in history. Any YYYY-MM-DD date later than 2010-01-01 is supported. For example, date=2013-08-03
+        By default, state=active and the API will return a list of actively traded stocks and ETFs. Set state=delisted
+            """),
+        Endpoint('earnings_calendar', 'EARNINGS_CALENDAR', _args(horizon='3month', symbol=None), RECORDS,
+                 doc="""
+        horizon=3month and the API will return a list of expected company earnings in the next 3 months. You may set horizon=6month or horizon=12month to query the earnings scheduled for the next 6 months or 12 months, respectively.
+        if symbol only for specific symbol
+            """),
+        Endpoint('ipo_calendar', 'IPO_CALENDAR', (), RECORDS, doc=""" IPOs expected in the next 3 months """),
+    ),
+    'analytics': (
+        Endpoint('advanced_analytics_fixed_window', 'analytics',
+                 _args('tickers', 'range1', range2=None, calculations='MEAN', ohlc='close', interval='DAILY'), JSON,
+                 host=ANALYTICS, doc=_FIXED_WINDOW_DOC),
+        Endpoint('advanced_analytics_sliding_window', 'running_analytics',
+                 _args('tickers', 'range1', range2=None, calculations='MEAN', ohlc='close', interval='DAILY',
+                       window_size=20), JSON, host=ANALYTICS, doc=_SLIDING_WINDOW_DOC),
+    ),
+    'fx': (
+        Endpoint('currency_exchange_rate', 'CURRENCY_EXCHANGE_RATE', _args(from_currency='BTC', to_currency='EUR'),
+                 JSON, 'realtime',
+                 doc=""" exchange rate between two currencies, physical or digital ('BTC', 'USD', 'EUR') """),
+        _table('fx_intraday', 'FX_INTRADAY', 'from_symbol', 'to_symbol', 'interval', output_size='full',
+               datatype='csv', cache='intraday', doc=""" Get intraday forex data for a specific currency pair. """),
+        _table('fx_daily', 'FX_DAILY', from_symbol='EUR', to_symbol='USD', datatype='csv',
+               doc=""" Get daily forex data for a specific currency pair. """),
+        _table('fx_weekly', 'FX_WEEKLY', from_symbol='EUR', to_symbol='USD', datatype='csv',
+               doc=""" Get weekly forex data for a specific currency pair. """),
+        _table('fx_monthly', 'FX_MONTHLY', from_symbol='EUR', to_symbol='USD', datatype='csv',
+               doc=""" Get monthly forex data for a specific currency pair. """),
+    ),
+    'crypto': (
+        _table('crypto_intraday', 'CRYPTO_INTRADAY', symbol='ETH', market='USD', interval='5min', outputsize='full',
+               datatype='csv', cache='intraday',
+               doc=""" Get the intraday time series data for a specific cryptocurrency. """),
+        _table('digital_currency_daily', 'DIGITAL_CURRENCY_DAILY', symbol='BTC', market='EUR', output_size='full',
+               datatype='csv', doc=""" daily digital currency data for the given symbol and market """),
+        _table('digital_currency_weekly', 'DIGITAL_CURRENCY_WEEKLY', symbol='BTC', market='EUR', output_size='full',
+               datatype='csv', doc=""" weekly digital currency data for the given symbol and market """),
+        _table('digital_currency_monthly', 'DIGITAL_CURRENCY_MONTHLY', symbol='BTC', market='EUR', output_size='full',
+               datatype='csv', doc=""" monthly digital currency data for the given symbol and market """),
+    ),
+    'commodities': (
+        # interval daily / weekly / monthly (quarterly / annual for the price index)
+        _table('crude_oil_prices_wti', 'WTI', interval='monthly', datatype='csv', cache='macro',
+               doc=""" WTI crude oil prices """),
+        _table('crude_oil_prices_brent', 'BRENT', interval='monthly', datatype='csv', cache='macro',
+               doc=""" Brent crude oil prices """),
+        _table('natural_gas', 'NATURAL_GAS', interval='monthly', datatype='csv', cache='macro',
+               doc=""" Henry Hub natural gas spot prices """),
+        _table('global_price_of_copper', 'COPPER', interval='monthly', datatype='csv', cache='macro',
+               doc=""" global price of copper """),
+        _table('global_price_of_aluminum', 'ALUMINUM', interval='monthly', datatype='csv', cache='macro',
+               doc=""" global price of aluminum """),
+        _table('global_price_of_wheat', 'WHEAT', interval='monthly', datatype='csv', cache='macro',
+               doc=""" global price of wheat """),
+        _table('global_price_of_corn', 'CORN', interval='monthly', datatype='csv', cache='macro',
+               doc=""" global price of corn """),
+        _table('global_price_of_cotton', 'COTTON', interval='monthly', datatype='csv', cache='macro',
+               doc=""" global price of cotton """),
+        _table('global_price_of_sugar', 'SUGAR', interval='monthly', datatype='csv', cache='macro',
+               doc=""" global price of sugar """),
+        _table('global_price_of_coffee', 'COFFEE', interval='monthly', datatype='csv', cache='macro',
+               doc=""" global price of coffee """),
+        _table('global_price_index_of_all_commodities', 'ALL_COMMODITIES', interval='monthly', datatype='csv',
+               cache='macro', doc=""" global price index of all commodities """),
+    ),
+    'economics': (
+        _table('real_gdp', 'REAL_GDP', interval='annual', datatype='csv', cache='macro',
+               doc=""" US real GDP, interval annual or quarterly """),
+        _table('real_gdp_per_capita', 'REAL_GDP_PER_CAPITA', datatype='csv', cache='macro',
+               doc=""" US real GDP per capita, quarterly """),
+        _table('treasury_yield', 'TREASURY_YIELD', interval='monthly', maturity='10year', datatype='csv',
+               cache='macro', doc=""" US treasury yield; maturity 3month, 2year, 5year, 7year, 10year or 30year """),
+        _table('federal_funds_rate', 'FEDERAL_FUNDS_RATE', interval='monthly', datatype='csv', cache='macro',
+               doc=""" US federal funds rate """),
+        _table('cpi', 'CPI', interval='monthly', datatype='csv', cache='macro',
+               doc=""" US consumer price index, interval monthly or semiannual """),
+        _table('inflation', 'INFLATION', datatype='csv', cache='macro', doc=""" US annual inflation rate """),
+        _table('retail_sales', 'RETAIL_SALES', datatype='csv', cache='macro', doc=""" US monthly retail sales """),
+        _table('durables', 'DURABLES', datatype='csv', cache='macro', doc=""" US monthly durable goods orders """),
+        _table('unemployment', 'UNEMPLOYMENT', datatype='csv', cache='macro',
+               doc=""" US monthly unemployment rate """),
+        _table('nonfarm_payroll', 'NONFARM_PAYROLL', datatype='csv', cache='macro',
+               doc=""" US monthly nonfarm payroll """),
+    ),
+    'indicators': (
+        # interval 1min .. 60min, daily, weekly or monthly, month (YYYY-MM) for intraday intervals only,
+        # series_type close / open / high / low, matype 0 (SMA) .. 8 (T3)
+        _table('sma', 'SMA', 'ticker', interval='weekly', time_period=10, series_type='open', month=None,
+               datatype='csv', doc=""" Simple Moving Average """),
+        _table('ema', 'EMA', 'ticker', interval='weekly', time_period=10, series_type='open', month=None,
+               datatype='csv', doc=""" Exponential Moving Average """),
+        _table('wma', 'WMA', 'ticker', interval='weekly', time_period=10, series_type='open', month=None,
+               datatype='csv', doc=""" Weighted Moving Average """),
+        _table('dema', 'DEMA', 'ticker', interval='weekly', time_period=10, series_type='open', month=None,
+               datatype='csv', doc=""" Double Exponential Moving Average """),
+        _table('tema', 'TEMA', 'ticker', interval='weekly', time_period=10, series_type='open', month=None,
+               datatype='csv', doc=""" Triple Exponential Moving Average """),
+        _table('trima', 'TRIMA', 'ticker', interval='weekly', time_period=10, series_type='open', month=None,
+               datatype='csv', doc=""" Triangular Moving Average """),
+        _table('kama', 'KAMA', 'ticker', interval='weekly', time_period=10, series_type='open', month=None,
+               datatype='csv', doc=""" Kaufman Adaptive Moving Average """),
+        _table('mama', 'MAMA', 'ticker', interval='daily', series_type='close', fastlimit=0.02, slowlimit=0.02,
+               month=None, datatype='csv', doc=""" MESA Adaptive Moving Average """),
+        _table('vwap', 'VWAP', 'ticker', interval='15min', month=None, datatype='csv',
+               doc=""" Volume Weighted Average Price, intraday intervals only """),
+        _table('t3', 'T3', 'ticker', interval='weekly', time_period=10, series_type='close', month=None,
+               datatype='csv', doc=""" Tillson T3 moving average """),
+        _table('macd', 'MACD', 'ticker', interval='daily', series_type='close', fastperiod=12, slowperiod=26,
+               signalperiod=9, month=None, datatype='csv', doc=""" Moving Average Convergence / Divergence """),
+        _table('macdext', 'MACDEXT', 'ticker', interval='daily', series_type='close', fastperiod=12, slowperiod=26,
+               signalperiod=9, fastmatype=0, slowmatype=0, signalmatype=0, month=None, datatype='csv', apikey=None,
+               doc=""" MACD with controllable moving average types (apikey is ignored, the client's key is sent) """),
+        _table('stoch', 'STOCH', 'ticker', interval='daily', fastkperiod=5, slowkperiod=3, slowdperiod=3,
+               slowkmatype=0, slowdmatype=0, month=None, datatype='csv', doc=""" Stochastic Oscillator """),
+        _table('stochf', 'STOCHF', 'ticker', interval='daily', fastkperiod=5, fastdperiod=3, fastdmatype=0,
+               month=None, datatype='csv', apikey=None,
+               doc=""" Stochastic Fast (apikey is ignored, the client's key is sent) """),
+        _table('rsi', 'RSI', 'ticker', interval='daily', time_period=14, series_type='close', datatype='csv',
+               doc=""" Relative Strength Index """),
+        _table('stochrsi', 'STOCHRSI', 'ticker', interval='daily', time_period=14, series_type='close',
+               fastkperiod=5, fastdperiod=3, fastdmatype=0, datatype='csv', doc=""" Stochastic RSI """),
+        _table('willr', 'WILLR', 'ticker', interval='daily', time_period=14, datatype='csv',
+               doc=""" Williams' %R """),
+        _table('adx', 'ADX', 'ticker', interval='daily', time_period=14, datatype='csv',
+               doc=""" Average Directional Movement Index """),
+        _table('adxr', 'ADXR', 'ticker', interval='daily', time_period=14, datatype='csv',
+               doc=""" Average Directional Movement Index Rating """),
+        _table('apo', 'APO', 'ticker', interval='daily', series_type='close', fastperiod=12, slowperiod=26, matype=0,
+               datatype='csv', doc=""" Absolute Price Oscillator """),
+        _table('ppo', 'PPO', 'ticker', interval='daily', series_type='close', fastperiod=12, slowperiod=26, matype=0,
+               datatype='csv', doc=""" Percentage Price Oscillator """),
+        _table('mom', 'MOM', 'ticker', interval='daily', time_period=10, series_type='close', datatype='csv',
+               doc=""" Momentum """),
+        _table('bop', 'BOP', 'ticker', interval='daily', datatype='csv', doc=""" Balance of Power """),
+        _table('cci', 'CCI', 'ticker', interval='daily', time_period=14, datatype='csv',
+               doc=""" Commodity Channel Index """),
+        _table('cmo', 'CMO', 'ticker', interval='daily', time_period=14, series_type='close', datatype='csv',
+               doc=""" Chande Momentum Oscillator """),
+        _table('roc', 'ROC', 'ticker', interval='daily', time_period=10, series_type='close', datatype='csv',
+               doc=""" Rate of Change """),
+        _table('rocr', 'ROCR', 'ticker', interval='daily', time_period=10, series_type='close', datatype='csv',
+               doc=""" Rate of Change Ratio """),
+        _table('aroon', 'AROON', 'ticker', interval='daily', time_period=14, datatype='csv', doc=""" Aroon """),
+        _table('aroonosc', 'AROONOSC', 'ticker', interval='daily', time_period=10, datatype='csv',
+               doc=""" Aroon Oscillator """),
+        _table('mfi', 'MFI', 'ticker', interval='daily', time_period=10, datatype='csv',
+               doc=""" Money Flow Index """),
+        _table('trix', 'TRIX', 'ticker', interval='daily', time_period=10, series_type='close', datatype='csv',
+               doc=""" 1-day Rate of Change of a Triple Smooth EMA """),
+        _table('ultosc', 'ULTOSC', 'ticker', interval='daily', timeperiod1=8, timeperiod2=14, timeperiod3=28,
+               datatype='csv', doc=""" Ultimate Oscillator """),
+        _table('dx', 'DX', 'ticker', interval='daily', time_period=10, datatype='csv',
+               doc=""" Directional Movement Index """),
+        _table('minus_di', 'MINUS_DI', 'ticker', interval='weekly', time_period=10, datatype='csv',
+               doc=""" Minus Directional Indicator """),
+        _table('plus_di', 'PLUS_DI', 'ticker', interval='daily', time_period=10, datatype='csv',
+               doc=""" Plus Directional Indicator """),
+        _table('minus_dm', 'MINUS_DM', 'ticker', interval='daily', time_period=10, datatype='csv',
+               doc=""" Minus Directional Movement """),
+        _table('plus_dm', 'PLUS_DM', 'ticker', interval='daily', time_period=10, datatype='csv',
+               doc=""" Plus Directional Movement """),
+        _table('bbands', 'BBANDS', 'ticker', interval='weekly', time_period=5, series_type='close', nbdevup=3,
+               nbdevdn=3, matype=0, datatype='csv', doc=""" Bollinger Bands """),
+        _table('midpoint', 'MIDPOINT', 'ticker', interval='daily', time_period=10, series_type='close',
+               datatype='csv', doc=""" (highest value + lowest value) / 2 over time_period """),
+        _table('midprice', 'MIDPRICE', 'ticker', interval='daily', time_period=10, datatype='csv',
+               doc=""" (highest high + lowest low) / 2 over time_period """),
+        _table('sar', 'SAR', 'ticker', interval='daily', acceleration=0.02, maximum=0.2, datatype='csv',
+               doc=""" Parabolic SAR """),
+        _table('trange', 'TRANGE', 'ticker', interval='daily', datatype='csv', doc=""" True Range """),
+        _table('atr', 'ATR', 'ticker', interval='daily', time_period=14, datatype='csv',
+               doc=""" Average True Range """),
+        _table('natr', 'NATR', 'ticker', interval='weekly', time_period=14, month=None, datatype='csv',
+               doc=""" Normalized Average True Range """),
+        _table('ad', 'AD', 'ticker', interval='daily', month=None, datatype='csv',
+               doc=""" Chaikin A/D Line """),
+        _table('adosc', 'ADOSC', 'ticker', interval='daily', fastperiod=5, slowperiod=10, month=None,
+               datatype='csv', doc=""" Chaikin A/D Oscillator """),
+        _table('obv', 'OBV', 'ticker', interval='daily', month=None, datatype='csv', doc=""" On Balance Volume """),
+        _table('ht_trendline', 'HT_TRENDLINE', 'ticker', interval='daily', series_type='close', month=None,
+               datatype='csv', doc=""" Hilbert Transform, Instantaneous Trendline """),
+        _table('ht_sine', 'HT_SINE', 'ticker', interval='daily', series_type='close', month=None, datatype='csv',
+               doc=""" Hilbert Transform, Sine Wave """),
+        _table('ht_trendmode', 'HT_TRENDMODE', 'ticker', interval='weekly', series_type='close', datatype='json',
+               doc=""" Hilbert Transform, Trend vs Cycle Mode """),
+        _table('ht_dcperiod', 'HT_DCPERIOD', 'ticker', interval='daily', series_type='close', datatype='json',
+               doc=""" Hilbert Transform, Dominant Cycle Period """),
+        _table('ht_dcphase', 'HT_DCPHASE', 'ticker', interval='daily', series_type='close', datatype='json',
+               doc=""" Hilbert Transform, Dominant Cycle Phase """),
+        _table('ht_phasor', 'HT_PHASOR', 'ticker', interval='weekly', series_type='close', datatype='json',
+               doc=""" Hilbert Transform, Phasor Components """),
+    ),
+}
+
+ENDPOINTS = {}
+for _family, _endpoints in FAMILIES.items():
+    for _endpoint in _endpoints:
+        _endpoint.family = _family
+        ENDPOINTS[_endpoint.method] = _endpoint
+
+
+class LazyEndpoints(type):
+    """ metaclass of the clients: a class attribute that is an endpoint method not
+    generated yet loads its family through the class's load_endpoints() """
+    def __getattr__(cls, name):
+        endpoint = ENDPOINTS.get(name)
+        if endpoint is None:
+            raise AttributeError(f"type object {cls.__name__!r} has no attribute {name!r}")
+        cls.load_endpoints(endpoint.family)
+        return getattr(cls, name)
+
+    def __dir__(cls):
+        return sorted(set(super().__dir__()) | ENDPOINTS.keys())
+
+
+def install(owner, family, generate):
+    """ set generate(endpoint), a generated client method, on the class owner for
+    every endpoint of family it does not have yet """
+    for endpoint in FAMILIES[family]:
+        if endpoint.method not in vars(owner):
+            setattr(owner, endpoint.method, generate(endpoint))
@@ -0,0 +1,14 @@
+class AlphaVantageError(ValueError):
+    """ base class for errors reported by or about the Alpha Vantage API """
+
+
+class ApiError(AlphaVantageError):
+    """ the API answered with an 'Error Message' or a notice instead of data """
+
+
+class RateLimitError(AlphaVantageError):
+    """ the API kept throttling the request after every retry """
+
+
+class QuotaExceededError(AlphaVantageError):
+    """ the daily call budget is spent (client-side or reported by the API) """
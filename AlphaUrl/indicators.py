@@ -0,0 +1,606 @@
+"""
+Technical indicators computed locally with NumPy, following TA-Lib (the
+library the Alpha Vantage indicator endpoints mirror): same parameters, same
+seeding and the same lookback. Every function takes float64 arrays and returns
+arrays of the same length, NaN where the indicator is not defined yet, so the
+result lines up with the timestamps of the price series it came from.
+
+    from AlphaUrl import indicators
+    ts = av.as_series('get_daily_data', 'IBM')
+    indicators.ema(ts.close, 20)
+
+See AlphaUrl.local for the endpoint shaped wrappers (av.local.sma(...)).
+
+Requires numpy.
+"""
+import numpy as np
+
+FILTER_BLOCK = 128  # rows per matrix product in _ema_filter
+
+# matype codes of the Alpha Vantage / TA-Lib API
+SMA, EMA, WMA, DEMA, TEMA, TRIMA, KAMA, MAMA, T3 = range(9)
+
+
+def _on_valid(values, kernel):
+    """ run kernel on values from their first non-NaN element on (output of another
+    indicator still in its lookback), NaN before that """
+    values = np.asarray(values, dtype=np.float64)
+    out = np.full(len(values), np.nan)
+    valid = np.flatnonzero(~np.isnan(values))
+    if len(valid):
+        start = valid[0]
+        out[start:] = kernel(values[start:])
+    return out
+
+
+def _ema_filter(x, alpha, seed):
+    """
+    y[t] = y[t-1] + alpha * (x[t] - y[t-1]) with y[-1] = seed.
+
+    Solved a block at a time as one matrix product (y = W @ x + d**k * y[-1],
+    W[i, j] = alpha * d**(i - j)) rather than one Python step per element.
+    """
+    d = 1.0 - alpha
+    k = np.arange(min(len(x), FILTER_BLOCK))
+    weights = alpha * np.tril(d ** np.clip(np.subtract.outer(k, k), 0, None))
+    carry = d ** (k + 1)
+    out = np.empty(len(x))
+    prev = seed
+    for i in range(0, len(x), FILTER_BLOCK):
+        block = x[i:i + FILTER_BLOCK]
+        m = len(block)
+        if np.isnan(block).any():
+            y = np.empty(m)
+            for j, value in enumerate(block):
+                prev = y[j] = prev + alpha * (value - prev)
+        else:
+            y = weights[:m, :m] @ block + carry[:m] * prev
+        out[i:i + m] = y
+        prev = y[-1]
+    return out
+
+
+def sma(values, time_period=30):
+    def kernel(x):
+        out = np.full(len(x), np.nan)
+        if len(x) >= time_period:
+            total = np.cumsum(np.concatenate(([0.0], x)))
+            out[time_period - 1:] = (total[time_period:] - total[:-time_period]) / time_period
+        return out
+    return _on_valid(values, kernel)
+
+
+def ema(values, time_period=30):
+    """ seeded with the SMA of the first time_period values, as TA-Lib does """
+    def kernel(x):
+        out = np.full(len(x), np.nan)
+        if len(x) >= time_period:
+            out[time_period - 1] = x[:time_period].mean()
+            out[time_period:] = _ema_filter(x[time_period:], 2.0 / (time_period + 1), out[time_period - 1])
+        return out
+    return _on_valid(values, kernel)
+
+
+def wma(values, time_period=30):
+    def kernel(x):
+        out = np.full(len(x), np.nan)
+        if len(x) >= time_period:
+            weights = np.arange(time_period, 0, -1, dtype=np.float64)
+            out[time_period - 1:] = np.convolve(x, weights, 'valid') / weights.sum()
+        return out
+    return _on_valid(values, kernel)
+
+
+def dema(values, time_period=30):
+    first = ema(values, time_period)
+    return 2.0 * first - ema(first, time_period)
+
+
+def tema(values, time_period=30):
+    first = ema(values, time_period)
+    second = ema(first, time_period)
+    return 3.0 * first - 3.0 * second + ema(second, time_period)
+
+
+def trima(values, time_period=30):
+    """ SMA of an SMA, the two periods adding up to time_period + 1 """
+    half = time_period // 2
+    if time_period % 2:
+        return sma(sma(values, half + 1), half + 1)
+    return sma(sma(values, half), half + 1)
+
+
+def kama(values, time_period=30):
+    """ Kaufman adaptive moving average (fast 2, slow 30 periods) """
+    fastest, slowest = 2.0 / 3.0, 2.0 / 31.0
+
+    def kernel(x):
+        out = np.full(len(x), np.nan)
+        if len(x) <= time_period:
+            return out
+        moves = np.cumsum(np.concatenate(([0.0], np.abs(np.diff(x)))))
+        noise = moves[time_period:] - moves[:-time_period]
+        signal = np.abs(x[time_period:] - x[:-time_period])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = np.where(np.abs(noise) < 1e-8, 1.0, signal / noise)
+        smoothing = (ratio * (fastest - slowest) + slowest) ** 2
+        prev = x[time_period - 1]
+        for i, (value, sc) in enumerate(zip(x[time_period:].tolist(), smoothing.tolist()), time_period):
+            prev = out[i] = prev + sc * (value - prev)
+        return out
+    return _on_valid(values, kernel)
+
+
+def t3(values, time_period=5, vfactor=0.7):
+    """ Tillson T3: six chained EMAs combined with the volume factor """
+    e1 = ema(values, time_period)
+    e2 = ema(e1, time_period)
+    e3 = ema(e2, time_period)
+    e4 = ema(e3, time_period)
+    e5 = ema(e4, time_period)
+    e6 = ema(e5, time_period)
+    v2, v3 = vfactor * vfactor, vfactor * vfactor * vfactor
+    c1 = -v3
+    c2 = 3.0 * (v2 + v3)
+    c3 = -6.0 * v2 - 3.0 * (vfactor + v3)
+    c4 = 1.0 + 3.0 * vfactor + v3 + 3.0 * v2
+    return c1 * e6 + c2 * e5 + c3 * e4 + c4 * e3
+
+
+class _Hilbert:
+    """ one of the four Hilbert transformers of TA-Lib's cycle indicators, with
+    separate state for odd and even bars """
+    A, B = 0.0962, 0.5769
+
+    def __init__(self):
+        self.taps = {0: [0.0] * 3, 1: [0.0] * 3}
+        self.prev = {0: 0.0, 1: 0.0}
+        self.prev_input = {0: 0.0, 1: 0.0}
+
+    def __call__(self, value, parity, idx, adjusted_period):
+        taps = self.taps[parity]
+        scaled = self.A * value
+        out = scaled - taps[idx] - self.prev[parity]
+        taps[idx] = scaled
+        self.prev[parity] = self.B * self.prev_input[parity]
+        self.prev_input[parity] = value
+        return (out + self.prev[parity]) * adjusted_period
+
+
+def _hilbert_bars(prices, warmup):
+    """
+    TA-Lib's Hilbert transform pipeline over a list of prices. Yields
+    (bar, smoothed price, in-phase, quadrature, period) for every bar after
+    the 4-bar WMA has been primed with 3 bars and warmed up over warmup more.
+    """
+    wma_sub = prices[0] + prices[1] + prices[2]
+    wma_sum = prices[0] + 2.0 * prices[1] + 3.0 * prices[2]
+    trailing, trailing_value = 0, 0.0
+
+    def smooth(price):
+        nonlocal wma_sub, wma_sum, trailing, trailing_value
+        wma_sub += price
+        wma_sub -= trailing_value
+        wma_sum += price * 4.0
+        trailing_value = prices[trailing]
+        trailing += 1
+        smoothed = wma_sum * 0.1
+        wma_sum -= wma_sub
+        return smoothed
+
+    for price in prices[3:3 + warmup]:
+        smooth(price)
+    rad2deg = 180.0 / np.pi
+    detrender, q1, ji, jq = _Hilbert(), _Hilbert(), _Hilbert(), _Hilbert()
+    idx = 0
+    period = prev_i2 = prev_q2 = re = im = 0.0
+    i1_odd3 = i1_even3 = i1_odd2 = i1_even2 = 0.0
+    for today in range(3 + warmup, len(prices)):
+        adjusted = 0.075 * period + 0.54
+        smoothed = smooth(prices[today])
+        parity = today % 2
+        d = detrender(smoothed, parity, idx, adjusted)
+        q = q1(d, parity, idx, adjusted)
+        i1 = i1_odd3 if parity else i1_even3
+        j_i = ji(i1, parity, idx, adjusted)
+        j_q = jq(q, parity, idx, adjusted)
+        if parity:
+            i1_even3, i1_even2 = i1_even2, d
+        else:
+            idx = (idx + 1) % 3
+            i1_odd3, i1_odd2 = i1_odd2, d
+        q2 = 0.2 * (q + j_i) + 0.8 * prev_q2
+        i2 = 0.2 * (i1 - j_q) + 0.8 * prev_i2
+        re = 0.2 * (i2 * prev_i2 + q2 * prev_q2) + 0.8 * re
+        im = 0.2 * (i2 * prev_q2 - q2 * prev_i2) + 0.8 * im
+        prev_q2, prev_i2 = q2, i2
+        last = period
+        if im != 0.0 and re != 0.0:
+            period = 360.0 / (np.arctan(im / re) * rad2deg)
+        period = min(max(period, 0.67 * last), 1.5 * last)
+        period = min(max(period, 6.0), 50.0)
+        period = 0.2 * period + 0.8 * last
+        yield today, smoothed, i1, q, period
+
+
+def mama(values, fastlimit=0.5, slowlimit=0.05):
+    """ MESA adaptive moving average, returns (mama, fama); lookback of 32 bars """
+    x = np.asarray(values, dtype=np.float64)
+    out_mama = np.full(len(x), np.nan)
+    out_fama = np.full(len(x), np.nan)
+    if len(x) <= 32:
+        return out_mama, out_fama
+    rad2deg = 180.0 / np.pi
+    prices = x.tolist()
+    mama_value = fama_value = prev_phase = 0.0
+    for today, _, i1, q1, _ in _hilbert_bars(prices, 9):
+        phase = np.arctan(q1 / i1) * rad2deg if i1 != 0.0 else 0.0
+        delta = max(prev_phase - phase, 1.0)
+        prev_phase = phase
+        alpha = max(fastlimit / delta, slowlimit) if delta > 1.0 else fastlimit
+        mama_value = alpha * prices[today] + (1.0 - alpha) * mama_value
+        fama_value = 0.5 * alpha * mama_value + (1.0 - 0.5 * alpha) * fama_value
+        if today >= 32:
+            out_mama[today] = mama_value
+            out_fama[today] = fama_value
+    return out_mama, out_fama
+
+
+def moving_average(values, time_period, matype=SMA):
+    """ the moving average selected by an API matype code (0 = SMA ... 8 = T3) """
+    if matype == MAMA:
+        return _on_valid(values, lambda x: mama(x)[0])
+    if time_period == 1:
+        return np.array(values, dtype=np.float64)
+    kernels = {SMA: sma, EMA: ema, WMA: wma, DEMA: dema, TEMA: tema, TRIMA: trima, KAMA: kama, T3: t3}
+    return kernels[int(matype)](values, time_period)
+
+
+def _ma_lookback(time_period, matype):
+    """ bars moving_average() needs before its first value """
+    if matype == MAMA:
+        return 32
+    if time_period == 1:
+        return 0
+    return {DEMA: 2, TEMA: 3, T3: 6}.get(int(matype), 1) * (time_period - 1) + (matype == KAMA)
+
+
+def macdext(values, fastperiod=12, fastmatype=SMA, slowperiod=26, slowmatype=SMA, signalperiod=9, signalmatype=SMA):
+    """
+    MACD with any moving average types: (macd, signal, histogram). As in
+    TA-Lib both averages are started on the same bar, the first one the longer
+    lookback allows, which changes the recursive averages (EMA, KAMA, ...), and
+    every output waits for the signal line.
+    """
+    if slowperiod < fastperiod:
+        fastperiod, fastmatype, slowperiod, slowmatype = slowperiod, slowmatype, fastperiod, fastmatype
+    values = np.asarray(values, dtype=np.float64)
+    averages = ((fastperiod, fastmatype), (slowperiod, slowmatype))
+    start = max(_ma_lookback(*average) for average in averages)
+    fast, slow = np.full((2, len(values)), np.nan)
+    for out, (time_period, matype) in zip((fast, slow), averages):
+        offset = start - _ma_lookback(time_period, matype)
+        out[offset:] = moving_average(values[offset:], time_period, matype)
+    line = fast - slow
+    signal = moving_average(line, signalperiod, signalmatype)
+    line[np.isnan(signal)] = np.nan
+    return line, signal, line - signal
+
+
+def macd(values, fastperiod=12, slowperiod=26, signalperiod=9):
+    """ Moving Average Convergence/Divergence on EMAs: (macd, signal, histogram) """
+    return macdext(values, fastperiod, EMA, slowperiod, EMA, signalperiod, EMA)
+
+
+def _rolling(values, window, reduce):
+    """ reduce (np.max, np.min, ...) over every window of values, NaN before the first full one """
+    values = np.asarray(values, dtype=np.float64)
+    out = np.full(len(values), np.nan)
+    if len(values) >= window:
+        out[window - 1:] = reduce(np.lib.stride_tricks.sliding_window_view(values, window), axis=1)
+    return out
+
+
+def _ratio(numerator, denominator, scale=100.0):
+    """ scale * numerator / denominator, 0 where the denominator is 0 (TA-Lib's convention) """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(denominator == 0.0, 0.0, scale * numerator / denominator)
+
+
+def _mask_until(values, lookback):
+    values[:lookback] = np.nan
+    return values
+
+
+def _wilder_average(values, time_period):
+    """ Wilder's smoothing: mean of the first time_period values, then
+    y[t] = y[t-1] + (x[t] - y[t-1]) / time_period """
+    def kernel(x):
+        out = np.full(len(x), np.nan)
+        if len(x) >= time_period:
+            out[time_period - 1] = x[:time_period].mean()
+            out[time_period:] = _ema_filter(x[time_period:], 1.0 / time_period, out[time_period - 1])
+        return out
+    return _on_valid(values, kernel)
+
+
+def _wilder_sum(values, time_period):
+    """ Wilder's running sum: sum of the first time_period - 1 values, then
+    s[t] = s[t-1] - s[t-1] / time_period + x[t] """
+    def kernel(x):
+        out = np.full(len(x), np.nan)
+        if len(x) >= time_period:
+            out[time_period - 2] = x[:time_period - 1].sum()
+            alpha = 1.0 / time_period
+            out[time_period - 1:] = _ema_filter(x[time_period - 1:] * time_period, alpha, out[time_period - 2])
+        return out
+    return _on_valid(values, kernel)
+
+
+def rsi(values, time_period=14):
+    """ Relative Strength Index with Wilder's smoothing of gains and losses """
+    change = np.diff(np.asarray(values, dtype=np.float64), prepend=np.nan)
+    gain = _wilder_average(np.where(change < 0, 0.0, change), time_period)
+    loss = _wilder_average(np.where(change > 0, 0.0, -change), time_period)
+    total = gain + loss
+    with np.errstate(invalid='ignore'):
+        return np.where(np.abs(total) < 1e-8, 0.0, _ratio(gain, total))
+
+
+def _fast_k(high, low, close, period):
+    highest = _rolling(high, period, np.max)
+    lowest = _rolling(low, period, np.min)
+    return _ratio(np.asarray(close, dtype=np.float64) - lowest, highest - lowest)
+
+
+def stochf(high, low, close, fastkperiod=5, fastdperiod=3, fastdmatype=SMA):
+    """ fast stochastic, returns (fastk, fastd); both start where fastd does """
+    fastk = _fast_k(high, low, close, fastkperiod)
+    fastd = moving_average(fastk, fastdperiod, fastdmatype)
+    fastk[np.isnan(fastd)] = np.nan
+    return fastk, fastd
+
+
+def stoch(high, low, close, fastkperiod=5, slowkperiod=3, slowkmatype=SMA, slowdperiod=3, slowdmatype=SMA):
+    """ slow stochastic, returns (slowk, slowd); both start where slowd does """
+    slowk = moving_average(_fast_k(high, low, close, fastkperiod), slowkperiod, slowkmatype)
+    slowd = moving_average(slowk, slowdperiod, slowdmatype)
+    slowk[np.isnan(slowd)] = np.nan
+    return slowk, slowd
+
+
+def stochrsi(values, time_period=14, fastkperiod=5, fastdperiod=3, fastdmatype=SMA):
+    """ fast stochastic of the RSI, returns (fastk, fastd) """
+    strength = rsi(values, time_period)
+    return stochf(strength, strength, strength, fastkperiod, fastdperiod, fastdmatype)
+
+
+def willr(high, low, close, time_period=14):
+    """ Williams' %R, from 0 (at the period high) to -100 (at the low) """
+    highest = _rolling(high, time_period, np.max)
+    lowest = _rolling(low, time_period, np.min)
+    return _ratio(highest - np.asarray(close, dtype=np.float64), highest - lowest, -100.0)
+
+
+def mfi(high, low, close, volume, time_period=14):
+    """ Money Flow Index over typical-price money flow """
+    typical = (np.asarray(high, dtype=np.float64) + low + close) / 3.0
+    flow = typical * volume
+    change = np.diff(typical)
+    positive = _rolling(np.where(change > 0, flow[1:], 0.0), time_period, np.sum)
+    negative = _rolling(np.where(change < 0, flow[1:], 0.0), time_period, np.sum)
+    total = positive + negative
+    out = np.full(len(typical), np.nan)
+    with np.errstate(invalid='ignore'):
+        out[1:] = np.where(total < 1.0, 0.0, _ratio(positive, total))
+    return out
+
+
+def cci(high, low, close, time_period=14):
+    """ Commodity Channel Index: typical price against its mean, in mean deviations / 0.015 """
+    typical = (np.asarray(high, dtype=np.float64) + low + close) / 3.0
+    out = np.full(len(typical), np.nan)
+    if len(typical) < time_period:
+        return out
+    windows = np.lib.stride_tricks.sliding_window_view(typical, time_period)
+    mean = windows.mean(axis=1)
+    deviation = np.abs(windows - mean[:, None]).mean(axis=1)
+    distance = typical[time_period - 1:] - mean
+    with np.errstate(divide='ignore', invalid='ignore'):
+        out[time_period - 1:] = np.where((deviation == 0.0) | (distance == 0.0), 0.0,
+                                         distance / (0.015 * deviation))
+    return out
+
+
+def ultosc(high, low, close, timeperiod1=7, timeperiod2=14, timeperiod3=28):
+    """ Ultimate Oscillator: buying pressure over true range on three periods,
+    weighted 4:2:1 from the shortest to the longest """
+    high, low, close = (np.asarray(a, dtype=np.float64) for a in (high, low, close))
+    previous = close[:-1]
+    floor = np.minimum(low[1:], previous)
+    pressure = close[1:] - floor
+    true_range = np.maximum(high[1:], previous) - floor
+    shortest, middle, longest = sorted((timeperiod1, timeperiod2, timeperiod3))
+    out = np.full(len(close), np.nan)
+    if len(close) <= longest:
+        return out
+    terms = [_ratio(_rolling(pressure, p, np.sum), _rolling(true_range, p, np.sum), 1.0)[longest - 1:]
+             for p in (shortest, middle, longest)]
+    out[longest:] = 100.0 * (4.0 * terms[0] + 2.0 * terms[1] + terms[2]) / 7.0
+    return out
+
+
+def bbands(values, time_period=5, nbdevup=2.0, nbdevdn=2.0, matype=SMA):
+    """ Bollinger Bands: (upper, middle, lower), the moving average -/+ that many
+    population standard deviations of the last time_period values """
+    middle = moving_average(values, time_period, matype)
+    deviation = _rolling(values, time_period, np.std)
+    return middle + nbdevup * deviation, middle, middle - nbdevdn * deviation
+
+
+def obv(close, volume):
+    """ On Balance Volume: running total of volume, added on up closes and
+    subtracted on down closes, starting from the first bar's volume """
+    close, volume = np.asarray(close, dtype=np.float64), np.asarray(volume, dtype=np.float64)
+    out = np.empty(len(close))
+    if len(close):
+        out[0] = volume[0]
+        out[1:] = volume[0] + np.cumsum(np.sign(np.diff(close)) * volume[1:])
+    return out
+
+
+DIRECTIONAL = ('adx', 'adxr', 'dx', 'plus_di', 'minus_di', 'plus_dm', 'minus_dm', 'atr', 'natr', 'trange')
+
+
+def directional(high, low, close, time_period=14, outputs=DIRECTIONAL):
+    """
+    The directional movement and true range family in one pass over the bars:
+    {name: array} for the requested outputs (see DIRECTIONAL). True range,
+    the one-bar directional movements and their Wilder sums are computed once
+    and shared by everything that needs them.
+
+        family = directional(ts.high, ts.low, ts.close, 14, ('adx', 'plus_di', 'minus_di'))
+    """
+    if time_period < 2:
+        raise ValueError("time_period must be at least 2")
+    unknown = set(outputs) - set(DIRECTIONAL)
+    if unknown:
+        raise ValueError(f"Unknown outputs: {sorted(unknown)}")
+    high, low, close = (np.asarray(a, dtype=np.float64) for a in (high, low, close))
+    wanted = set(outputs)
+    out = {}
+
+    true_range = np.full(len(close), np.nan)
+    true_range[1:] = np.maximum.reduce([high[1:] - low[1:], np.abs(high[1:] - close[:-1]),
+                                        np.abs(low[1:] - close[:-1])])
+    out['trange'] = true_range
+    if wanted & {'atr', 'natr'}:
+        out['atr'] = _wilder_average(true_range, time_period)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            out['natr'] = np.where(close == 0.0, 0.0, 100.0 * out['atr'] / close)
+
+    if wanted & {'adx', 'adxr', 'dx', 'plus_di', 'minus_di', 'plus_dm', 'minus_dm'}:
+        up = np.diff(high, prepend=np.nan)
+        down = -np.diff(low, prepend=np.nan)
+        with np.errstate(invalid='ignore'):
+            plus_move = np.where((up > 0) & (up > down), up, 0.0)
+            minus_move = np.where((down > 0) & (down > up), down, 0.0)
+        plus_move[0] = minus_move[0] = np.nan  # no previous bar
+        plus_dm = out['plus_dm'] = _wilder_sum(plus_move, time_period)
+        minus_dm = out['minus_dm'] = _wilder_sum(minus_move, time_period)
+
+        # the DIs start one bar after the sums they are made of
+        range_sum = _mask_until(_wilder_sum(true_range, time_period), time_period)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            zero = np.abs(range_sum) < 1e-8
+            out['plus_di'] = np.where(zero, 0.0, 100.0 * plus_dm / range_sum)
+            out['minus_di'] = np.where(zero, 0.0, 100.0 * minus_dm / range_sum)
+            total = out['plus_di'] + out['minus_di']
+            spread = np.abs(out['plus_di'] - out['minus_di'])
+            out['dx'] = np.where(np.abs(total) < 1e-8, 0.0, 100.0 * spread / total)
+        out['dx'][np.isnan(range_sum)] = np.nan
+        out['adx'] = _wilder_average(out['dx'], time_period)
+        adxr = np.full(len(close), np.nan)
+        adxr[time_period - 1:] = (out['adx'][time_period - 1:] + out['adx'][:len(close) - time_period + 1]) / 2.0
+        out['adxr'] = adxr
+    return {name: out[name] for name in outputs}
+
+
+HILBERT = ('ht_trendline', 'sine', 'lead_sine', 'trendmode', 'dcperiod', 'ht_dcphase', 'phase', 'quadrature')
+HILBERT_LOOKBACK = {'dcperiod': 32, 'phase': 32, 'quadrature': 32}  # 63 for the rest
+
+
+def hilbert(values, outputs=HILBERT):
+    """
+    The Hilbert transform cycle indicators from one shared pipeline:
+    {name: array} for the requested outputs (see HILBERT).
+
+        ht_trendline        instantaneous trendline (HT_TRENDLINE)
+        sine, lead_sine     sine wave (HT_SINE)
+        trendmode           1 in a trend, 0 in a cycle (HT_TRENDMODE, int32; 0 in the lookback)
+        dcperiod            dominant cycle period (HT_DCPERIOD)
+        ht_dcphase          dominant cycle phase in degrees (HT_DCPHASE)
+        phase, quadrature   phasor components (HT_PHASOR)
+
+    As in TA-Lib, dcperiod and the phasor warm up for 32 bars and the others
+    for 63, so the pipeline runs at most twice: once per warm-up length needed.
+    """
+    unknown = set(outputs) - set(HILBERT)
+    if unknown:
+        raise ValueError(f"Unknown outputs: {sorted(unknown)}")
+    x = np.asarray(values, dtype=np.float64)
+    n = len(x)
+    out = {name: np.full(n, np.nan) for name in HILBERT}
+    out['trendmode'] = np.zeros(n, dtype=np.int32)
+    prices = x.tolist()
+    if any(name in HILBERT_LOOKBACK for name in outputs) and n > 32:
+        smooth_period = 0.0
+        for today, _, i1, q1, period in _hilbert_bars(prices, 9):
+            smooth_period = 0.33 * period + 0.67 * smooth_period
+            if today >= 32:
+                out['dcperiod'][today] = smooth_period
+                out['phase'][today] = i1
+                out['quadrature'][today] = q1
+    if any(name not in HILBERT_LOOKBACK for name in outputs) and n > 63:
+        _cycle_pass(x, prices, out)
+    return {name: out[name] for name in outputs}
+
+
+def _cycle_pass(x, prices, out):
+    """ phase, sine wave, trendline and trend mode (the 63 bar lookback outputs) """
+    rad2deg = 180.0 / np.pi
+    deg2rad = np.pi / 180.0
+    smoothed_prices = np.zeros(len(prices))
+    smooth_period = dc_phase = sine = lead_sine = 0.0
+    trend1 = trend2 = trend3 = 0.0
+    days_in_trend = 0
+    for today, smoothed, _, _, period in _hilbert_bars(prices, 34):
+        smoothed_prices[today] = smoothed
+        smooth_period = 0.33 * period + 0.67 * smooth_period
+        prev_phase = dc_phase
+        cycle = int(smooth_period + 0.5)
+        angles = np.arange(cycle) * (2.0 * np.pi / cycle) if cycle else np.empty(0)
+        window = smoothed_prices[today - cycle + 1:today + 1][::-1]
+        real = float(np.dot(np.sin(angles), window))
+        imag = float(np.dot(np.cos(angles), window))
+        if abs(imag) > 0.0:
+            dc_phase = np.arctan(real / imag) * rad2deg
+        elif real < 0.0:
+            dc_phase -= 90.0
+        elif real > 0.0:
+            dc_phase += 90.0
+        dc_phase += 90.0
+        dc_phase += 360.0 / smooth_period  # one bar lag of the WMA
+        if imag < 0.0:
+            dc_phase += 180.0
+        if dc_phase > 315.0:
+            dc_phase -= 360.0
+        prev_sine, prev_lead_sine = sine, lead_sine
+        sine = np.sin(dc_phase * deg2rad)
+        lead_sine = np.sin((dc_phase + 45.0) * deg2rad)
+
+        average = x[today - cycle + 1:today + 1].mean() if cycle else 0.0
+        trendline = (4.0 * average + 3.0 * trend1 + 2.0 * trend2 + trend3) / 10.0
+        trend1, trend2, trend3 = average, trend1, trend2
+
+        # trend unless the sine lines just crossed, the phase advances at the
+        # cycle's pace, and the price stays close to the trendline
+        trend = 1
+        if (sine > lead_sine and prev_sine <= prev_lead_sine) or (sine < lead_sine and prev_sine >= prev_lead_sine):
+            days_in_trend = 0
+            trend = 0
+        days_in_trend += 1
+        if days_in_trend < 0.5 * smooth_period:
+            trend = 0
+        step = dc_phase - prev_phase
+        if smooth_period != 0.0 and 0.67 * 360.0 / smooth_period < step < 1.5 * 360.0 / smooth_period:
+            trend = 0
+        if trendline != 0.0 and abs((smoothed - trendline) / trendline) >= 0.015:
+            trend = 1
+
+        if today >= 63:
+            out['ht_dcphase'][today] = dc_phase
+            out['sine'][today] = sine
+            out['lead_sine'][today] = lead_sine
+            out['ht_trendline'][today] = trendline
+            out['trendmode'][today] = trend
@@ -0,0 +1,83 @@
+import collections
+import datetime
+import threading
+import time
+
+from .errors import QuotaExceededError
+
+
+def _utc_today():
+    return datetime.datetime.now(datetime.timezone.utc).date()
+
+
+class RateLimiter:
+    """
+    Client-side quota guard shared by the sync and async clients.
+
+    The per-minute budget is a token bucket in which every token comes back
+    exactly 60 seconds after it was spent, so no rolling minute ever sees more
+    than calls_per_minute requests while a full budget can still be sent as a
+    burst. The per-day budget counts calls per UTC day, the way Alpha Vantage
+    resets its daily quota.
+
+    reserve() claims a call and returns how long to wait before sending it;
+    the caller sleeps (or awaits) that long. None disables a budget.
+    """
+    def __init__(self, calls_per_minute=None, calls_per_day=None):
+        self.calls_per_minute = calls_per_minute
+        self.calls_per_day = calls_per_day
+        self._lock = threading.Lock()
+        self._sent = collections.deque()  # scheduled send times of the last minute
+        self._day = None
+        self._day_count = 0
+
+    def _roll(self, now):
+        while self._sent and self._sent[0] <= now - 60:
+            self._sent.popleft()
+        today = _utc_today()
+        if today != self._day:
+            self._day = today
+            self._day_count = 0
+
+    def reserve(self):
+        """ claim one call and return the delay in seconds before it may be sent """
+        with self._lock:
+            now = time.monotonic()
+            self._roll(now)
+            if self.calls_per_day is not None and self._day_count >= self.calls_per_day:
+                raise QuotaExceededError(f"Daily budget of {self.calls_per_day} calls is spent, it resets at 00:00 UTC")
+            self._day_count += 1
+            if not self.calls_per_minute:
+                return 0.0
+            send_at = now
+            if len(self._sent) >= self.calls_per_minute:
+                send_at = max(now, self._sent[-self.calls_per_minute] + 60)
+            self._sent.append(send_at)
+            return send_at - now
+
+    def acquire(self):
+        """ blocking form of reserve() """
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self):
+        """ awaitable form of reserve() """
+        import asyncio
+
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def remaining(self):
+        """ calls that can be sent right now without waiting, per budget (None = unlimited) """
+        with self._lock:
+            now = time.monotonic()
+            self._roll(now)
+            minute = None
+            if self.calls_per_minute:
+                minute = max(0, self.calls_per_minute - sum(1 for t in self._sent if t > now - 60))
+            day = None
+            if self.calls_per_day is not None:
+                day = max(0, self.calls_per_day - self._day_count)
+            return {'minute': minute, 'day': day}
@@ -0,0 +1,445 @@
+"""
+Technical indicator endpoints answered on this machine.
+
+    av.local.sma('IBM', interval='daily', time_period=50, series_type='close')
+    av.local.kama('IBM', 'daily', 10, 'close')
+
+Each method takes the parameters of the Alpha_url method of the same name
+and returns a TimeSeries whose columns are named after the endpoint's output
+('sma', 'mama' / 'fama', ...), one row per price bar, NaN during the lookback.
+The prices come from av.price_series() (the local store if there is one,
+otherwise the caches and the network), so with a cache any number of
+indicators on a ticker and interval cost at most one call. A TimeSeries can
+be passed in place of the ticker to skip the fetch.
+
+evaluate() computes a whole list of indicators on one ticker, reading each
+distinct price series once:
+
+    run = av.local.evaluate('IBM', 'daily', ['rsi', ('macd', {'fastperiod': 8}),
+                                             {'function': 'bbands', 'time_period': 20},
+                                             ('sma', {'interval': 'weekly', 'time_period': 50})])
+    run.results['macd(fastperiod=8)']['macd_hist']
+    run.calls_saved                 # 2: four endpoint calls, two price series
+
+AsyncAlpha_url.local has the same methods as coroutines.
+
+Requires numpy.
+"""
+import asyncio
+import collections
+import functools
+import inspect
+
+import numpy as np
+
+from . import analytics, indicators
+from .series import TimeSeries
+
+
+class IndicatorPlan:
+    def __init__(self, ticker, interval, specs):
+        """
+        Indicator requests on one ticker grouped by the price series they read.
+
+        ticker:   symbol the indicators are for (or a TimeSeries of its prices).
+        interval: interval of every spec that does not name its own.
+        specs:    indicator names ('rsi'), (name, {arguments}) pairs or dicts
+                  with a 'function' key and the arguments, the arguments being
+                  those of the LocalIndicators method of that name.
+
+        groups maps each (interval, month) price series to the requests run on
+        it, {label: (method name, bound arguments)}. Identical requests are
+        computed once.
+        """
+        self.ticker = ticker
+        self.calls = len(specs)
+        self.groups = {}
+        for spec in specs:
+            name, options = self._spec(spec)
+            method = getattr(LocalIndicators, name, None)
+            if name.startswith('_') or name == 'evaluate' or method is None \
+                    or 'ticker' not in inspect.signature(method).parameters:
+                raise ValueError(f"No local indicator named {name}")
+            bound = inspect.signature(method).bind(None, ticker, **dict({'interval': interval}, **options))
+            bound.apply_defaults()
+            key = (bound.arguments['interval'], bound.arguments.get('month'))
+            label = name + (f"({','.join(f'{k}={v}' for k, v in options.items())})" if options else '')
+            self.groups.setdefault(key, {})[label] = (name, bound)
+
+    @staticmethod
+    def _spec(spec):
+        if isinstance(spec, str):
+            return spec.lower(), {}
+        if isinstance(spec, dict):
+            options = dict(spec)
+            return options.pop('function').lower(), options
+        name, options = spec
+        return name.lower(), dict(options)
+
+    @property
+    def fetches(self):
+        """ distinct price series the plan reads """
+        return len(self.groups)
+
+
+class PlanResult(collections.namedtuple('PlanResult', 'results calls fetches')):
+    """ outcome of LocalIndicators.evaluate: {label: TimeSeries}, the endpoint
+    calls the specs stand for and the price series actually read """
+    __slots__ = ()
+
+    @property
+    def calls_saved(self):
+        return self.calls - self.fetches
+
+
+class LocalIndicators:
+    def __init__(self, client):
+        """
+        client: Alpha_url the price series are fetched with.
+        """
+        self.client = client
+
+    def _prices(self, ticker, interval, month=None):
+        if isinstance(ticker, TimeSeries):
+            return ticker
+        return self.client.price_series(ticker, interval, month)
+
+    def _price_table(self, symbols, interval):
+        """ {symbol: TimeSeries}, fetched in parallel """
+        results = self.client.fetch_many('price_series', [(symbol, interval) for symbol in symbols])
+        for result in results:
+            if not result.ok:
+                raise result.error
+        return {symbol: result.value for symbol, result in zip(symbols, results)}
+
+    def _price_groups(self, ticker, keys):
+        """ {(interval, month): TimeSeries}, fetched in parallel """
+        if isinstance(ticker, TimeSeries):
+            return dict.fromkeys(keys, ticker)
+        results = self.client.fetch_many('price_series', [(ticker,) + key for key in keys])
+        for result in results:
+            if not result.ok:
+                raise result.error
+        return {key: result.value for key, result in zip(keys, results)}
+
+    @staticmethod
+    def _result(prices, ticker, **columns):
+        meta = {'symbol': ticker} if isinstance(ticker, str) else prices.meta
+        return TimeSeries(prices.timestamps, columns, meta)
+
+    def sma(self, ticker, interval='weekly', time_period=10, series_type='open', month=None, datatype='csv'):
+        """ Simple Moving Average (datatype is accepted for compatibility and ignored) """
+        prices = self._prices(ticker, interval, month)
+        return self._result(prices, ticker, sma=indicators.sma(prices[series_type], time_period))
+
+    def ema(self, ticker, interval='weekly', time_period=10, series_type='open', month=None, datatype='csv'):
+        """ Exponential Moving Average """
+        prices = self._prices(ticker, interval, month)
+        return self._result(prices, ticker, ema=indicators.ema(prices[series_type], time_period))
+
+    def wma(self, ticker, interval='weekly', time_period=10, series_type='open', month=None, datatype='csv'):
+        """ Weighted Moving Average """
+        prices = self._prices(ticker, interval, month)
+        return self._result(prices, ticker, wma=indicators.wma(prices[series_type], time_period))
+
+    def dema(self, ticker, interval='weekly', time_period=10, series_type='open', month=None, datatype='csv'):
+        """ Double Exponential Moving Average """
+        prices = self._prices(ticker, interval, month)
+        return self._result(prices, ticker, dema=indicators.dema(prices[series_type], time_period))
+
+    def tema(self, ticker, interval='weekly', time_period=10, series_type='open', month=None, datatype='csv'):
+        """ Triple Exponential Moving Average """
+        prices = self._prices(ticker, interval, month)
+        return self._result(prices, ticker, tema=indicators.tema(prices[series_type], time_period))
+
+    def trima(self, ticker, interval='weekly', time_period=10, series_type='open', month=None, datatype='csv'):
+        """ Triangular Moving Average """
+        prices = self._prices(ticker, interval, month)
+        return self._result(prices, ticker, trima=indicators.trima(prices[series_type], time_period))
+
+    def kama(self, ticker, interval='weekly', time_period=10, series_type='open', month=None, datatype='csv'):
+        """ Kaufman Adaptive Moving Average """
+        prices = self._prices(ticker, interval, month)
+        return self._result(prices, ticker, kama=indicators.kama(prices[series_type], time_period))
+
+    def mama(self, ticker, interval='daily', series_type='close', fastlimit=0.02, slowlimit=0.02, month=None,
+             datatype='csv'):
+        """ MESA Adaptive Moving Average, columns mama and fama """
+        prices = self._prices(ticker, interval, month)
+        mama, fama = indicators.mama(prices[series_type], fastlimit, slowlimit)
+        return self._result(prices, ticker, mama=mama, fama=fama)
+
+    def t3(self, ticker, interval='weekly', time_period=10, series_type='close', month=None, datatype='csv'):
+        """ Tillson T3 (volume factor 0.7) """
+        prices = self._prices(ticker, interval, month)
+        return self._result(prices, ticker, t3=indicators.t3(prices[series_type], time_period))
+
+    def macd(self, ticker, interval='daily', series_type='close', fastperiod=12, slowperiod=26, signalperiod=9,
+             month=None, datatype='csv'):
+        """ Moving Average Convergence/Divergence, columns macd, macd_signal and macd_hist """
+        prices = self._prices(ticker, interval, month)
+        line, signal, hist = indicators.macd(prices[series_type], fastperiod, slowperiod, signalperiod)
+        return self._result(prices, ticker, macd=line, macd_signal=signal, macd_hist=hist)
+
+    def macdext(self, ticker, interval='daily', series_type='close', fastperiod=12, slowperiod=26, signalperiod=9,
+                fastmatype=0, slowmatype=0, signalmatype=0, month=None, datatype='csv', apikey=None):
+        """ MACD with controllable moving average types, columns as for macd """
+        prices = self._prices(ticker, interval, month)
+        line, signal, hist = indicators.macdext(prices[series_type], fastperiod, fastmatype, slowperiod, slowmatype,
+                                                signalperiod, signalmatype)
+        return self._result(prices, ticker, macd=line, macd_signal=signal, macd_hist=hist)
+
+    def bbands(self, ticker, interval='weekly', time_period=5, series_type='close', nbdevup=3, nbdevdn=3, matype=0,
+               datatype='csv'):
+        """ Bollinger Bands, columns real_upper_band, real_middle_band and real_lower_band """
+        prices = self._prices(ticker, interval)
+        upper, middle, lower = indicators.bbands(prices[series_type], time_period, nbdevup, nbdevdn, matype)
+        return self._result(prices, ticker, real_upper_band=upper, real_middle_band=middle, real_lower_band=lower)
+
+    def rsi(self, ticker, interval='daily', time_period=14, series_type='close', datatype='csv'):
+        """ Relative Strength Index """
+        prices = self._prices(ticker, interval)
+        return self._result(prices, ticker, rsi=indicators.rsi(prices[series_type], time_period))
+
+    def stoch(self, ticker, interval='daily', fastkperiod=5, slowkperiod=3, slowdperiod=3,
+              slowkmatype=0, slowdmatype=0, month=None, datatype='csv'):
+        """ Stochastic Oscillator, columns slowk and slowd """
+        prices = self._prices(ticker, interval, month)
+        slowk, slowd = indicators.stoch(prices.high, prices.low, prices.close, fastkperiod,
+                                        slowkperiod, slowkmatype, slowdperiod, slowdmatype)
+        return self._result(prices, ticker, slowk=slowk, slowd=slowd)
+
+    def stochf(self, ticker, interval='daily', fastkperiod=5, fastdperiod=3, fastdmatype=0, month=None,
+               datatype='csv', apikey=None):
+        """ Stochastic Fast, columns fastk and fastd """
+        prices = self._prices(ticker, interval, month)
+        fastk, fastd = indicators.stochf(prices.high, prices.low, prices.close, fastkperiod, fastdperiod, fastdmatype)
+        return self._result(prices, ticker, fastk=fastk, fastd=fastd)
+
+    def stochrsi(self, ticker, interval='daily', time_period=14, series_type='close', fastkperiod=5, fastdperiod=3,
+                 fastdmatype=0, datatype='csv'):
+        """ Stochastic RSI, columns fastk and fastd """
+        prices = self._prices(ticker, interval)
+        fastk, fastd = indicators.stochrsi(prices[series_type], time_period, fastkperiod, fastdperiod, fastdmatype)
+        return self._result(prices, ticker, fastk=fastk, fastd=fastd)
+
+    def willr(self, ticker, interval='daily', time_period=14, datatype='csv'):
+        """ Williams' %R """
+        prices = self._prices(ticker, interval)
+        return self._result(prices, ticker, willr=indicators.willr(prices.high, prices.low, prices.close, time_period))
+
+    def mfi(self, ticker, interval='daily', time_period=10, datatype='csv'):
+        """ Money Flow Index """
+        prices = self._prices(ticker, interval)
+        return self._result(prices, ticker, mfi=indicators.mfi(prices.high, prices.low, prices.close, prices.volume,
+                                                               time_period))
+
+    def cci(self, ticker, interval='daily', time_period=14, datatype='csv'):
+        """ Commodity Channel Index """
+        prices = self._prices(ticker, interval)
+        return self._result(prices, ticker, cci=indicators.cci(prices.high, prices.low, prices.close, time_period))
+
+    def ultosc(self, ticker, interval='daily', timeperiod1=8, timeperiod2=14, timeperiod3=28, datatype='csv'):
+        """ Ultimate Oscillator """
+        prices = self._prices(ticker, interval)
+        return self._result(prices, ticker, ultosc=indicators.ultosc(prices.high, prices.low, prices.close,
+                                                                     timeperiod1, timeperiod2, timeperiod3))
+
+    def obv(self, ticker, interval='daily', month=None, datatype='csv'):
+        """ On Balance Volume """
+        prices = self._prices(ticker, interval, month)
+        return self._result(prices, ticker, obv=indicators.obv(prices.close, prices.volume))
+
+    def directional(self, ticker, interval='daily', time_period=14, outputs=indicators.DIRECTIONAL):
+        """
+        Any of adx, adxr, dx, plus_di, minus_di, plus_dm, minus_dm, atr, natr
+        and trange in one pass over the prices, as columns of one TimeSeries.
+
+            av.local.directional('IBM', 'daily', 14, ('adx', 'plus_di', 'minus_di'))
+        """
+        prices = self._prices(ticker, interval)
+        family = indicators.directional(prices.high, prices.low, prices.close, time_period, outputs)
+        return self._result(prices, ticker, **family)
+
+    def _directional(self, name, ticker, interval, time_period, month=None):
+        prices = self._prices(ticker, interval, month)
+        family = indicators.directional(prices.high, prices.low, prices.close, time_period, (name,))
+        return self._result(prices, ticker, **family)
+
+    def adx(self, ticker, interval='daily', time_period=14, datatype='csv'):
+        """ Average Directional Movement Index """
+        return self._directional('adx', ticker, interval, time_period)
+
+    def adxr(self, ticker, interval='daily', time_period=14, datatype='csv'):
+        """ Average Directional Movement Index Rating """
+        return self._directional('adxr', ticker, interval, time_period)
+
+    def dx(self, ticker, interval='daily', time_period=10, datatype='csv'):
+        """ Directional Movement Index """
+        return self._directional('dx', ticker, interval, time_period)
+
+    def minus_di(self, ticker, interval='weekly', time_period=10, datatype='csv'):
+        """ Minus Directional Indicator """
+        return self._directional('minus_di', ticker, interval, time_period)
+
+    def plus_di(self, ticker, interval='daily', time_period=10, datatype='csv'):
+        """ Plus Directional Indicator """
+        return self._directional('plus_di', ticker, interval, time_period)
+
+    def minus_dm(self, ticker, interval='daily', time_period=10, datatype='csv'):
+        """ Minus Directional Movement """
+        return self._directional('minus_dm', ticker, interval, time_period)
+
+    def plus_dm(self, ticker, interval='daily', time_period=10, datatype='csv'):
+        """ Plus Directional Movement """
+        return self._directional('plus_dm', ticker, interval, time_period)
+
+    def trange(self, ticker, interval='daily', datatype='csv'):
+        """ True Range """
+        prices = self._prices(ticker, interval)
+        return self._result(prices, ticker, **indicators.directional(prices.high, prices.low, prices.close,
+                                                                     outputs=('trange',)))
+
+    def atr(self, ticker, interval='daily', time_period=14, datatype='csv'):
+        """ Average True Range """
+        return self._directional('atr', ticker, interval, time_period)
+
+    def natr(self, ticker, interval='weekly', time_period=14, month=None, datatype='csv'):
+        """ Normalized Average True Range """
+        return self._directional('natr', ticker, interval, time_period, month)
+
+    def hilbert(self, ticker, interval='daily', series_type='close', outputs=indicators.HILBERT, month=None):
+        """
+        Any of the Hilbert transform outputs (ht_trendline, sine, lead_sine,
+        trendmode, dcperiod, ht_dcphase, phase, quadrature) from one shared
+        pipeline, as columns of one TimeSeries. trendmode is NaN in its lookback.
+        """
+        return self._hilbert(ticker, interval, series_type, outputs, month)
+
+    def _hilbert(self, ticker, interval, series_type, outputs, month=None):
+        prices = self._prices(ticker, interval, month)
+        cycle = indicators.hilbert(prices[series_type], outputs)
+        if 'trendmode' in cycle:
+            trendmode = cycle['trendmode'].astype(float)
+            trendmode[:63] = np.nan
+            cycle['trendmode'] = trendmode
+        return self._result(prices, ticker, **cycle)
+
+    def ht_trendline(self, ticker, interval='daily', series_type='close', month=None, datatype='csv'):
+        """ Hilbert Transform, Instantaneous Trendline """
+        return self._hilbert(ticker, interval, series_type, ('ht_trendline',), month)
+
+    def ht_sine(self, ticker, interval='daily', series_type='close', month=None, datatype='csv'):
+        """ Hilbert Transform, Sine Wave: columns sine and lead_sine """
+        return self._hilbert(ticker, interval, series_type, ('sine', 'lead_sine'), month)
+
+    def ht_trendmode(self, ticker, interval='weekly', series_type='close'):
+        """ Hilbert Transform, Trend vs Cycle Mode """
+        return self._hilbert(ticker, interval, series_type, ('trendmode',))
+
+    def ht_dcperiod(self, ticker, interval='daily', series_type='close'):
+        """ Hilbert Transform, Dominant Cycle Period """
+        return self._hilbert(ticker, interval, series_type, ('dcperiod',))
+
+    def ht_dcphase(self, ticker, interval='daily', series_type='close'):
+        """ Hilbert Transform, Dominant Cycle Phase """
+        return self._hilbert(ticker, interval, series_type, ('ht_dcphase',))
+
+    def ht_phasor(self, ticker, interval='weekly', series_type='close'):
+        """ Hilbert Transform, Phasor Components: columns phase and quadrature """
+        return self._hilbert(ticker, interval, series_type, ('phase', 'quadrature'))
+
+    def evaluate(self, ticker, interval, specs):
+        """
+        Every indicator in specs (see IndicatorPlan) on ticker, each distinct
+        price series fetched once, as a PlanResult whose results are keyed by
+        label: the name, followed by the arguments given, 'macd(fastperiod=8)'.
+        """
+        plan = IndicatorPlan(ticker, interval, specs)
+        prices = self._price_groups(ticker, list(plan.groups))
+        results = {}
+        for key, requests in plan.groups.items():
+            for label, (name, bound) in requests.items():
+                bound.arguments.update(self=self, ticker=prices[key])
+                result = getattr(LocalIndicators, name)(*bound.args, **bound.kwargs)
+                if isinstance(ticker, str):
+                    result.meta = dict(result.meta, symbol=ticker)
+                results[label] = result
+        return PlanResult(results, plan.calls, 0 if isinstance(ticker, TimeSeries) else plan.fetches)
+
+    def advanced_analytics_fixed_window(self, tickers, range1='full', range2=None, calculations='MEAN',
+                                        ohlc='close', interval='DAILY'):
+        """
+        advanced_analytics_fixed_window computed locally (see AlphaUrl.analytics),
+        for any number of symbols. Arguments are those of the endpoint method;
+        the '&OHLC=close' style is accepted as well. Returns the endpoint's
+        layout instead of printing it.
+        """
+        symbols = analytics.symbols_of(tickers)
+        prices = self._price_table(symbols, analytics.unprefixed(interval, '&INTERVAL=').lower())
+        symbols, timestamps, matrix = analytics.align(prices, ohlc)
+        timestamps, matrix = analytics.select_range(timestamps, matrix, range1, range2)
+        return analytics.fixed_window(symbols, timestamps, matrix, calculations, interval, ohlc)
+
+    def advanced_analytics_sliding_window(self, tickers, range1='full', range2=None, calculations='MEAN',
+                                          ohlc='close', interval='DAILY', window_size=20):
+        """
+        advanced_analytics_sliding_window computed locally with running sums
+        (see AlphaUrl.analytics.sliding_window), arguments as for the endpoint
+        method ('&WINDOW_SIZE=20' style included).
+        """
+        symbols = analytics.symbols_of(tickers)
+        prices = self._price_table(symbols, analytics.unprefixed(interval, '&INTERVAL=').lower())
+        symbols, timestamps, matrix = analytics.align(prices, ohlc)
+        timestamps, matrix = analytics.select_range(timestamps, matrix, range1, range2)
+        return analytics.sliding_window(symbols, timestamps, matrix, calculations, window_size, interval, ohlc)
+
+
+class AsyncLocalIndicators(LocalIndicators):
+    """ LocalIndicators for AsyncAlpha_url: the price series is awaited, the math is the same """
+    _awaited = None
+
+    def _prices(self, ticker, interval, month=None):
+        return ticker if isinstance(ticker, TimeSeries) else self._awaited
+
+    def _price_table(self, symbols, interval):
+        return self._awaited
+
+    def _price_groups(self, ticker, keys):
+        return dict.fromkeys(keys, ticker) if isinstance(ticker, TimeSeries) else self._awaited
+
+
+def _awaiting_prices(name):
+    method = getattr(LocalIndicators, name)
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    async def indicator(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        values = bound.arguments
+        if 'tickers' in values:
+            symbols = analytics.symbols_of(values['tickers'])
+            interval = analytics.unprefixed(values['interval'], '&INTERVAL=').lower()
+            series = await asyncio.gather(*(self.client.price_series(symbol, interval) for symbol in symbols))
+            prices = dict(zip(symbols, series))
+        elif 'specs' in values and not isinstance(values['ticker'], TimeSeries):
+            keys = list(IndicatorPlan(values['ticker'], values['interval'], values['specs']).groups)
+            series = await asyncio.gather(*(self.client.price_series(values['ticker'], *key) for key in keys))
+            prices = dict(zip(keys, series))
+        elif not isinstance(values['ticker'], TimeSeries):
+            prices = await self.client.price_series(values['ticker'], values['interval'], values.get('month'))
+        if 'tickers' in values or not isinstance(values['ticker'], TimeSeries):
+            # no await from here on, so no other call can see _awaited
+            self._awaited = prices
+        try:
+            return method(*bound.args, **bound.kwargs)
+        finally:
+            self._awaited = None
+
+    return indicator
+
+
+for _name in dir(LocalIndicators):
+    if not _name.startswith('_'):
+        setattr(AsyncLocalIndicators, _name, _awaiting_prices(_name))
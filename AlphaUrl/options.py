@@ -0,0 +1,462 @@
+"""
+Option chains held column-wise.
+
+    chain = av.options_history('IBM', '2015-01-01', '2024-12-31')
+    chain.save('~/alphaurl-data/IBM.options')
+    chain = OptionChain.load('~/alphaurl-data/IBM.options')   # memory-mapped, nothing parsed
+    day = chain.on('2024-06-14')
+    day['strike'], day['delta'], day['type']
+
+Text columns (contractID, symbol, expiration, type, date) are dictionary
+encoded: one sorted array of the distinct values per column and the smallest
+integer codes that index it. Prices and greeks are float32 arrays ('' or '.'
+read as NaN); volume, open interest and the bid / ask sizes are int64, which
+float32 would round above 2**24, with -1 marking a missing count. A row costs
+about 90 bytes instead of a dict of twenty strings, so ten years of a large chain fit in memory, and a saved chain
+loads as a handful of memory-mapped files.
+
+Rows are sorted by date, expiration, type and strike, so each date is one
+contiguous slice. options_history() fetches the trading days of a range in
+parallel (one historical_options call each) and parses each day as it
+arrives; with a disk cache, days already fetched are never asked for again.
+
+IndexedChain answers queries on one snapshot from a sorted index built once,
+instead of scanning rows, and diffs consecutive snapshots:
+
+    chain = av.option_chain('IBM')                  # realtime_options, indexed
+    puts = chain.select(dte=(30, 45), type='put', spot=187.5, within=0.05)
+    chain.strikes('2024-07-19', 'call')
+    changes = av.option_chain('IBM').diff(chain)    # added / removed / changed contracts
+
+    history = IndexedChain(OptionChain.load('~/alphaurl-data/IBM.options').on('2024-06-14'))
+
+Requires numpy.
+"""
+import collections
+import io
+import json
+import os
+import shutil
+
+import numpy as np
+
+FLOAT = np.float32
+COUNT = np.int64
+MISSING_COUNT = -1
+COUNT_COLUMNS = ('volume', 'open_interest', 'bid_size', 'ask_size')
+DATE_COLUMNS = ('date', 'expiration')  # encoded columns whose values are datetime64[D]
+SORT_ORDER = ('date', 'expiration', 'type', 'strike', 'contractID')
+META = 'meta.json'
+
+
+def _floats(values, dtype=FLOAT):
+    """ str column -> dtype, '' and '.' marking a missing value """
+    values = np.where((values == '') | (values == '.'), 'nan', values)
+    return values.astype(dtype)
+
+
+def _counts(values):
+    """ str column of contract counts -> COUNT with MISSING_COUNT for a missing
+    value; FLOAT if the column holds fractions after all """
+    numbers = _floats(values, np.float64)
+    missing = np.isnan(numbers)
+    if (numbers[~missing] % 1).any():
+        return numbers.astype(FLOAT)
+    return np.where(missing, MISSING_COUNT, numbers).astype(COUNT)
+
+
+def _numbers(values):
+    """ a column as float64 for arithmetic, missing counts as NaN """
+    if values.dtype == COUNT:
+        return np.where(values == MISSING_COUNT, np.nan, values)
+    return values.astype(np.float64)
+
+
+def _code_dtype(size):
+    """ smallest signed integer type indexing size categories """
+    for dtype in (np.int8, np.int16, np.int32):
+        if size <= np.iinfo(dtype).max:
+            return dtype
+    return np.int64
+
+
+def _encode(name, values):
+    """ (categories, codes) of a text column """
+    categories, codes = np.unique(values, return_inverse=True)
+    if name in DATE_COLUMNS:
+        categories = categories.astype('datetime64[D]')
+    elif len(categories):
+        # str arrays parsed from one table share its widest field's width
+        categories = categories.astype(f'U{max(np.char.str_len(categories).max(), 1)}')
+    return categories, codes.astype(_code_dtype(len(categories)))
+
+
+def trading_days(start, end):
+    """ 'YYYY-MM-DD' strings of the weekdays from start to end inclusive """
+    days = np.arange(np.datetime64(start, 'D'), np.datetime64(end, 'D') + 1)
+    return [str(day) for day in days[np.is_busday(days)]]
+
+
+class OptionChain:
+    def __init__(self, columns, categories=None, meta=None):
+        """
+        columns:    {name: array} in column order, FLOAT values, COUNT counts or
+                    integer codes.
+        categories: {name: sorted array of distinct values} of the encoded columns.
+        meta:       descriptive fields, e.g. {'symbol': 'IBM'}.
+        """
+        self.columns = columns
+        self.categories = categories or {}
+        self.meta = meta or {}
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def __getitem__(self, item):
+        """ chain['strike'] is a column (decoded for encoded ones), chain[mask] /
+        chain[10:20] an OptionChain of those rows sharing the dictionaries """
+        if isinstance(item, str):
+            if item in self.categories:
+                return self.categories[item][self.columns[item]]
+            return self.columns[item]
+        return OptionChain({k: v[item] for k, v in self.columns.items()}, self.categories, self.meta)
+
+    def __repr__(self):
+        if not len(self):
+            return 'OptionChain(empty)'
+        dates = self.dates
+        return (f"OptionChain({self.meta.get('symbol', '?')}, {len(self)} rows, {len(dates)} dates "
+                f"{dates[0]} .. {dates[-1]}, {self.nbytes / 1e6:.1f} MB)")
+
+    @property
+    def nbytes(self):
+        return sum(v.nbytes for v in self.columns.values()) + sum(v.nbytes for v in self.categories.values())
+
+    @property
+    def dates(self):
+        """ datetime64[D] of the snapshots held, ascending """
+        if 'date' not in self.columns:
+            return np.empty(0, 'datetime64[D]')
+        return self.categories['date'][np.unique(self.columns['date'])]
+
+    def on(self, date):
+        """ rows of one snapshot date, a slice of views """
+        categories = self.categories.get('date')
+        if categories is None:
+            return self[0:0]
+        code = np.searchsorted(categories, np.datetime64(date, 'D'))
+        if code == len(categories) or categories[code] != np.datetime64(date, 'D'):
+            return self[0:0]
+        codes = self.columns['date']
+        return self[np.searchsorted(codes, code, 'left'):np.searchsorted(codes, code, 'right')]
+
+    @classmethod
+    def from_table(cls, header, table):
+        """ chain from column names and a 2-d str array of rows """
+        columns, categories = {}, {}
+        for i, name in enumerate(header):
+            values = table[:, i]
+            if name not in DATE_COLUMNS:
+                try:
+                    columns[name] = _counts(values) if name in COUNT_COLUMNS else _floats(values)
+                    continue
+                except ValueError:
+                    pass  # a text column
+            categories[name], columns[name] = _encode(name, values)
+        meta = {}
+        if 'symbol' in categories and len(categories['symbol']) == 1:
+            meta['symbol'] = str(categories['symbol'][0])
+        return cls(columns, categories, meta)._sorted()
+
+    @classmethod
+    def from_csv(cls, text):
+        """ chain from the CSV text of a historical_options / realtime_options response """
+        header, _, body = text.partition('\n')
+        header = [name.strip() for name in header.split(',')]
+        if not body.strip():
+            return cls({})
+        table = np.loadtxt(io.StringIO(body), delimiter=',', dtype=str, ndmin=2, comments=None)
+        return cls.from_table(header, table)
+
+    @classmethod
+    def from_records(cls, rows):
+        """ chain from the list of dicts historical_options / realtime_options return """
+        if not rows:
+            return cls({})
+        header = list(rows[0])
+        table = np.array([[row.get(name) or '' for name in header] for row in rows], dtype=str)
+        return cls.from_table(header, table.reshape(len(rows), len(header)))
+
+    @classmethod
+    def concat(cls, chains):
+        """
+        One chain from several (e.g. one per date): dictionaries are merged,
+        rows sorted and a contract present twice on the same date is kept once
+        (from the later chain). Only columns every chain has, encoded alike,
+        are kept.
+        """
+        chains = [c for c in chains if len(c)]
+        if not chains:
+            return cls({})
+        first = chains[0]
+        names = [n for n in first.columns
+                 if all(n in c.columns and (n in c.categories) == (n in first.categories) for c in chains[1:])]
+        columns, categories = {}, {}
+        for name in names:
+            if name in first.categories:
+                merged = np.unique(np.concatenate([c.categories[name] for c in chains]))
+                dtype = _code_dtype(len(merged))
+                categories[name] = merged
+                columns[name] = np.concatenate([
+                    np.searchsorted(merged, c.categories[name]).astype(dtype)[c.columns[name]] for c in chains])
+            else:
+                columns[name] = np.concatenate([c.columns[name] for c in chains])
+        return cls(columns, categories, chains[-1].meta)._sorted()
+
+    def _sorted(self):
+        """ rows in SORT_ORDER, one row per (date, contractID) """
+        keys = [self.columns[name] for name in reversed(SORT_ORDER) if name in self.columns]
+        if not keys or not len(self):
+            return self
+        order = np.lexsort(keys)
+        chain = OptionChain({k: v[order] for k, v in self.columns.items()}, self.categories, self.meta)
+        if 'date' in chain.columns and 'contractID' in chain.columns:
+            date, contract = chain.columns['date'], chain.columns['contractID']
+            keep = np.append((date[1:] != date[:-1]) | (contract[1:] != contract[:-1]), True)
+            if not keep.all():
+                chain = chain[keep]
+        return chain
+
+    def save(self, path):
+        """ write the chain to directory path (replaced whole): one .npy file per
+        column and per dictionary, plus meta.json """
+        path = os.path.expanduser(path)
+        tmp = path + '.tmp'
+        shutil.rmtree(tmp, ignore_errors=True)
+        os.makedirs(tmp)
+        for name, values in self.columns.items():
+            np.save(os.path.join(tmp, f'{name}.npy'), values)
+        for name, values in self.categories.items():
+            np.save(os.path.join(tmp, f'{name}.categories.npy'), values)
+        with open(os.path.join(tmp, META), 'w') as f:
+            json.dump({'rows': len(self), 'columns': list(self.columns), 'encoded': list(self.categories),
+                       'meta': self.meta}, f)
+        shutil.rmtree(path, ignore_errors=True)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """ chain saved by save(); columns are memory-mapped unless mmap=False """
+        path = os.path.expanduser(path)
+        with open(os.path.join(path, META)) as f:
+            info = json.load(f)
+        mode = 'r' if mmap else None
+        columns = {name: np.load(os.path.join(path, f'{name}.npy'), mmap_mode=mode) for name in info['columns']}
+        categories = {name: np.load(os.path.join(path, f'{name}.categories.npy')) for name in info['encoded']}
+        return cls(columns, categories, info['meta'])
+
+
+ChainDiff = collections.namedtuple('ChainDiff', 'added removed changed deltas')
+DIFF_COLUMNS = ('last', 'mark', 'bid', 'ask', 'bid_size', 'ask_size', 'volume', 'open_interest')
+
+
+def _ranges(starts, ends):
+    """ concatenated np.arange(start, end) of every pair, without a Python loop """
+    lengths = np.maximum(ends - starts, 0)
+    total = int(lengths.sum())
+    if not total:
+        return np.empty(0, np.intp)
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return offsets + np.arange(total)
+
+
+def _bounds(bounds):
+    """ (lo, hi) of a value or (lo, hi) pair, None meaning unbounded """
+    if isinstance(bounds, (tuple, list)):
+        lo, hi = bounds
+        return lo, hi
+    return bounds, bounds
+
+
+def _stored(value):
+    """ a float bound rounded as the columns store it (100.1 -> FLOAT(100.1)), so equal values compare equal """
+    return None if value is None else float(FLOAT(value))
+
+
+class IndexedChain:
+    def __init__(self, chain, as_of=None):
+        """
+        Sorted index over one option chain snapshot.
+
+        chain: OptionChain of a single date (chain.on(date), or a realtime_options
+               answer, see Alpha_url.option_chain).
+        as_of: date days to expiration count from (default: the snapshot's
+               date, today when the chain has none).
+
+        Within a snapshot rows are ordered by expiration, type and strike, so
+        every (expiration, type) pair is one block of ascending strikes. The
+        index keeps the blocks and one ascending float64 key, block number
+        scaled past the strike range plus strike, so a selection by
+        expiration / days to expiration, type and strike is a few
+        searchsorted calls however large the chain; other column ranges are
+        vectorized masks over the rows those leave.
+        """
+        if 'date' in chain.columns and len(chain.dates) > 1:
+            raise ValueError("IndexedChain takes one snapshot, select a date with chain.on(date)")
+        self.chain = chain = chain._sorted()
+        if as_of is None:
+            as_of = chain.dates[0] if len(chain.dates) else np.datetime64('today', 'D')
+        self.as_of = np.datetime64(as_of, 'D')
+        rows = len(chain)
+        if rows:
+            expiration, kind = chain.columns['expiration'], chain.columns['type']
+            strike = chain.columns['strike'].astype(np.float64)
+            starts = np.flatnonzero(np.r_[True, (expiration[1:] != expiration[:-1]) | (kind[1:] != kind[:-1])])
+        else:
+            # a header-only answer parses to a chain without columns
+            expiration = kind = starts = np.empty(0, np.intp)
+            strike = np.empty(0)
+        self._starts = starts
+        self._ends = np.append(starts[1:], rows)
+        self._expiration = expiration[starts]
+        self._type = kind[starts]
+        self._low = np.nanmin(strike) if rows and not np.isnan(strike).all() else 0.0
+        self._span = (np.nanmax(strike) - self._low + 1) if rows and not np.isnan(strike).all() else 1.0
+        block = np.repeat(np.arange(len(starts)), self._ends - starts)
+        # NaN strikes sort last in their block
+        self._key = block * self._span + np.nan_to_num(strike - self._low, nan=self._span - 0.5)
+        self._ids = None
+
+    def __len__(self):
+        return len(self.chain)
+
+    def __repr__(self):
+        return f"IndexedChain({self.chain.meta.get('symbol', '?')} as of {self.as_of}, {len(self)} contracts)"
+
+    @property
+    def expirations(self):
+        """ datetime64[D] of the expirations listed, ascending """
+        if not len(self):
+            return np.empty(0, 'datetime64[D]')
+        return self.chain.categories['expiration'][np.unique(self._expiration)]
+
+    def strikes(self, expiration, type):
+        """ ascending strikes of one expiration and type """
+        if not len(self):
+            return np.empty(0, FLOAT)
+        return self.chain.columns['strike'][self.positions(expiration=expiration, type=type)]
+
+    def _expiration_codes(self, expiration, dte):
+        """ [lo, hi] range of expiration codes matching both bounds """
+        categories = self.chain.categories['expiration']
+        lo, hi = 0, len(categories) - 1
+        for first, last in (_bounds(expiration) if expiration is not None else (None, None),
+                            [None if d is None else self.as_of + d for d in _bounds(dte)]
+                            if dte is not None else (None, None)):
+            if first is not None:
+                lo = max(lo, np.searchsorted(categories, np.datetime64(first, 'D'), 'left'))
+            if last is not None:
+                hi = min(hi, np.searchsorted(categories, np.datetime64(last, 'D'), 'right') - 1)
+        return lo, hi
+
+    def positions(self, expiration=None, dte=None, type=None, strike=None, spot=None, within=None, **ranges):
+        """
+        Row numbers of the contracts matching every criterion, in chain order.
+
+        expiration: a date or (first, last) dates.
+        dte:        days to expiration from as_of, a number or (min, max).
+        type:       'call' or 'put'.
+        strike:     a strike or (min, max).
+        spot / within:
+                    strikes within a fraction of spot, e.g. spot=187.5, within=0.05.
+        ranges:     (min, max) bounds on any other column, e.g. delta=(-0.4, -0.2),
+                    open_interest=(100, None). None leaves a side open.
+        """
+        if within is not None and spot is None:
+            raise ValueError("within needs spot")
+        if not len(self):
+            return np.empty(0, np.intp)
+        chosen = np.ones(len(self._starts), bool)
+        if expiration is not None or dte is not None:
+            lo, hi = self._expiration_codes(expiration, dte)
+            chosen &= (self._expiration >= lo) & (self._expiration <= hi)
+        if type is not None:
+            categories = self.chain.categories['type']
+            code = np.searchsorted(categories, type)
+            if code == len(categories) or categories[code] != type:
+                return np.empty(0, np.intp)
+            chosen &= self._type == code
+        blocks = np.flatnonzero(chosen)
+        low, high = _bounds(strike) if strike is not None else (None, None)
+        if within is not None:
+            low = spot * (1 - within) if low is None else max(low, spot * (1 - within))
+            high = spot * (1 + within) if high is None else min(high, spot * (1 + within))
+        low, high = _stored(low), _stored(high)
+        starts, ends = self._starts[blocks], self._ends[blocks]
+        # offsets stay inside a block: [0, span - 1] holds the strikes, span - 0.5 the NaNs
+        if low is not None:
+            offset = min(max(low - self._low, 0), self._span - 0.25)
+            starts = np.searchsorted(self._key, blocks * self._span + offset, 'left')
+        if high is not None:
+            offset = min(high - self._low, self._span - 1)
+            ends = np.maximum(np.searchsorted(self._key, blocks * self._span + offset, 'right'), starts)
+        rows = _ranges(starts, ends)
+        for name, bounds in ranges.items():
+            values = self.chain.columns[name][rows]
+            lo, hi = _bounds(bounds)
+            keep = np.ones(len(rows), bool)
+            if values.dtype == FLOAT:
+                lo, hi = _stored(lo), _stored(hi)
+            elif values.dtype == COUNT:
+                keep &= values != MISSING_COUNT
+            if lo is not None:
+                keep &= values >= lo
+            if hi is not None:
+                keep &= values <= hi
+            rows = rows[keep]
+        return rows
+
+    def select(self, **criteria):
+        """
+        OptionChain of the contracts matching criteria (see positions()).
+
+            puts = chain.select(dte=(30, 45), type='put', spot=187.5, within=0.05)
+        """
+        return self.chain[self.positions(**criteria)]
+
+    def _contract_ids(self):
+        """ (sorted decoded contract IDs, their row numbers), built on first use """
+        if self._ids is None:
+            ids = self.chain['contractID'] if len(self) else np.empty(0, str)
+            order = np.argsort(ids, kind='stable')
+            self._ids = ids[order], order
+        return self._ids
+
+    def diff(self, previous, columns=DIFF_COLUMNS):
+        """
+        What changed since an earlier snapshot (an IndexedChain or OptionChain).
+
+        Returns ChainDiff(added, removed, changed, deltas): OptionChains of the
+        contracts only this snapshot lists, only the previous one listed, and
+        those listed in both whose columns differ (rows of this snapshot), and
+        {column: this - previous} aligned with changed, float64 with NaN where
+        either side is missing.
+        """
+        if not isinstance(previous, IndexedChain):
+            previous = IndexedChain(previous, self.as_of)
+        ids, rows = self._contract_ids()
+        old_ids, old_rows = previous._contract_ids()
+        _, here, there = np.intersect1d(ids, old_ids, assume_unique=True, return_indices=True)
+        both, old_both = rows[here], old_rows[there]
+        added = np.setdiff1d(rows, both)
+        removed = np.setdiff1d(old_rows, old_both)
+        columns = [c for c in columns if c in self.chain.columns and c in previous.chain.columns]
+        changed = np.zeros(len(both), bool)
+        for name in columns:
+            new, old = _numbers(self.chain.columns[name][both]), _numbers(previous.chain.columns[name][old_both])
+            changed |= ~((new == old) | (np.isnan(new) & np.isnan(old)))
+        order = np.argsort(both[changed])
+        both, old_both = both[changed][order], old_both[changed][order]
+        deltas = {name: _numbers(self.chain.columns[name][both]) - _numbers(previous.chain.columns[name][old_both])
+                  for name in columns}
+        return ChainDiff(self.chain[added], previous.chain[removed], self.chain[both], deltas)
@@ -0,0 +1,88 @@
+"""
+Retry policy and response checks shared by Alpha_url and AsyncAlpha_url.
+
+Alpha Vantage answers throttling with HTTP 200 and a small JSON body
+({"Note": ...} or {"Information": "... rate limit ..."}), also for CSV
+requests, and reports bad parameters the same way ({"Error Message": ...}).
+response_error() turns those bodies into exceptions; the transport retries
+throttling, connection errors and 429/5xx answers with exponential backoff
+and jitter, and raises the rest so no endpoint returns them as data.
+"""
+import random
+import re
+
+from .errors import ApiError, RateLimitError, QuotaExceededError
+
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+_THROTTLE = re.compile(r'rate limit|call frequency|requests per|spreading out', re.IGNORECASE)
+_DAILY = re.compile(r'per day|daily', re.IGNORECASE)
+
+
+def retry_exceptions():
+    """ transport errors worth retrying (imports requests on first use) """
+    import requests
+
+    return requests.exceptions.ConnectionError, requests.exceptions.Timeout
+
+
+def api_message(content):
+    """ the JSON notice dict of a throttle / error body, or None for data """
+    if content[:1] != b'{' or len(content) > 4096:
+        return None
+    import json
+
+    try:
+        data = json.loads(content)
+    except ValueError:
+        return None
+    if isinstance(data, dict) and {'Note', 'Information', 'Error Message'} & data.keys():
+        return data
+    return None
+
+
+def response_error(status_code, content):
+    """ the AlphaVantageError a 200 response stands for, or None if it carries data """
+    if status_code != 200:
+        return None
+    message = api_message(content)
+    if message is None:
+        return None
+    text = ' '.join(str(v) for v in message.values())
+    if 'Error Message' in message:
+        return ApiError(text)
+    if _THROTTLE.search(text) or 'Note' in message:
+        if _DAILY.search(text):
+            return QuotaExceededError(text)
+        return RateLimitError(text)
+    return ApiError(text)  # e.g. premium endpoint notices
+
+
+class RetryPolicy:
+    def __init__(self, max_retries=5, backoff=2.0, max_backoff=60.0, jitter=True):
+        """
+        max_retries: extra attempts after the first one (0 disables retrying).
+        backoff:     delay before the first retry, doubled on every further one.
+        max_backoff: upper bound of a single delay.
+        jitter:      randomize each delay between half and all of it, so
+                     parallel workers do not retry in lockstep.
+        """
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+
+    def delay(self, attempt):
+        """ seconds to wait after failed attempt number attempt (0-based) """
+        delay = min(self.max_backoff, self.backoff * 2 ** attempt)
+        if self.jitter:
+            delay = delay / 2 + random.uniform(0, delay / 2)
+        return delay
+
+    def should_retry(self, attempt, status_code=None, error=None):
+        """ whether a failed attempt is worth repeating """
+        if attempt >= self.max_retries:
+            return False
+        if error is not None:
+            return isinstance(error, (RateLimitError,) + retry_exceptions())
+        return status_code in RETRY_STATUSES
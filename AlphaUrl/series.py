@@ -0,0 +1,198 @@
+"""
+Columnar time series parsed straight from Alpha Vantage payloads.
+
+    ts = av.as_series('get_daily_adjusted_data', 'IBM')
+    ts.timestamps                         # int64 epoch seconds, ascending
+    ts.close, ts.volume                   # float64 columns
+    ts.between('2020-01-01', '2020-12-31')  # views into the same arrays
+
+Works for the CSV text or JSON dict returned by the get_*_data, fx_*,
+crypto_intraday, digital_currency_*, commodity and economic methods (series
+with a single 'value' column expose it as close).
+
+Requires numpy.
+"""
+import io
+import re
+
+import numpy as np
+
+OHLCV = ('open', 'high', 'low', 'close', 'volume')
+
+
+def _column_name(raw):
+    """ 'timestamp', '1. open', '5. adjusted close', 'close (USD)' -> canonical column name """
+    name = re.sub(r'^\d+[a-z]?\.\s*', '', raw.strip())
+    name = re.sub(r'\s*\(.*\)$', '', name)
+    name = name.lower().replace(' ', '_')
+    if name in ('time', 'date', 'datetime'):
+        return 'timestamp'
+    if name == 'value':
+        return 'close'
+    return name
+
+
+def _to_epoch(value):
+    """ date string, datetime, datetime64 or epoch seconds -> int64 epoch seconds """
+    if isinstance(value, (int, np.integer)):
+        return np.int64(value)
+    return np.datetime64(value, 's').astype(np.int64)
+
+
+def _to_float(values):
+    """ str column -> float64, with Alpha Vantage's '.' marking a missing value """
+    values = np.where(values == '.', 'nan', values)
+    return values.astype(np.float64)
+
+
+class TimeSeries:
+    def __init__(self, timestamps, columns, meta=None):
+        """
+        timestamps: int64 epoch seconds in ascending order.
+        columns:    {name: float64 array} aligned with timestamps.
+        meta:       descriptive fields of the response ('Meta Data', unit, ...).
+        """
+        self.timestamps = timestamps
+        self.columns = columns
+        self.meta = meta or {}
+
+    @property
+    def open(self):
+        return self.columns.get('open')
+
+    @property
+    def high(self):
+        return self.columns.get('high')
+
+    @property
+    def low(self):
+        return self.columns.get('low')
+
+    @property
+    def close(self):
+        return self.columns.get('close')
+
+    @property
+    def volume(self):
+        return self.columns.get('volume')
+
+    @property
+    def dates(self):
+        return self.timestamps.astype('datetime64[s]')
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def __getitem__(self, item):
+        """ ts['close'] is a column, ts[10:20] a TimeSeries of views """
+        if isinstance(item, str):
+            return self.columns[item]
+        return TimeSeries(self.timestamps[item], {k: v[item] for k, v in self.columns.items()}, self.meta)
+
+    def __repr__(self):
+        if not len(self):
+            return 'TimeSeries(empty)'
+        first, last = self.dates[0], self.dates[-1]
+        return f"TimeSeries({len(self)} rows {first} .. {last}, columns={list(self.columns)})"
+
+    def between(self, start=None, end=None):
+        """ rows with start <= timestamp <= end, as views (no copy) """
+        lo = 0 if start is None else np.searchsorted(self.timestamps, _to_epoch(start), 'left')
+        hi = len(self) if end is None else np.searchsorted(self.timestamps, _to_epoch(end), 'right')
+        return self[lo:hi]
+
+    @classmethod
+    def from_csv(cls, text):
+        first, _, body = text.partition('\n')
+        header = [_column_name(h) for h in first.split(',')]
+        stamp = header.index('timestamp')
+        if not body.strip():
+            # no rows (an empty month, a refresh with nothing new): empty, same columns
+            return cls(np.empty(0, np.int64), {name: np.empty(0) for name in header if name != 'timestamp'})
+        table = np.loadtxt(io.StringIO(body), delimiter=',', dtype=str, ndmin=2)
+        timestamps = table[:, stamp].astype('datetime64[s]').astype(np.int64)
+        columns = {}
+        for i, name in enumerate(header):
+            if i == stamp:
+                continue
+            try:
+                columns[name] = _to_float(table[:, i])
+            except ValueError:
+                continue  # not a numeric column
+        return cls._ascending(timestamps, columns)
+
+    @classmethod
+    def from_json(cls, payload):
+        meta = {k: v for k, v in payload.items() if not isinstance(v, (dict, list))}
+        meta.update(payload.get('Meta Data', {}))
+        if isinstance(payload.get('data'), list):
+            # commodities and economic indicators: [{'date': ..., 'value': ...}, ...]
+            rows = payload['data']
+            raw = list(rows[0]) if rows else []
+            date = next((r for r in raw if _column_name(r) == 'timestamp'), None)
+            points = {row[date]: row for row in rows}
+        else:
+            block = next((v for k, v in payload.items() if k != 'Meta Data' and isinstance(v, dict)), None)
+            if block is None:
+                raise ValueError(f"No time series in payload: {list(payload)}")
+            points = block
+            raw = list(next(iter(block.values()), {}))
+        names = [_column_name(r) for r in raw]
+        timestamps = np.array(list(points), dtype='datetime64[s]').astype(np.int64)
+        table = np.array([[row.get(r, '.') for r in raw] for row in points.values()], dtype=str).reshape(len(points), len(raw))
+        columns = {}
+        for i, name in enumerate(names):
+            if name == 'timestamp':
+                continue
+            try:
+                columns[name] = _to_float(table[:, i])
+            except ValueError:
+                continue
+        return cls._ascending(timestamps, columns, meta)
+
+    @classmethod
+    def parse(cls, payload):
+        """ TimeSeries from whatever an endpoint method returned (CSV text or JSON dict) """
+        if isinstance(payload, dict):
+            return cls.from_json(payload)
+        return cls.from_csv(payload)
+
+    @classmethod
+    def concat(cls, parts):
+        """
+        One series from several (e.g. month slices): rows sorted by time, a
+        timestamp present in more than one part is kept once (from the later
+        part). Only columns common to every part are kept.
+        """
+        parts = [p for p in parts if len(p)]
+        if not parts:
+            return cls(np.empty(0, np.int64), {})
+        names = [n for n in parts[0].columns if all(n in p.columns for p in parts[1:])]
+        timestamps = np.concatenate([p.timestamps for p in parts])
+        order = np.argsort(timestamps, kind='stable')
+        timestamps = timestamps[order]
+        keep = np.append(timestamps[1:] != timestamps[:-1], True)
+        columns = {n: np.concatenate([p.columns[n] for p in parts])[order][keep] for n in names}
+        return cls(timestamps[keep], columns, parts[-1].meta)
+
+    @classmethod
+    def _ascending(cls, timestamps, columns, meta=None):
+        """ Alpha Vantage lists newest first; store oldest first in contiguous arrays """
+        if len(timestamps) > 1 and timestamps[0] > timestamps[-1]:
+            timestamps = np.ascontiguousarray(timestamps[::-1])
+            columns = {k: np.ascontiguousarray(v[::-1]) for k, v in columns.items()}
+        return cls(timestamps, columns, meta)
+
+
+def month_range(start, end):
+    """ 'YYYY-MM' strings of every month from start to end inclusive """
+    first, last = np.datetime64(start, 'M'), np.datetime64(end, 'M')
+    return [str(m) for m in np.arange(first, last + 1)]
+
+
+def stitch_months(payloads, start, end):
+    """ month slices (CSV text or JSON) -> one deduplicated TimeSeries trimmed to
+    [start, end]; a date-only end includes that whole day / month """
+    series = TimeSeries.concat(TimeSeries.parse(p) for p in payloads)
+    end = np.datetime64(end)
+    return series.between(start, (end + 1).astype('datetime64[s]') - 1)
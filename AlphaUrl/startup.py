@@ -0,0 +1,89 @@
+"""
+Import-time budget of the package.
+
+Short-lived processes (CLI runs, serverless invocations) pay for every import
+on each cold start. BUDGET caps what typical entry points may cost in a fresh
+interpreter, in milliseconds, and none of them may load a HEAVY dependency:
+those are only imported once a request is sent or a feature that needs them
+(AsyncAlpha_url, the caches, numpy based series and indicators) is used.
+
+    python -m AlphaUrl.startup                     # report, exit status 1 when over budget
+    python -m AlphaUrl.startup "import AlphaUrl"    # report one statement
+
+measure() runs a statement in fresh interpreters under -X importtime and
+keeps the fastest run, with the modules the statement imported.
+"""
+import collections
+import subprocess
+import sys
+
+BUDGET = {
+    'import AlphaUrl': 5,
+    'from AlphaUrl import Alpha_url': 25,
+    'from AlphaUrl import Alpha_url; Alpha_url("demo").realtime_bulk_quotes': 25,
+    'from AlphaUrl import Alpha_url; Alpha_url("demo").get_daily_data': 40,
+}
+HEAVY = ('requests', 'urllib3', 'asyncio', 'aiohttp', 'numpy', 'sqlite3', 'concurrent.futures')
+
+Measurement = collections.namedtuple('Measurement', 'statement milliseconds modules')
+
+_MARK = '-- AlphaUrl.startup --'
+_PROBE = '''import sys, time
+sys.stderr.write({mark!r} + "\\n")
+start = time.perf_counter()
+{statement}
+sys.stderr.write("%d\\n" % ((time.perf_counter() - start) * 1e6))
+'''
+
+
+def _run(statement):
+    code = _PROBE.format(mark=_MARK, statement=statement)
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                             capture_output=True, text=True, check=True)
+    lines = process.stderr.splitlines()
+    lines = lines[lines.index(_MARK) + 1:]
+    modules = {}
+    for line in lines[:-1]:
+        fields = line.split('|')
+        if line.startswith('import time:') and fields[1].strip().isdigit():
+            modules[fields[2].strip()] = int(fields[1]) / 1000
+    return Measurement(statement, int(lines[-1]) / 1000, modules)
+
+
+def measure(statement, runs=5):
+    """ Measurement(statement, milliseconds, {module: cumulative ms}) of the fastest of runs """
+    return min((_run(statement) for _ in range(runs)), key=lambda m: m.milliseconds)
+
+
+def heavy_modules(measurement):
+    """ HEAVY dependencies (or their submodules) a measured statement imported """
+    return sorted(name for name in measurement.modules
+                  if any(name == heavy or name.startswith(heavy + '.') for heavy in HEAVY))
+
+
+def check(budget=None, runs=5):
+    """ [(Measurement, allowed ms, ok)] for every statement of budget (default BUDGET) """
+    report = []
+    for statement, allowed in (budget or BUDGET).items():
+        measurement = measure(statement, runs)
+        ok = measurement.milliseconds <= allowed and not heavy_modules(measurement)
+        report.append((measurement, allowed, ok))
+    return report
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    budget = {statement: BUDGET.get(statement, float('inf')) for statement in argv} or None
+    report = check(budget)
+    for measurement, allowed, ok in report:
+        print(f"{measurement.milliseconds:7.1f} ms / {allowed:g} ms  {'ok' if ok else 'OVER'}  {measurement.statement}")
+        heavy = heavy_modules(measurement)
+        if heavy:
+            print(f"{'':12}heavy: {', '.join(heavy)}")
+        slowest = sorted(measurement.modules.items(), key=lambda item: -item[1])[:5]
+        print(f"{'':12}slowest: {', '.join(f'{name} {ms:.1f} ms' for name, ms in slowest)}")
+    return 0 if all(ok for _, _, ok in report) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,236 @@
+"""
+Local columnar store for fetched series, memory-mapped on read.
+
+    store = SeriesStore('~/alphaurl-data')
+    store.write('IBM', 'daily_adjusted', av.as_series('get_daily_adjusted_data', 'IBM'))
+    ts = store.read('IBM', 'daily_adjusted')        # np.memmap columns, nothing parsed
+    ts.between('2020-01-01', '2020-12-31').close
+
+Alpha_url(store_dir=...) writes into one with store_series().
+
+Each symbol / series pair is a directory holding one append-only file per
+column (raw float64), the timestamps.i64 index (int64 epoch seconds,
+ascending) and meta.json with the row count. Appends only ever write past
+the committed rows and rows only count once meta.json has been replaced, so
+a crash in the middle of an append leaves the previous contents readable
+(bytes past the row count are ignored, and overwritten by the next append).
+Anything that changes committed rows writes a new generation of files
+(timestamps.1.i64, close.1.f64, ...) next to the current one, and meta.json
+names the generation, so replacing meta.json is the only commit point: a
+crash before it leaves the previous generation whole. Every process opening
+the same files shares their pages through the OS cache.
+
+One writer per series at a time, any number of readers.
+
+Requires numpy.
+"""
+import json
+import os
+import threading
+
+import numpy as np
+
+from .series import TimeSeries
+
+INDEX = 'timestamps.i64'
+META = 'meta.json'
+COMPACT_POINTS = 100  # rows returned by outputsize='compact'
+
+
+def _column_file(name):
+    return f'{name}.f64'
+
+
+def _generation_file(file, generation):
+    """ name of a data file in a generation: close.f64, then close.1.f64, close.2.f64 ... """
+    if not generation:
+        return file
+    stem, ext = file.rsplit('.', 1)
+    return f'{stem}.{generation}.{ext}'
+
+
+def compact_reaches(stored, interval=None):
+    """ whether outputsize='compact' can still reach back to the newest stored
+    row. Only daily series can be told before asking (business days elapsed) """
+    if stored is None or not len(stored):
+        return False
+    if interval:
+        return True
+    last = stored.dates[-1].astype('datetime64[D]')
+    return np.busday_count(last, np.datetime64('today', 'D')) < COMPACT_POINTS
+
+
+def needs_full_history(stored, compact):
+    """
+    Whether a compact response cannot simply be merged into the stored rows:
+    it does not overlap them (gap longer than the compact window), or values
+    at timestamps both hold disagree, which is what a split or dividend does
+    to adjusted history. The newest stored row is left out, it may have been a bar still
+    in progress when it was fetched.
+    """
+    if not len(compact) or compact.timestamps[0] > stored.timestamps[-1]:
+        return True
+    if list(compact.columns) != list(stored.columns):
+        return True
+    _, mine, theirs = np.intersect1d(stored.timestamps[:-1], compact.timestamps, return_indices=True)
+    for name, values in stored.columns.items():
+        if not np.allclose(values[mine], compact.columns[name][theirs], rtol=1e-9, equal_nan=True):
+            return True
+    return False
+
+
+class SeriesStore:
+    def __init__(self, path):
+        """
+        path: root directory of the store (created if missing).
+        """
+        self.path = os.path.expanduser(path)
+        os.makedirs(self.path, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def _dir(self, symbol, name):
+        return os.path.join(self.path, symbol.upper().replace(os.sep, '_'), name)
+
+    @staticmethod
+    def _info(folder):
+        try:
+            with open(os.path.join(folder, META)) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _commit(folder, rows, columns, meta, generation):
+        """ publish the new row count and generation; readers see the write from here on """
+        tmp = os.path.join(folder, META + '.tmp')
+        with open(tmp, 'w') as f:
+            json.dump({'rows': rows, 'columns': columns, 'meta': meta, 'generation': generation}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, os.path.join(folder, META))
+
+    @staticmethod
+    def _write(path, values):
+        with open(path, 'wb') as f:
+            f.write(values.tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+
+    @staticmethod
+    def _map(folder, file, dtype, rows):
+        if not rows:
+            return np.empty(0, dtype)
+        return np.memmap(os.path.join(folder, file), dtype=dtype, mode='r', shape=(rows,))
+
+    def series(self):
+        """ (symbol, name) of every stored series """
+        found = []
+        for symbol in sorted(os.listdir(self.path)):
+            folder = os.path.join(self.path, symbol)
+            if os.path.isdir(folder):
+                found += [(symbol, name) for name in sorted(os.listdir(folder))
+                          if os.path.exists(os.path.join(folder, name, META))]
+        return found
+
+    def rows(self, symbol, name):
+        info = self._info(self._dir(symbol, name))
+        return info['rows'] if info else 0
+
+    def last_timestamp(self, symbol, name):
+        """ epoch seconds of the newest stored row, or None """
+        series = self.read(symbol, name)
+        return int(series.timestamps[-1]) if series is not None and len(series) else None
+
+    def read(self, symbol, name, start=None, end=None):
+        """ stored rows as a TimeSeries of read-only memmaps, or None if nothing is stored """
+        folder = self._dir(symbol, name)
+        while True:
+            info = self._info(folder)
+            if info is None:
+                return None
+            rows, generation = info['rows'], info.get('generation', 0)
+            try:
+                timestamps = self._map(folder, _generation_file(INDEX, generation), np.int64, rows)
+                columns = {c: self._map(folder, _generation_file(_column_file(c), generation), np.float64, rows)
+                           for c in info['columns']}
+            except FileNotFoundError:
+                # a rewrite committed and removed this generation since meta.json was read
+                if self._info(folder) == info:
+                    raise
+                continue
+            return TimeSeries(timestamps, columns, info['meta']).between(start, end)
+
+    def write(self, symbol, name, series):
+        """
+        Merge series into the store; returns the stored row count. Rows after the
+        newest stored one are appended; rows lining up with the stored tail are
+        skipped when they hold the stored values and replace the tail (a
+        rewrite) when they do not. Anything else (older history, different
+        columns) rewrites the whole series, new values winning over stored ones.
+        """
+        folder = self._dir(symbol, name)
+        with self._lock:
+            os.makedirs(folder, exist_ok=True)
+            info = self._info(folder)
+            stored = self.read(symbol, name)
+            if not len(series):
+                return info['rows'] if info else 0
+            meta = dict(info['meta'] if info else {}, **series.meta)
+            if stored is not None and len(stored) and list(series.columns) == info['columns'] \
+                    and series.timestamps[0] >= stored.timestamps[0]:
+                pos = int(np.searchsorted(stored.timestamps, series.timestamps[0]))
+                overlap = len(stored) - pos
+                if not overlap:
+                    return self._append(folder, pos, series, meta, info.get('generation', 0))
+                if pos and np.array_equal(stored.timestamps[pos:], series.timestamps[:overlap]):
+                    unchanged = all(np.array_equal(stored.columns[c][pos:], v[:overlap], equal_nan=True)
+                                    for c, v in series.columns.items())
+                    if unchanged:
+                        # the usual refresh: the overlap repeats what is stored, only the rest is new
+                        if overlap == len(series):
+                            return len(stored)
+                        return self._append(folder, len(stored), series[overlap:], meta, info.get('generation', 0))
+                    # a stored value changed, stored[:pos] is kept as is
+                    return self._rewrite(folder, TimeSeries.concat([stored[:pos], series]), meta, info)
+            if stored is not None and len(stored):
+                series = TimeSeries.concat([stored, series])
+            return self._rewrite(folder, series, meta, info)
+
+    def _append(self, folder, pos, series, meta, generation):
+        """ write series after the pos committed rows; the files never shrink,
+        so memmaps of the committed rows stay valid """
+        files = [(INDEX, series.timestamps.astype(np.int64))]
+        files += [(_column_file(c), v.astype(np.float64)) for c, v in series.columns.items()]
+        for file, values in files:
+            with open(os.path.join(folder, _generation_file(file, generation)), 'r+b') as f:
+                f.seek(pos * values.itemsize)
+                f.write(values.tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+        rows = pos + len(series)
+        self._commit(folder, rows, list(series.columns), meta, generation)
+        return rows
+
+    def _rewrite(self, folder, series, meta, info):
+        """ write series as the next generation, commit it, then drop the files
+        of every other generation (open memmaps keep theirs until closed) """
+        generation = info.get('generation', 0) + 1 if info else 0
+        files = [(INDEX, series.timestamps.astype(np.int64))]
+        files += [(_column_file(c), v.astype(np.float64)) for c, v in series.columns.items()]
+        current = set()
+        for file, values in files:
+            current.add(_generation_file(file, generation))
+            self._write(os.path.join(folder, _generation_file(file, generation)), values)
+        self._commit(folder, len(series), list(series.columns), meta, generation)
+        for file in os.listdir(folder):
+            if file not in current and not file.startswith(META):
+                os.remove(os.path.join(folder, file))
+        return len(series)
+
+    def delete(self, symbol, name):
+        folder = self._dir(symbol, name)
+        with self._lock:
+            if os.path.isdir(folder):
+                for file in os.listdir(folder):
+                    os.remove(os.path.join(folder, file))
+                os.rmdir(folder)
@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip('aiohttp')
+
+from AlphaUrl import Alpha_url, AsyncAlpha_url
+from AlphaUrl.aio import _csv_rows, _mirror
+from AlphaUrl.client import _build_response
+
+BODY = ('symbol,name,exchange\r\n'
+        'A,"Agilent\r\nTechnologies, ""Inc""",NYSE\r\n'
+        'B,"Multi\nline\n\nname",NYSE\r\n'
+        'C,Café,NYSE').encode('utf-8')
+ROWS = [['symbol', 'name', 'exchange'], ['A', 'Agilent\r\nTechnologies, "Inc"', 'NYSE'],
+        ['B', 'Multi\nline\n\nname', 'NYSE'], ['C', 'Café', 'NYSE']]
+
+
+async def rows_of(chunks):
+    async def content():
+        for chunk in chunks[1:]:
+            yield chunk
+    return [row async for row in _csv_rows(chunks[0], content())]
+
+
+@pytest.mark.parametrize('size', [1, 2, 3, 7, 16, len(BODY)])
+def test_quoted_newlines_across_chunks(size):
+    chunks = [BODY[i:i + size] for i in range(0, len(BODY), size)]
+    assert asyncio.run(rows_of(chunks)) == ROWS
+
+
+def test_lines_as_aiohttp_yields_them():
+    lines = BODY.splitlines(keepends=True)
+    assert asyncio.run(rows_of(lines)) == ROWS
+
+
+class Client(AsyncAlpha_url):
+    """ AsyncAlpha_url answering every request with one CSV body """
+    sent = 0
+
+    async def _get(self, url, params=None):
+        self.sent += 1
+        return _build_response(url, 200, b'timestamp,open,high,low,close,volume\n2024-01-02,1,2,0.5,1.5,100\n')
+
+
+def test_replay_runs_a_single_request_method():
+    client = Client('demo')
+    series = asyncio.run(client.as_series('get_daily_data', 'IBM', datatype='csv'))
+    assert list(series.close) == [1.5] and client.sent == 1
+
+
+def test_replay_refuses_a_second_request():
+    def twice(self, ticker):
+        return self.get_daily_data(ticker, datatype='csv'), self.get_daily_data(ticker + 'X', datatype='csv')
+
+    Alpha_url.twice = twice
+    try:
+        mirrored = _mirror('twice')
+        with pytest.raises(RuntimeError, match='second request'):
+            asyncio.run(mirrored(Client('demo'), 'IBM'))
+    finally:
+        del Alpha_url.twice
+
+
+def test_shared_and_mirrored_methods():
+    assert not asyncio.iscoroutinefunction(AsyncAlpha_url.series_name)
+    assert asyncio.iscoroutinefunction(AsyncAlpha_url.as_series)
+    assert asyncio.iscoroutinefunction(AsyncAlpha_url.store_series)
+    assert AsyncAlpha_url('demo').series_name('get_intraday_data', 'ibm', '5min') == ('IBM', 'intraday_5min')
@@ -0,0 +1,39 @@
+import itertools
+import math
+
+import numpy as np
+import pytest
+
+from AlphaUrl.analytics import _kendall_knight, _kendall_products, kendall
+
+
+def tau_b(x, y):
+    concordant = ties_x = ties_y = 0
+    for i, j in itertools.combinations(range(len(x)), 2):
+        dx, dy = np.sign(x[j] - x[i]), np.sign(y[j] - y[i])
+        concordant += dx * dy
+        ties_x += dx == 0
+        ties_y += dy == 0
+    pairs = len(x) * (len(x) - 1) / 2
+    return concordant / math.sqrt((pairs - ties_x) * (pairs - ties_y))
+
+
+@pytest.mark.parametrize('count', [2, 7, 16, 17, 40, 129])
+def test_both_methods_match_pairwise_tau_b(count):
+    rng = np.random.default_rng(count)
+    matrix = rng.normal(size=(4, count))
+    matrix[1] = np.round(matrix[1])          # ties in one row
+    matrix[2] = np.round(matrix[0] * 2) / 2  # ties in both
+    expected = np.array([[tau_b(x, y) for y in matrix] for x in matrix])
+    assert np.allclose(_kendall_products(matrix), expected)
+    assert np.allclose(_kendall_knight(matrix), expected)
+
+
+def test_constant_and_missing_rows():
+    matrix = np.random.default_rng(0).normal(size=(3, 30))
+    matrix[1] = 1.0
+    matrix[2, 4] = np.nan
+    for method in (_kendall_products, _kendall_knight, kendall):
+        tau = method(matrix)
+        assert tau[0, 0] == pytest.approx(1)
+        assert np.isnan(tau[1]).all() and np.isnan(tau[2]).all()
@@ -0,0 +1,75 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+from AlphaUrl import Alpha_url, AsyncAlpha_url
+from AlphaUrl.client import _build_response
+
+TICKERS = [f'T{i:03d}' for i in range(250)]
+
+
+def answer(symbols):
+    """ a REALTIME_BULK_QUOTES body for symbols, listed in reverse like an API free to reorder them """
+    return {'endpoint': 'Realtime Bulk Quotes',
+            'data': [{'symbol': symbol, 'close': str(len(symbol))} for symbol in reversed(symbols.split(','))]}
+
+
+class Response:
+    def __init__(self, body):
+        self.status_code = 200
+        self.content = json.dumps(body).encode()
+        self.headers = {'Content-Type': 'application/json'}
+
+    def close(self):
+        pass
+
+
+class Session:
+    def __init__(self):
+        self.requested = []
+        self._lock = threading.Lock()
+
+    def get(self, url, params=None, timeout=None, stream=False):
+        symbols = dict(params)['symbol']
+        with self._lock:
+            self.requested.append(symbols.split(','))
+        return Response(answer(symbols))
+
+    def close(self):
+        pass
+
+
+def check(quotes, requested):
+    assert sorted(map(len, requested)) == [50, 100, 100]
+    assert sorted(sum(requested, [])) == TICKERS
+    assert list(quotes) == TICKERS
+    assert all(quotes[symbol]['symbol'] == symbol for symbol in TICKERS)
+
+
+def test_bulk_quotes_are_sent_in_chunks_of_100_and_merged_in_input_order():
+    session = Session()
+    quotes = Alpha_url('demo', session=session).realtime_bulk_quotes(TICKERS + TICKERS[:10], max_workers=3)
+    check(quotes, session.requested)
+
+
+def test_bulk_quotes_async():
+    class Client(AsyncAlpha_url):
+        requested = []
+
+        async def _get(self, url, params=None):
+            symbols = dict(params)['symbol']
+            self.requested.append(symbols.split(','))
+            return _build_response(url, 200, json.dumps(answer(symbols)).encode(),
+                                   {'Content-Type': 'application/json'})
+
+    client = Client('demo')
+    check(asyncio.run(client.realtime_bulk_quotes(TICKERS)), client.requested)
+
+
+def test_bulk_quotes_single_ticker_and_empty_input():
+    session = Session()
+    assert list(Alpha_url('demo', session=session).realtime_bulk_quotes('IBM')) == ['IBM']
+    with pytest.raises(ValueError):
+        Alpha_url('demo', session=session).realtime_bulk_quotes([])
@@ -0,0 +1,183 @@
+import threading
+import time
+
+import pytest
+
+from AlphaUrl import cache as cache_module
+from AlphaUrl.cache import DiskCache, MemoryCache, SingleFlight
+
+BODY = b'timestamp,open,high,low,close,volume\n' + b'2024-06-14,1,2,0.5,1.5,100\n' * 24
+
+
+def stored_size(cache):
+    return cache._db.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+
+
+def test_disk_cache_replacing_a_key_keeps_the_size(tmp_path):
+    cache = DiskCache(tmp_path)
+    for _ in range(5):
+        cache.set('IBM', 'daily', 200, BODY, {'Content-Type': 'text/csv'})
+    assert cache._total_size() == stored_size(cache) == len(BODY)
+    cache.set('MSFT', 'daily', 200, BODY, {})
+    assert cache._total_size() == stored_size(cache) == 2 * len(BODY)
+    cache.close()
+
+
+def test_disk_cache_size_counts_every_writer(tmp_path):
+    """ two connections to one file stand for two processes sharing the cache """
+    first = DiskCache(tmp_path, max_bytes=int(3.5 * len(BODY)))
+    second = DiskCache(tmp_path, max_bytes=int(3.5 * len(BODY)))
+    first.set('A', 'daily', 200, BODY, {})
+    first.set('B', 'daily', 200, BODY, {})
+    second.set('C', 'daily', 200, BODY, {})
+    assert first._total_size() == second._total_size() == 3 * len(BODY)
+    # the second writer sees the first one's entries and evicts the oldest
+    second.set('D', 'daily', 200, BODY, {})
+    assert first.get('A') is None
+    assert all(first.get(key) is not None for key in 'BCD')
+    assert first._total_size() == stored_size(first) == 3 * len(BODY)
+    first.clear()
+    assert second._total_size() == 0
+    first.close()
+    second.close()
+
+
+def test_disk_cache_expired_entries_leave_the_total(tmp_path):
+    cache = DiskCache(tmp_path, ttls={'daily': -1})
+    cache.set('IBM', 'daily', 200, BODY, {})
+    cache.set('quote', 'realtime', 200, BODY, {})
+    assert cache.get('IBM') is None
+    assert cache._total_size() == stored_size(cache) == len(BODY)
+    cache.close()
+
+
+def test_disk_cache_adds_the_total_to_an_older_file(tmp_path):
+    import sqlite3
+
+    db = sqlite3.connect(str(tmp_path / 'responses.sqlite'))
+    db.execute('CREATE TABLE responses (key TEXT PRIMARY KEY, expires REAL, accessed REAL, size INTEGER, '
+               'status INTEGER, content_type TEXT, content BLOB)')
+    db.execute('INSERT INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)',
+               ('IBM', time.time() + 60, time.time(), len(BODY), 200, None, BODY))
+    db.commit()
+    db.close()
+    cache = DiskCache(tmp_path)
+    assert cache._total_size() == len(BODY)
+    cache.set('MSFT', 'daily', 200, BODY, {})
+    assert cache._total_size() == 2 * len(BODY)
+    cache.close()
+
+
+def test_disk_cache_does_not_evict_below_max_bytes(tmp_path):
+    cache = DiskCache(tmp_path, max_bytes=int(2.1 * len(BODY)))
+    cache.set('MSFT', 'daily', 200, BODY, {})
+    for _ in range(10):
+        cache.set('IBM', 'daily', 200, BODY, {})
+    assert cache.get('MSFT') is not None
+    cache.close()
+
+
+def test_memory_cache_replacing_a_key_keeps_the_size():
+    cache = MemoryCache()
+    for _ in range(5):
+        cache.set('IBM', 'daily', 200, BODY, {})
+    assert cache._size == len(BODY)
+
+
+def test_memory_cache_evicts_least_recently_used_by_bytes():
+    cache = MemoryCache(max_bytes=3 * len(BODY))
+    for key in ('A', 'B', 'C'):
+        cache.set(key, 'daily', 200, BODY, {})
+    assert cache.get('A') is not None  # A is now the most recently used
+    cache.set('D', 'daily', 200, BODY, {})
+    assert cache.get('B') is None
+    assert all(cache.get(key) is not None for key in 'ACD')
+    cache.set('E', 'daily', 200, BODY * 2, {})
+    assert cache.get('C') is None and cache.get('A') is None
+    assert cache._size == 3 * len(BODY) <= cache.max_bytes
+    cache.set('F', 'daily', 200, BODY * 4, {})  # larger than the whole cache: not kept
+    assert cache.get('F') is None and cache.get('E') is not None
+
+
+def test_memory_cache_entries_expire_after_their_family_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache_module.time, 'monotonic', lambda: now[0])
+    cache = MemoryCache(ttls={'daily': 30})
+    cache.set('IBM', 'daily', 200, BODY, {})
+    cache.set('quote', 'realtime', 200, BODY, {})
+    now[0] += 29
+    assert cache.get('IBM') == (200, BODY, {})
+    now[0] += 2
+    assert cache.get('IBM') is None
+    assert cache.get('quote') is not None
+    now[0] += cache_module.CACHE_TTLS['realtime']
+    assert cache.get('quote') is None
+    assert cache._size == 0
+
+
+def test_memory_cache_skips_errors_and_api_notices():
+    cache = MemoryCache()
+    cache.set('a', 'daily', 500, BODY, {})
+    cache.set('b', 'daily', 200, b'{"Note": "Thank you for using Alpha Vantage!"}', {})
+    assert cache.get('a') is None and cache.get('b') is None
+
+
+def run_together(fn, threads=8):
+    """ flight.do('key', fn) from several threads at once; fn is held until all of them are inside do() """
+    flight = SingleFlight()
+    entered = []
+    results = []
+    release = threading.Event()
+
+    def call():
+        release.wait()
+        return fn()
+
+    def worker():
+        entered.append(1)
+        try:
+            results.append(flight.do('key', call))
+        except Exception as e:
+            results.append(e)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    while len(entered) < threads:
+        time.sleep(0.001)
+    time.sleep(0.05)
+    release.set()
+    for thread in workers:
+        thread.join()
+    return flight, results
+
+
+def test_single_flight_shares_one_call_between_threads():
+    calls = []
+
+    def fn():
+        calls.append(1)
+        return object()
+
+    flight, results = run_together(fn)
+    assert len(calls) == 1
+    assert len(results) == 8 and all(result is results[0] for result in results)
+    assert flight._flights == {}
+    flight.do('key', fn)
+    assert len(calls) == 2
+
+
+def test_single_flight_shares_one_exception_between_threads():
+    calls = []
+    error = ValueError('boom')
+
+    def fn():
+        calls.append(1)
+        raise error
+
+    flight, results = run_together(fn)
+    assert len(calls) == 1
+    assert len(results) == 8 and all(result is error for result in results)
+    assert flight._flights == {}
+    with pytest.raises(ValueError):
+        flight.do('key', fn)
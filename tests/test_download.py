@@ -0,0 +1,96 @@
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from AlphaUrl.download import JOURNAL, BulkDownload, Journal
+from AlphaUrl.errors import QuotaExceededError
+
+SYMBOLS = [f'S{i}' for i in range(12)]
+SPECS = [('get_daily_data', {})]
+
+
+class Client:
+    """ Alpha_url stand-in: get_daily_data answers after delay, refusing symbols in quota_from on """
+    pool_size = 4
+    store = None
+
+    def __init__(self, delay=0.0, quota_after=None):
+        self.delay = delay
+        self.quota_after = quota_after
+        self.calls = []
+        self.lock = threading.Lock()
+        self.closed = False
+
+    def get_daily_data(self, symbol, **kwargs):
+        with self.lock:
+            if self.quota_after is not None and len(self.calls) >= self.quota_after:
+                raise QuotaExceededError('25 requests per day')
+            self.calls.append(symbol)
+        time.sleep(self.delay)
+        assert not self.closed, 'client closed under a call'
+        return f'timestamp,close\n2024-01-02,{symbol[1:]}\n'
+
+
+def job(client, out, workers=4):
+    return BulkDownload(client, SYMBOLS, SPECS, out_dir=str(out), max_workers=workers)
+
+
+def journaled(out):
+    return Journal(os.path.join(out, JOURNAL)).done
+
+
+def test_resume_skips_journaled_calls(tmp_path):
+    first = job(Client(), tmp_path)
+    keys = [task.key for task in first.tasks]
+    first.close()
+    with open(tmp_path / JOURNAL, 'w') as f:
+        for key in keys[:5]:
+            f.write(json.dumps({'key': key, 'ok': True, 'bytes': 1}) + '\n')
+        f.write(json.dumps({'key': keys[5], 'ok': False, 'error': 'ApiError: x'}) + '\n')
+        f.write('{"key": "' + keys[6])  # torn by a crash
+    client = Client()
+    resumed = job(client, tmp_path)
+    report = resumed.run()
+    resumed.close()
+    assert sorted(client.calls) == sorted(task.symbol for task in resumed.tasks[5:])
+    assert (report.done, report.skipped, report.remaining) == (7, 5, 0)
+    assert journaled(tmp_path) == set(keys)
+
+
+def test_quota_leaves_the_rest_pending(tmp_path):
+    client = Client(quota_after=5)
+    download = job(client, tmp_path, workers=1)
+    report = download.run()
+    download.close()
+    assert report.quota_spent
+    assert (report.done, report.failed, report.remaining) == (5, 0, 7)
+    assert journaled(tmp_path) == {task.key for task in download.tasks if task.symbol in client.calls}
+    client = Client()
+    download = job(client, tmp_path)
+    assert download.run().remaining == 0
+    assert len(client.calls) == 7
+
+
+def test_interrupt_journals_calls_in_flight(tmp_path):
+    client = Client(delay=0.2)
+    download = job(client, tmp_path)
+    reports = []
+
+    def report(throughput):
+        reports.append(throughput)
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        download.run(report)
+    client.closed = True
+    download.close()
+    time.sleep(0.3)  # nothing may still be running
+    sent = set(client.calls)
+    assert len(sent) < len(SYMBOLS)
+    assert journaled(tmp_path) == {task.key for task in download.tasks if task.symbol in sent}
+    label = os.listdir(tmp_path)
+    files = [name for name in label if name != JOURNAL]
+    assert sorted(os.listdir(tmp_path / files[0])) == sorted(f'{symbol}.csv' for symbol in sent)
@@ -0,0 +1,99 @@
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+import requests
+
+from AlphaUrl import Alpha_url
+from AlphaUrl.endpoints import ENDPOINTS
+
+# (method, args, kwargs, the URL the hand-written method of the same name sent before the table)
+BASELINE = [
+    ('get_intraday_data', ('IBM', '5min'), {'month': '2024-01'},
+     'https://www.alphavantage.co/query?function=TIME_SERIES_INTRADAY&symbol=IBM&interval=5min&apikey=demo&adjusted=true&extended_hours=true&outputsize=full&datatype=csv&month=2024-01'),
+    ('get_intraday_data', ('IBM', '60min'), {'adjusted': False, 'outputsize': 'compact', 'datatype': 'json'},
+     'https://www.alphavantage.co/query?function=TIME_SERIES_INTRADAY&symbol=IBM&interval=60min&apikey=demo&adjusted=false&extended_hours=true&outputsize=compact&datatype=json'),
+    ('get_daily_data', ('IBM',), {'outputsize': 'compact'},
+     'https://www.alphavantage.co/query?function=TIME_SERIES_DAILY&symbol=IBM&apikey=demo&outputsize=compact&datatype=csv'),
+    ('get_monthly_adjusted_data', ('IBM',), {},
+     'https://www.alphavantage.co/query?function=TIME_SERIES_MONTHLY_ADJUSTED&symbol=IBM&apikey=demo&datatype=csv'),
+    ('realtime_options', ('IBM',), {},
+     'https://www.alphavantage.co/query?function=REALTIME_OPTIONS&symbol=IBM&apikey=demo&datatype=csv'),
+    ('realtime_options', ('IBM',), {'datatype': '&datatype=json'},
+     'https://www.alphavantage.co/query?function=REALTIME_OPTIONS&symbol=IBM&apikey=demo&datatype=json'),
+    ('company_overview', ('IBM',), {},
+     'https://www.alphavantage.co/query?function=OVERVIEW&symbol=IBM&apikey=demo'),
+    ('etf_profile_and_holdings', ('QQQ',), {},
+     'https://www.alphavantage.co/query?function=ETF_PROFILE&&symbol=QQQ&apikey=demo'),
+    ('insider_transactions', ('IBM',), {},
+     'https://www.alphavantage.co/query?function=INSIDER_TRANSACTIONS&symbol=IBM&apikey=demo'),
+    ('advanced_analytics_fixed_window', ('AAPL,MSFT,IBM', '2023-07-01', '2023-08-31', 'MEAN,STDDEV(annualized=True)'), {},
+     'https://alphavantageapi.co/timeseries/analytics?&SYMBOLS=AAPL,MSFT,IBM&RANGE=2023-07-01&RANGE=2023-08-31&INTERVAL=DAILY&OHLC=close&CALCULATIONS=MEAN,STDDEV(annualized=True)&apikey=demo'),
+    ('advanced_analytics_sliding_window', ('AAPL,IBM', '2023-01-01', '2023-06-30', 'MEAN,STDDEV'), {'window_size': '&WINDOW_SIZE=30', 'ohlc': '&OHLC=high'},
+     'https://alphavantageapi.co/timeseries/running_analytics?&SYMBOLS=AAPL,IBM&RANGE=2023-01-01&RANGE=2023-06-30&INTERVAL=DAILY&OHLC=high&CALCULATIONS=MEAN,STDDEV&WINDOW_SIZE=30&apikey=demo'),
+    ('fx_intraday', ('EUR', 'USD', '5min'), {},
+     'https://www.alphavantage.co/query?function=FX_INTRADAY&from_symbol=EUR&to_symbol=USD&interval=5min&apikey=demo&outputsize=full&datatype=csv'),
+    ('fx_daily', ('EUR', 'USD'), {},
+     'https://www.alphavantage.co/query?function=FX_DAILY&from_symbol=EUR&to_symbol=USD&apikey=demo&datatype=csv'),
+    ('currency_exchange_rate', ('USD', 'JPY'), {},
+     'https://www.alphavantage.co/query?function=CURRENCY_EXCHANGE_RATE&from_currency=USD&to_currency=JPY&apikey=demo'),
+    ('crypto_intraday', ('ETH', 'USD', '5min'), {},
+     'https://www.alphavantage.co/query?function=CRYPTO_INTRADAY&symbol=ETH&market=USD&interval=5min&apikey=demo&outputsize=full&datatype=csv'),
+    ('digital_currency_weekly', ('BTC', 'EUR'), {},
+     'https://www.alphavantage.co/query?function=DIGITAL_CURRENCY_WEEKLY&symbol=BTC&market=EUR&apikey=demo&outputsize=full&datatype=csv'),
+    ('crude_oil_prices_wti', ('monthly',), {},
+     'https://www.alphavantage.co/query?function=WTI&interval=monthly&apikey=demo&datatype=csv'),
+    ('treasury_yield', ('monthly', '10year'), {},
+     'https://www.alphavantage.co/query?function=TREASURY_YIELD&interval=monthly&maturity=10year&apikey=demo&datatype=csv'),
+    ('real_gdp', ('annual',), {},
+     'https://www.alphavantage.co/query?function=REAL_GDP&interval=annual&apikey=demo&datatype=csv'),
+    ('sma', ('IBM', 'weekly', 10, 'open'), {},
+     'https://www.alphavantage.co/query?function=SMA&symbol=IBM&interval=weekly&time_period=10&series_type=open&apikey=demo&datatype=csv'),
+    ('macd', ('IBM', 'daily', 'close'), {},
+     'https://www.alphavantage.co/query?function=MACD&symbol=IBM&interval=daily&series_type=close&fastperiod=12&slowperiod=26&signalperiod=9&apikey=demo&datatype=csv'),
+    ('bbands', ('IBM', 'weekly', 5, 'close'), {},
+     'https://www.alphavantage.co/query?function=BBANDS&symbol=IBM&interval=weekly&time_period=5&series_type=close&nbdevup=3&nbdevdn=3&matype=0&apikey=demo&datatype=csv'),
+    ('stoch', ('IBM', 'daily'), {},
+     'https://www.alphavantage.co/query?function=STOCH&symbol=IBM&interval=daily&fastkperiod=5&slowkperiod=3&slowdperiod=3&slowkmatype=0&slowdmatype=0&apikey=demo&datatype=csv'),
+    ('adx', ('IBM', 'daily', 14), {},
+     'https://www.alphavantage.co/query?function=ADX&symbol=IBM&interval=daily&time_period=14&apikey=demo&datatype=csv'),
+    ('vwap', ('IBM', '15min'), {},
+     'https://www.alphavantage.co/query?function=VWAP&symbol=IBM&interval=15min&apikey=demo&datatype=csv'),
+    ('ht_sine', ('IBM', 'daily', 'close'), {},
+     'https://www.alphavantage.co/query?function=HT_SINE&symbol=IBM&interval=daily&series_type=close&apikey=demo&datatype=csv'),
+]
+
+
+def pairs(url, params=None):
+    """ (scheme://host/path, query pairs) in a comparable order; repeated names keep their order """
+    prepared = requests.Request('GET', url, params=params).prepare().url
+    parts = urlsplit(prepared)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    return f'{parts.scheme}://{parts.netloc}{parts.path}', sorted(query, key=lambda pair: pair[0])
+
+
+@pytest.fixture(scope='module')
+def av():
+    return Alpha_url('demo')
+
+
+@pytest.mark.parametrize('method, args, kwargs, url', BASELINE, ids=[case[0] for case in BASELINE])
+def test_query_matches_the_baseline_url(av, method, args, kwargs, url):
+    assert pairs(*ENDPOINTS[method].request(av, *args, **kwargs)) == pairs(url)
+
+
+def test_legacy_and_plain_spellings_build_the_same_query(av):
+    endpoint = ENDPOINTS['advanced_analytics_sliding_window']
+    legacy = endpoint.request(av, 'AAPL,IBM', '2023-01-01', '2023-06-30', 'MEAN', ohlc='&OHLC=high',
+                              interval='&INTERVAL=WEEKLY', window_size='&WINDOW_SIZE=30')
+    plain = endpoint.request(av, ['AAPL', 'IBM'], '2023-01-01', '2023-06-30', 'MEAN', ohlc='high',
+                             interval='WEEKLY', window_size=30)
+    assert legacy == plain
+    assert [value for name, value in plain[1] if name == 'RANGE'] == ['2023-01-01', '2023-06-30']
+
+
+def test_none_booleans_and_renamed_arguments(av):
+    url, query = ENDPOINTS['get_intraday_data'].request(av, 'IBM', '5min', adjusted=False, extended_hours=True)
+    query = dict(query)
+    assert query['symbol'] == 'IBM' and 'ticker' not in query
+    assert (query['adjusted'], query['extended_hours']) == ('false', 'true')
+    assert 'month' not in query
@@ -0,0 +1,145 @@
+import numpy as np
+import pytest
+
+from AlphaUrl import indicators
+
+# TA-Lib output for bars() with the parameters used below, as (lookback, values at CHECKPOINTS)
+CHECKPOINTS = [99, 149, 199, 249, 299]
+MOVING_AVERAGES = {
+    'sma': (19, [98.33952379275526, 99.33333447166248, 94.56221917428373, 93.32859555494836, 91.45488171027642]),
+    'ema': (19, [98.89738435622453, 98.09743437523454, 94.43991597219078, 93.23496894770481, 92.26200980000279]),
+    'wma': (19, [99.40613832050906, 97.1961119769588, 94.33874414597834, 93.55867390172068, 91.71034502115596]),
+    'dema': (38, [100.68793541622466, 95.19982622403322, 94.05442679047212, 93.68533068062993, 92.04900967113842]),
+    'tema': (57, [101.6791303820131, 93.20855216649227, 94.1022454036095, 93.83913252949807, 92.4343849913183]),
+    'trima': (19, [98.23019301374723, 99.20726591860284, 94.55823609412727, 93.62373616980666, 90.85754682189186]),
+    'kama': (20, [98.65401336019518, 95.39547895669372, 93.74266789355707, 93.20972397470284, 92.44106778671105]),
+    't3': (24, [101.14659020931137, 94.3386771172758, 93.87130103032348, 93.65842763090896, 92.797518483866]),
+    'mama': (32, [99.20753364626596, 95.2564847334991, 94.59240123125997, 92.9630580221558, 92.36074084492289]),
+    'fama': (32, [97.01213734149074, 99.05312403183764, 94.87746655514516, 92.96900381600702, 92.23685747712092]),
+}
+OSCILLATORS = {
+    'rsi': (14, [65.82322221980462, 18.350461723888593, 49.85574018646487, 46.013386118548986, 57.6844566480615]),
+    'stochf_k': (6, [62.07932299483804, 5.6975245744429435, 61.68749239155423, 30.544780874165696, 73.86573786224776]),
+    'stochf_d': (6, [70.77155934870144, 18.334801061029363, 50.185642145278166, 30.306597706336863, 77.24821698325046]),
+    'stoch_k': (8, [70.77155934870144, 18.334801061029363, 50.185642145278166, 30.306597706336863, 77.24821698325046]),
+    'stoch_d': (8, [74.10203390399379, 20.474040833379203, 39.15909610276585, 39.815345681398504, 80.02525481072439]),
+    'stochrsi_k': (20, [48.262785455826055, 0.0, 100.0, 0.0, 78.35210215602562]),
+    'stochrsi_d': (20, [75.43846858577707, 4.026408835973901e-14, 83.98028841619978, 23.32461579553792, 92.78403405200856]),
+    'willr': (13, [-21.66422560271592, -97.3495914609343, -36.96483802797763, -70.82955571060286, -19.40386958049407]),
+    'mfi': (14, [57.08758467344247, 24.10629245183117, 59.176984728142976, 38.46193626845116, 42.680185228336875]),
+    'cci': (13, [88.23713770535012, -139.16412837687025, 31.25296876775045, -169.0531555304561, 134.28564598303313]),
+    'ultosc': (28, [61.059805357686, 37.19717805896393, 46.60364016833524, 46.633997236546435, 52.73271835481537]),
+}
+DIRECTIONAL = {
+    'adx': (27, [13.975508052693652, 32.51705228597801, 10.863406146990858, 16.015543968016576, 12.042333416454182]),
+    'adxr': (40, [11.39646879707907, 26.016810642292263, 14.269240646579949, 14.398186712826881, 13.844826794882827]),
+    'dx': (14, [18.27252186987051, 56.959764784015036, 3.3241178237333804, 3.730711191003672, 0.16953377186115182]),
+    'plus_di': (14, [34.41200108925175, 10.168099974421267, 28.702938019803646, 31.07339864693623, 26.032132651920282]),
+    'minus_di': (14, [23.77903186616895, 37.08117700278669, 26.856090451689635, 33.481765375491726, 26.12054906035384]),
+    'plus_dm': (13, [7.0042076409056815, 2.3533479999322493, 6.153503395673344, 5.704079755082078, 5.082430662813349]),
+    'minus_dm': (13, [4.839976502917801, 8.58222420650507, 5.757565433718382, 6.146178672398969, 5.099692800776733]),
+    'atr': (14, [1.4540052356113755, 1.6531767209282635, 1.5313274990612658, 1.3111995683008009, 1.3945486775823592]),
+    'natr': (14, [1.4365674538532986, 1.7825032023583827, 1.6194139792731876, 1.41909196585416, 1.4843593030133515]),
+    'trange': (1, [0.7132568040319427, 1.6962399635138468, 0.9731241787492024, 2.5206431315878746, 0.6722811447180135]),
+}
+HILBERT = {
+    'ht_trendline': (63, [98.25305926188919, 100.71993941634278, 94.60244054571082, 93.51462398549354, 92.20926079834751]),
+    'sine': (63, [-0.07124319903519577, -0.1138157728546623, -0.08412058851227588, -0.9986849597821968, 0.8913756675742035]),
+    'lead_sine': (63, [-0.7556865542522404, 0.6220320060859744, 0.6451182604987464, -0.7424284666411368, 0.9508047363493669]),
+    'dcperiod': (32, [18.684318079812687, 24.672063981151755, 20.57709215798275, 17.514182198690538, 24.514049226413015]),
+    'ht_dcphase': (63, [184.08539557451823, -6.535325361883906, -4.825457186218273, 267.0613033889803, 63.0466249038362]),
+    'phase': (32, [0.22502050105964796, -2.432962199585141, -1.4708867921540953, 0.3085805110610655, 0.17055954518618655]),
+    'quadrature': (32, [-1.2781776009782126, -2.183684534494237, -2.0449696888600752, 0.7849308743550283, -0.20716934303718246]),
+}
+# HT_TRENDMODE from bar 63 on (0 before)
+TRENDMODE = ('1110111111100000000000000011111111111111111111111111110010111000011110000011111111111111111111111111111000000000000000'
+             '00000000000000000000111111111111111111111000000000000011111111111100000100111100000000000011111111110111111111111111111')
+
+
+def bars(n=300, seed=7):
+    """ (high, low, close, volume) of a seeded random walk """
+    rng = np.random.RandomState(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, n)))
+    spread = close * rng.uniform(0.002, 0.02, n)
+    high = close + spread * rng.uniform(0.0, 1.0, n)
+    low = close - spread * rng.uniform(0.0, 1.0, n)
+    volume = rng.randint(1000, 100000, n).astype(np.float64)
+    return high, low, close, volume
+
+
+def check(values, reference):
+    lookback, expected = reference
+    values = np.asarray(values)
+    assert np.isnan(values[:lookback]).all() and not np.isnan(values[lookback:]).any()
+    assert np.allclose(values[CHECKPOINTS], expected, rtol=1e-10, atol=1e-10)
+
+
+@pytest.fixture(scope='module')
+def prices():
+    return bars()
+
+
+def moving_averages(close):
+    out = {name: getattr(indicators, name)(close, 20) for name in ('sma', 'ema', 'wma', 'dema', 'tema', 'trima', 'kama')}
+    out['t3'] = indicators.t3(close, 5, 0.7)
+    out['mama'], out['fama'] = indicators.mama(close)
+    return out
+
+
+@pytest.mark.parametrize('name', MOVING_AVERAGES)
+def test_moving_averages_match_talib(prices, name):
+    check(moving_averages(prices[2])[name], MOVING_AVERAGES[name])
+
+
+def test_moving_average_matype_codes(prices):
+    close = prices[2]
+    kernels = moving_averages(close)
+    for matype, name in enumerate(('sma', 'ema', 'wma', 'dema', 'tema', 'trima', 'kama', 'mama')):
+        expected = kernels[name]
+        assert np.allclose(indicators.moving_average(close, 20, matype), expected, equal_nan=True, rtol=0, atol=1e-12)
+    assert np.allclose(indicators.moving_average(close, 5, indicators.T3), kernels['t3'], equal_nan=True)
+    assert np.array_equal(indicators.moving_average(close, 1, indicators.EMA), close)
+
+
+def oscillators(high, low, close, volume):
+    out = {'rsi': indicators.rsi(close, 14)}
+    out['stochf_k'], out['stochf_d'] = indicators.stochf(high, low, close, 5, 3)
+    out['stoch_k'], out['stoch_d'] = indicators.stoch(high, low, close, 5, 3, indicators.SMA, 3, indicators.SMA)
+    out['stochrsi_k'], out['stochrsi_d'] = indicators.stochrsi(close, 14, 5, 3)
+    out['willr'] = indicators.willr(high, low, close, 14)
+    out['mfi'] = indicators.mfi(high, low, close, volume, 14)
+    out['cci'] = indicators.cci(high, low, close, 14)
+    out['ultosc'] = indicators.ultosc(high, low, close)
+    return out
+
+
+@pytest.mark.parametrize('name', OSCILLATORS)
+def test_oscillators_match_talib(prices, name):
+    check(oscillators(*prices)[name], OSCILLATORS[name])
+
+
+@pytest.mark.parametrize('name', DIRECTIONAL)
+def test_directional_family_matches_talib(prices, name):
+    high, low, close, _ = prices
+    check(indicators.directional(high, low, close, 14)[name], DIRECTIONAL[name])
+    # asked for alone, an output does not depend on what else is computed
+    check(indicators.directional(high, low, close, 14, (name,))[name], DIRECTIONAL[name])
+
+
+def test_directional_rejects_unknown_outputs(prices):
+    with pytest.raises(ValueError):
+        indicators.directional(*prices[:3], 14, ('adx', 'aroon'))
+
+
+@pytest.mark.parametrize('name', HILBERT)
+def test_hilbert_cycle_indicators_match_talib(prices, name):
+    close = prices[2]
+    check(indicators.hilbert(close)[name], HILBERT[name])
+    check(indicators.hilbert(close, (name,))[name], HILBERT[name])
+
+
+def test_hilbert_trendmode_is_exact(prices):
+    trendmode = indicators.hilbert(prices[2], ('trendmode',))['trendmode']
+    assert trendmode.dtype == np.int32
+    assert not trendmode[:63].any()
+    assert ''.join(map(str, trendmode[63:])) == TRENDMODE
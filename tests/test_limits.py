@@ -0,0 +1,98 @@
+import asyncio
+import datetime
+
+import pytest
+
+from AlphaUrl import QuotaExceededError, RateLimiter
+from AlphaUrl import limits
+
+
+class Clock:
+    """ stand-in for the time module: monotonic() only moves when told to, sleep() advances it """
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(limits, 'time', clock)
+    return clock
+
+
+@pytest.fixture
+def today(monkeypatch):
+    day = [datetime.date(2024, 3, 1)]
+    monkeypatch.setattr(limits, '_utc_today', lambda: day[0])
+    return day
+
+
+def test_minute_tokens_come_back_sixty_seconds_after_use(clock, today):
+    limiter = RateLimiter(calls_per_minute=3)
+    assert [limiter.reserve() for _ in range(3)] == [0, 0, 0]
+    clock.now += 10
+    assert limiter.reserve() == 50
+    clock.now += 20
+    assert limiter.reserve() == 30
+    # at t+60 the burst's three tokens are back, two already promised above
+    clock.now += 30
+    assert limiter.remaining()['minute'] == 1
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == 60
+
+
+def test_remaining(clock, today):
+    limiter = RateLimiter(calls_per_minute=5, calls_per_day=8)
+    assert limiter.remaining() == {'minute': 5, 'day': 8}
+    limiter.reserve()
+    limiter.reserve()
+    assert limiter.remaining() == {'minute': 3, 'day': 6}
+    clock.now += 60
+    assert limiter.remaining() == {'minute': 5, 'day': 6}
+    assert RateLimiter().remaining() == {'minute': None, 'day': None}
+
+
+def test_daily_budget_resets_at_utc_midnight(clock, today):
+    limiter = RateLimiter(calls_per_day=2)
+    limiter.reserve()
+    limiter.reserve()
+    with pytest.raises(QuotaExceededError):
+        limiter.reserve()
+    assert limiter.remaining()['day'] == 0
+    today[0] += datetime.timedelta(days=1)
+    assert limiter.remaining()['day'] == 2
+    assert limiter.reserve() == 0
+
+
+def test_acquire_sleeps_the_reserved_delay(clock, today):
+    limiter = RateLimiter(calls_per_minute=1)
+    limiter.acquire()
+    limiter.acquire()
+    assert clock.slept == [60]
+
+
+def test_acquire_async_awaits_the_reserved_delay(clock, today, monkeypatch):
+    slept = []
+
+    async def sleep(seconds):
+        slept.append(seconds)
+        clock.now += seconds
+
+    monkeypatch.setattr(asyncio, 'sleep', sleep)
+    limiter = RateLimiter(calls_per_minute=2)
+
+    async def main():
+        for _ in range(5):
+            await limiter.acquire_async()
+
+    asyncio.run(main())
+    assert slept == [60, 60]
+    assert clock.now == 1120
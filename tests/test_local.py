@@ -0,0 +1,80 @@
+import threading
+
+import numpy as np
+import pytest
+
+from AlphaUrl import Alpha_url, indicators
+from AlphaUrl.local import IndicatorPlan
+from AlphaUrl.series import TimeSeries
+
+SPECS = ['rsi', ('macd', {'fastperiod': 8}), {'function': 'BBANDS', 'time_period': 20},
+         ('sma', {'interval': 'weekly', 'time_period': 50}), 'RSI',
+         ('ema', {'interval': '5min', 'month': '2024-01', 'time_period': 10})]
+SEEDS = {('daily', None): 1, ('weekly', None): 2, ('5min', '2024-01'): 3}
+
+
+def prices(seed, n=400):
+    rng = np.random.RandomState(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, n)))
+    columns = {'open': close * 0.999, 'high': close * 1.01, 'low': close * 0.99, 'close': close,
+               'volume': rng.randint(1000, 100000, n).astype(np.float64)}
+    return TimeSeries(np.arange(n, dtype=np.int64) * 86400, columns)
+
+
+@pytest.fixture
+def av():
+    av = Alpha_url('demo')
+    av.fetched = []
+    lock = threading.Lock()
+
+    def price_series(ticker, interval='daily', month=None):
+        with lock:
+            av.fetched.append((ticker, interval, month))
+        return prices(SEEDS[interval, month])
+
+    av.price_series = price_series
+    return av
+
+
+def test_plan_groups_specs_by_price_series():
+    plan = IndicatorPlan('IBM', 'daily', SPECS)
+    assert plan.calls == 6
+    assert plan.fetches == 3
+    assert {key: list(requests) for key, requests in plan.groups.items()} == {
+        ('daily', None): ['rsi', 'macd(fastperiod=8)', 'bbands(time_period=20)'],
+        ('weekly', None): ['sma(interval=weekly,time_period=50)'],
+        ('5min', '2024-01'): ['ema(interval=5min,month=2024-01,time_period=10)'],
+    }
+    name, bound = plan.groups['daily', None]['macd(fastperiod=8)']
+    assert name == 'macd' and bound.arguments['fastperiod'] == 8 and bound.arguments['slowperiod'] == 26
+
+
+@pytest.mark.parametrize('spec', ['aroon', 'evaluate', '_prices', 'advanced_analytics_fixed_window'])
+def test_plan_rejects_what_is_not_a_local_indicator(spec):
+    with pytest.raises(ValueError):
+        IndicatorPlan('IBM', 'daily', [spec])
+
+
+def test_evaluate_reads_each_price_series_once(av):
+    run = av.local.evaluate('IBM', 'daily', SPECS)
+    assert sorted(av.fetched) == sorted([('IBM', '5min', '2024-01'), ('IBM', 'daily', None), ('IBM', 'weekly', None)])
+    assert (run.calls, run.fetches, run.calls_saved) == (6, 3, 3)
+
+    daily = prices(1).close
+    results = run.results
+    assert np.allclose(results['rsi']['rsi'], indicators.rsi(daily, 14), equal_nan=True)
+    assert np.allclose(results['macd(fastperiod=8)']['macd_hist'], indicators.macd(daily, 8, 26, 9)[2], equal_nan=True)
+    assert np.allclose(results['bbands(time_period=20)']['real_middle_band'], indicators.sma(daily, 20), equal_nan=True)
+    assert np.allclose(results['sma(interval=weekly,time_period=50)']['sma'], indicators.sma(prices(2).open, 50),
+                       equal_nan=True)
+    assert np.allclose(results['ema(interval=5min,month=2024-01,time_period=10)']['ema'],
+                       indicators.ema(prices(3).open, 10), equal_nan=True)
+    assert all(result.meta['symbol'] == 'IBM' for result in results.values())
+
+
+def test_evaluate_on_a_time_series_fetches_nothing(av):
+    series = prices(1)
+    run = av.local.evaluate(series, 'daily', ['rsi', ('sma', {'interval': 'weekly'})])
+    assert av.fetched == []
+    assert (run.calls, run.fetches) == (2, 0)
+    assert np.allclose(run.results['sma(interval=weekly)']['sma'], indicators.sma(series.open, 10), equal_nan=True)
@@ -0,0 +1,141 @@
+import numpy as np
+import pytest
+
+from AlphaUrl.options import IndexedChain, OptionChain, trading_days
+
+HEADER = 'contractID,symbol,expiration,strike,type,last,bid,ask,volume,date,delta'
+
+
+def chain(strikes=(0.3, 12.65, 100.1, 100.3, 101.7), date='2024-06-14'):
+    rows = [HEADER]
+    for i, strike in enumerate(strikes):
+        rows.append(f'IBM240719C{i:08d},IBM,2024-07-19,{strike},call,1.5,1.4,1.6,10,{date},0.{i + 1}')
+        rows.append(f'IBM240719P{i:08d},IBM,2024-07-19,{strike},put,2.5,2.4,2.6,20,{date},-0.{i + 1}')
+    return IndexedChain(OptionChain.from_csv('\n'.join(rows) + '\n'))
+
+
+def test_exact_strike():
+    calls = chain()
+    assert list(calls.positions(strike=100.1, type='call')) == [2]
+    assert list(calls.positions(strike=(100.1, 100.1), type='call')) == [2]
+    assert list(calls.positions(strike=12.65)) == [1, 6]
+
+
+def test_spot_within_keeps_boundary_strikes():
+    calls = chain()
+    assert list(calls.select(type='call', spot=100.1, within=0.0)['strike']) == [np.float32(100.1)]
+    assert len(calls.positions(spot=100.2, within=0.001)) == 4
+
+
+def test_column_ranges_match_stored_values():
+    assert list(chain().positions(type='call', delta=(0.3, 0.3))) == [2]
+
+
+def test_matches_brute_force():
+    calls = chain(np.round(np.linspace(80, 120, 41), 2))
+    strikes = calls.chain.columns['strike']
+    for low, high in ((90.0, 100.0), (79.0, 81.0), (119.0, 130.0), (121.0, 140.0), (50.0, 60.0)):
+        expected = np.flatnonzero((strikes >= np.float32(low)) & (strikes <= np.float32(high)))
+        assert list(calls.positions(strike=(low, high))) == list(expected)
+
+
+def test_empty_chain():
+    empty = IndexedChain(OptionChain.from_csv(HEADER + '\n'))
+    assert len(empty) == 0
+    assert len(empty.positions(strike=100.0, type='call', dte=(0, 30), delta=(0, 1))) == 0
+    assert len(empty.select(type='put')) == 0
+    assert len(empty.expirations) == 0
+    assert len(empty.strikes('2024-07-19', 'call')) == 0
+    full = chain()
+    assert len(full.diff(empty).added) == len(full)
+    assert len(empty.diff(full).removed) == len(full)
+
+
+def test_one_snapshot_only():
+    two = OptionChain.concat([chain(date='2024-06-13').chain, chain().chain])
+    with pytest.raises(ValueError):
+        IndexedChain(two)
+
+
+def test_diff():
+    old = chain()
+    columns = {name: values.copy() for name, values in old.chain.columns.items()}
+    columns['bid'][3] += 1
+    new = IndexedChain(OptionChain(columns, old.chain.categories, old.chain.meta)[2:])
+    diff = new.diff(old)
+    assert len(diff.added) == 0
+    assert len(diff.removed) == 2
+    assert list(diff.changed['contractID']) == [old.chain['contractID'][3]]
+    assert list(diff.deltas['bid']) == [pytest.approx(1)]
+
+
+FULL_HEADER = 'contractID,symbol,expiration,strike,type,last,bid,bid_size,ask,ask_size,volume,open_interest,date'
+
+
+def day(date, volume=16777217, open_interest=123456789, contracts=('C', 'P')):
+    rows = [FULL_HEADER]
+    for kind in contracts:
+        name = 'call' if kind == 'C' else 'put'
+        rows.append(f'IBM240719{kind}00100000,IBM,2024-07-19,100.0,{name},1.5,1.4,3,1.6,,{volume},{open_interest},{date}')
+    return OptionChain.from_csv('\n'.join(rows) + '\n')
+
+
+def test_counts_are_exact_integers():
+    options = day('2024-06-14')
+    assert options['volume'].dtype == np.int64
+    assert list(options['volume']) == [16777217, 16777217]  # 2**24 + 1, float32 would store 2**24
+    assert list(options['open_interest']) == [123456789, 123456789]
+    assert list(options['ask_size']) == [-1, -1]  # missing
+    assert options['bid'].dtype == np.float32
+
+
+def test_count_ranges_skip_missing_values():
+    options = IndexedChain(day('2024-06-14'))
+    assert len(options.positions(volume=(16777217, 16777217))) == 2
+    assert len(options.positions(volume=(None, 16777216))) == 0
+    assert len(options.positions(ask_size=(None, 10))) == 0
+
+
+def test_diff_of_counts():
+    old = IndexedChain(day('2024-06-14', volume=2 ** 25))
+    new = IndexedChain(day('2024-06-14', volume=2 ** 25 + 1))
+    diff = new.diff(old)
+    assert len(diff.changed) == 2
+    assert list(diff.deltas['volume']) == [1, 1]
+    assert np.isnan(diff.deltas['ask_size']).all()
+
+
+def test_save_load_round_trip(tmp_path):
+    options = OptionChain.concat([day('2024-06-14'), day('2024-06-13', volume=7)])
+    options.save(str(tmp_path / 'IBM.options'))
+    for mmap in (True, False):
+        loaded = OptionChain.load(str(tmp_path / 'IBM.options'), mmap=mmap)
+        assert loaded.meta == {'symbol': 'IBM'}
+        assert list(loaded.columns) == list(options.columns)
+        for name, values in options.columns.items():
+            assert loaded.columns[name].dtype == values.dtype
+            assert np.array_equal(loaded.columns[name], values, equal_nan=values.dtype.kind == 'f')
+        assert list(loaded['contractID']) == list(options['contractID'])
+        assert list(loaded.dates) == [np.datetime64('2024-06-13'), np.datetime64('2024-06-14')]
+    options.save(str(tmp_path / 'IBM.options'))  # replaces the earlier copy
+    assert len(OptionChain.load(str(tmp_path / 'IBM.options'))) == 4
+
+
+def test_concat_merges_dictionaries_and_keeps_the_later_duplicate():
+    first = day('2024-06-13', volume=1)
+    second = day('2024-06-14', volume=2, contracts=('P',))
+    again = day('2024-06-13', volume=3, contracts=('C',))
+    merged = OptionChain.concat([first, second, again])
+    assert len(merged) == 3
+    assert [str(d) for d in merged['date']] == ['2024-06-13', '2024-06-13', '2024-06-14']
+    assert list(merged['type']) == ['call', 'put', 'put']
+    assert list(merged['volume']) == [3, 1, 2]
+    assert merged['volume'].dtype == np.int64
+    assert list(merged.on('2024-06-14')['volume']) == [2]
+    assert len(OptionChain.concat([])) == 0
+
+
+def test_trading_days():
+    assert trading_days('2024-06-13', '2024-06-18') == ['2024-06-13', '2024-06-14', '2024-06-17', '2024-06-18']
+    assert trading_days('2024-06-15', '2024-06-16') == []
+    assert trading_days('2024-06-14', '2024-06-14') == ['2024-06-14']
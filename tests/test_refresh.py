@@ -0,0 +1,86 @@
+import os
+
+import numpy as np
+
+from AlphaUrl import Alpha_url
+from AlphaUrl.series import TimeSeries
+from AlphaUrl.store import COMPACT_POINTS, INDEX, compact_reaches, needs_full_history
+
+HEADER = 'timestamp,open,high,low,close,volume\n'
+
+
+class Source:
+    """ get_daily_adjusted_data stand-in serving a business-day history ending today """
+    def __init__(self, days, end=None):
+        end = np.datetime64('today', 'D') if end is None else np.datetime64(end, 'D')
+        self.days = np.busday_offset(end, np.arange(-days + 1, 1), roll='backward')
+        self.close = np.arange(1.0, days + 1)
+        self.calls = []
+
+    def __call__(self, ticker, outputsize='compact', datatype='csv'):
+        self.calls.append(outputsize)
+        rows = slice(-COMPACT_POINTS, None) if outputsize == 'compact' else slice(None)
+        lines = [f'{day},{c},{c},{c},{c},100\n' for day, c in zip(self.days[rows], self.close[rows])]
+        return HEADER + ''.join(reversed(lines))
+
+    def grow(self, days):
+        new = np.busday_offset(self.days[-1], np.arange(1, days + 1))
+        self.days = np.append(self.days, new)
+        self.close = np.append(self.close, self.close[-1] + np.arange(1.0, days + 1))
+
+
+def client(tmp_path, source):
+    av = Alpha_url('demo', store_dir=str(tmp_path))
+    av.get_daily_adjusted_data = source
+    return av
+
+
+def inode(av):
+    return os.stat(os.path.join(av.store._dir('IBM', 'daily_adjusted'), INDEX)).st_ino
+
+
+def test_compact_refresh_appends_in_place(tmp_path):
+    source = Source(300, end=np.busday_offset(np.datetime64('today', 'D'), -3, roll='backward'))
+    av = client(tmp_path, source)
+    assert len(av.refresh_series('get_daily_adjusted_data', 'IBM')) == 300
+    before = inode(av)
+    source.grow(3)
+    stored = av.refresh_series('get_daily_adjusted_data', 'IBM')
+    assert source.calls == ['full', 'compact']
+    assert len(stored) == 303 and list(stored.close[-4:]) == list(source.close[-4:])
+    assert inode(av) == before  # appended, the history was not rewritten
+    # nothing new: nothing written
+    av.refresh_series('get_daily_adjusted_data', 'IBM')
+    assert source.calls[-1] == 'compact' and len(av.store.read('IBM', 'daily_adjusted')) == 303
+
+
+def test_gap_longer_than_compact_fetches_full_history(tmp_path):
+    source = Source(300, end=np.busday_offset(np.datetime64('today', 'D'), -150, roll='backward'))
+    av = client(tmp_path, source)
+    av.refresh_series('get_daily_adjusted_data', 'IBM')
+    assert not compact_reaches(av.store.read('IBM', 'daily_adjusted'))
+    source.grow(150)
+    stored = av.refresh_series('get_daily_adjusted_data', 'IBM')
+    assert source.calls == ['full', 'full']
+    assert len(stored) == 450
+
+
+def test_adjusted_history_change_fetches_full_history(tmp_path):
+    source = Source(300, end=np.busday_offset(np.datetime64('today', 'D'), -1, roll='backward'))
+    av = client(tmp_path, source)
+    av.refresh_series('get_daily_adjusted_data', 'IBM')
+    source.close = source.close / 2  # a 2:1 split adjusts every past close
+    source.grow(1)
+    stored = av.refresh_series('get_daily_adjusted_data', 'IBM')
+    assert source.calls == ['full', 'compact', 'full']
+    assert list(stored.close) == list(source.close)
+
+
+def test_needs_full_history():
+    source = Source(200)
+    full = TimeSeries.from_csv(source('IBM', 'full'))
+    compact = TimeSeries.from_csv(source('IBM'))
+    assert not needs_full_history(full[:-5], compact)
+    assert needs_full_history(full[:50], compact)  # no overlap
+    changed = TimeSeries(compact.timestamps, dict(compact.columns, close=compact.close * 2))
+    assert needs_full_history(full[:-5], changed)
@@ -0,0 +1,103 @@
+import json
+
+import pytest
+import requests
+
+from AlphaUrl import Alpha_url, ApiError, QuotaExceededError, RateLimitError, RetryPolicy
+from AlphaUrl.retry import response_error
+
+DATA = {'Meta Data': {'2. Symbol': 'IBM'}, 'Time Series (Daily)': {}}
+THROTTLE = {'Note': 'Thank you for using Alpha Vantage! Our standard API call frequency is 5 calls per minute.'}
+DAILY = {'Information': 'You have reached the 25 requests per day rate limit of the free plan.'}
+ERROR = {'Error Message': 'Invalid API call. Please retry or visit the documentation for TIME_SERIES_DAILY.'}
+
+
+class Response:
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        self.content = json.dumps(body).encode() if isinstance(body, dict) else body
+        self.headers = {'Content-Type': 'application/json'}
+
+    def close(self):
+        pass
+
+
+class Session:
+    """ requests.Session stand-in answering from a script of (status, body) """
+    def __init__(self, *answers):
+        self.answers = list(answers)
+        self.calls = 0
+
+    def get(self, url, params=None, timeout=None, stream=False):
+        self.calls += 1
+        answer = self.answers.pop(0) if len(self.answers) > 1 else self.answers[0]
+        if isinstance(answer, Exception):
+            raise answer
+        return Response(*answer)
+
+    def close(self):
+        pass
+
+
+def client(session, retries=3):
+    return Alpha_url('demo', session=session, retry=RetryPolicy(max_retries=retries, backoff=0, jitter=False))
+
+
+def test_throttle_note_is_retried():
+    session = Session((200, THROTTLE), (200, THROTTLE), (200, DATA))
+    assert client(session).get_daily_data('IBM') == json.dumps(DATA)
+    assert session.calls == 3
+
+
+def test_throttle_retries_run_out():
+    session = Session((200, THROTTLE))
+    with pytest.raises(RateLimitError):
+        client(session, retries=2).get_daily_data('IBM')
+    assert session.calls == 3
+
+
+def test_daily_quota_is_not_retried():
+    session = Session((200, DAILY), (200, DATA))
+    with pytest.raises(QuotaExceededError):
+        client(session).get_daily_data('IBM')
+    assert session.calls == 1
+
+
+def test_error_message_raises_api_error():
+    session = Session((200, ERROR), (200, DATA))
+    with pytest.raises(ApiError):
+        client(session).get_daily_data('IBM')
+    assert session.calls == 1
+
+
+def test_server_errors_back_off_then_raise():
+    session = Session((503, b'unavailable'))
+    with pytest.raises(requests.HTTPError):
+        client(session, retries=2).get_daily_data('IBM')
+    assert session.calls == 3
+
+
+def test_server_error_then_success():
+    session = Session((502, b'bad gateway'), (200, DATA))
+    assert client(session).get_daily_data('IBM') == json.dumps(DATA)
+    assert session.calls == 2
+
+
+def test_connection_errors_are_retried():
+    session = Session(requests.exceptions.ConnectionError('reset'), (200, DATA))
+    assert client(session).get_daily_data('IBM') == json.dumps(DATA)
+
+
+def test_response_error_classification():
+    assert response_error(200, json.dumps(DATA).encode()) is None
+    assert response_error(200, b'timestamp,open\n') is None
+    assert isinstance(response_error(200, json.dumps(THROTTLE).encode()), RateLimitError)
+    assert isinstance(response_error(200, json.dumps(DAILY).encode()), QuotaExceededError)
+    assert isinstance(response_error(200, json.dumps(ERROR).encode()), ApiError)
+    assert response_error(503, json.dumps(ERROR).encode()) is None
+
+
+def test_delay_doubles_up_to_max_backoff():
+    policy = RetryPolicy(backoff=2, max_backoff=10, jitter=False)
+    assert [policy.delay(attempt) for attempt in range(4)] == [2, 4, 8, 10]
+    assert 1 <= RetryPolicy(backoff=2, jitter=True).delay(0) <= 2
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from AlphaUrl.analytics import (rolling_correlation, rolling_covariance, rolling_mean, rolling_median,
+                                rolling_variance)
+
+pd = pytest.importorskip('pandas')
+
+WINDOW = 20
+
+
+@pytest.fixture
+def returns():
+    return np.random.default_rng(7).normal(0.0005, 0.02, size=(4, 120))
+
+
+def frame(returns):
+    return pd.DataFrame(returns.T)
+
+
+def windows(values):
+    """ pandas rolling output (time x ...) without the incomplete leading windows """
+    return np.asarray(values)[WINDOW - 1:]
+
+
+def test_mean_variance_median(returns):
+    rolling = frame(returns).rolling(WINDOW)
+    assert np.allclose(rolling_mean(returns, WINDOW), windows(rolling.mean()).T)
+    assert np.allclose(rolling_variance(returns, WINDOW), windows(rolling.var(ddof=0)).T)
+    assert np.allclose(rolling_median(returns, WINDOW), windows(rolling.median()).T)
+    even = frame(returns).rolling(WINDOW + 1).median()
+    assert np.allclose(rolling_median(returns, WINDOW + 1), np.asarray(even)[WINDOW:].T)
+
+
+def test_covariance_and_pearson(returns):
+    rolling = frame(returns).rolling(WINDOW)
+    symbols = len(returns)
+    expected_cov = windows(rolling.cov(ddof=0).to_numpy().reshape(-1, symbols, symbols))
+    expected_corr = windows(rolling.corr().to_numpy().reshape(-1, symbols, symbols))
+    assert np.allclose(rolling_covariance(returns, WINDOW), expected_cov)
+    assert np.allclose(rolling_correlation(returns, WINDOW), expected_corr)
+
+
+@pytest.mark.parametrize('method', ['spearman', 'kendall'])
+def test_rank_correlation(returns, method):
+    if method == 'kendall':
+        pytest.importorskip('scipy')
+    data = frame(returns)
+    expected = [data.iloc[i:i + WINDOW].corr(method=method).to_numpy()
+                for i in range(returns.shape[1] - WINDOW + 1)]
+    assert np.allclose(rolling_correlation(returns, WINDOW, method.upper()), expected)
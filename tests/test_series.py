@@ -0,0 +1,28 @@
+import warnings
+
+import numpy as np
+
+from AlphaUrl.series import TimeSeries, stitch_months
+
+HEADER = 'timestamp,open,high,low,close,volume\n'
+MONTH = HEADER + '2024-02-01 16:00:00,2,3,1,2.5,200\n2024-01-31 16:00:00,1,2,0.5,1.5,100\n'
+
+
+def test_header_only_csv_is_empty():
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        series = TimeSeries.from_csv(HEADER)
+    assert len(series) == 0
+    assert list(series.columns) == ['open', 'high', 'low', 'close', 'volume']
+    assert series.timestamps.dtype == np.int64
+
+
+def test_rows_parsed_ascending():
+    series = TimeSeries.from_csv(MONTH)
+    assert list(series.close) == [1.5, 2.5]
+    assert series.timestamps[0] < series.timestamps[1]
+
+
+def test_stitch_months_skips_empty_months():
+    series = stitch_months([MONTH, HEADER, HEADER.replace('\n', '\r\n')], '2024-01', '2024-03')
+    assert len(series) == 2
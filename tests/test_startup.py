@@ -0,0 +1,55 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from AlphaUrl.startup import BUDGET, HEAVY
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROBE = '''import json, sys
+{statement}
+modules = sorted(sys.modules)
+import AlphaUrl.endpoints as endpoints
+client = sys.modules.get('AlphaUrl.client')
+generated = set(vars(client.Alpha_url)) & endpoints.ENDPOINTS.keys() if client else set()
+print(json.dumps({{
+    'modules': modules,
+    'families': sorted({{endpoints.ENDPOINTS[name].family for name in generated}}),
+}}))
+'''
+
+
+def loaded(statement):
+    """ (modules in sys.modules, endpoint families generated) after statement in a fresh interpreter """
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    output = subprocess.run([sys.executable, '-c', PROBE.format(statement=statement)], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True).stdout
+    result = json.loads(output)
+    return result['modules'], result['families']
+
+
+def heavy(modules):
+    return [name for name in modules if any(name == h or name.startswith(h + '.') for h in HEAVY)]
+
+
+@pytest.mark.parametrize('statement', BUDGET)
+def test_entry_points_load_no_heavy_dependency(statement):
+    modules, _ = loaded(statement)
+    assert heavy(modules) == []
+
+
+def test_import_loads_the_package_only():
+    modules, families = loaded('import AlphaUrl')
+    assert [name for name in modules if name.startswith('AlphaUrl')] == ['AlphaUrl']
+    assert families == []
+
+
+def test_client_generates_endpoint_families_on_first_use():
+    _, families = loaded('from AlphaUrl import Alpha_url; Alpha_url("demo")')
+    assert families == []
+    _, families = loaded('from AlphaUrl import Alpha_url; Alpha_url("demo").get_daily_data')
+    assert families == ['core']
+    _, families = loaded('from AlphaUrl import Alpha_url; Alpha_url("demo").sma; Alpha_url.fx_daily')
+    assert families == ['fx', 'indicators']
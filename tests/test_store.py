@@ -0,0 +1,101 @@
+import os
+
+import numpy as np
+import pytest
+
+from AlphaUrl.series import TimeSeries
+from AlphaUrl.store import INDEX, SeriesStore, _column_file
+
+DAY = 86400
+
+
+def series(first, count, value=1.0):
+    timestamps = (np.arange(first, first + count) * DAY).astype(np.int64)
+    return TimeSeries(timestamps, {'close': np.full(count, value)})
+
+
+def size(store, file):
+    return os.path.getsize(os.path.join(store._dir('IBM', 'daily'), file))
+
+
+def test_append(tmp_path):
+    store = SeriesStore(tmp_path)
+    assert store.write('IBM', 'daily', series(0, 5)) == 5
+    assert store.write('IBM', 'daily', series(5, 3, 2.0)) == 8
+    stored = store.read('IBM', 'daily')
+    assert list(stored.timestamps) == list(np.arange(8) * DAY)
+    assert list(stored.close) == [1.0] * 5 + [2.0] * 3
+
+
+def test_overlap_replaces_tail_without_touching_open_readers(tmp_path):
+    store = SeriesStore(tmp_path)
+    store.write('IBM', 'daily', series(0, 5))
+    before = store.read('IBM', 'daily')
+    assert store.write('IBM', 'daily', series(3, 4, 2.0)) == 7
+    assert list(store.read('IBM', 'daily').close) == [1.0] * 3 + [2.0] * 4
+    # the old files were swapped out, not cut back under the reader's memmap
+    assert list(before.close) == [1.0] * 5
+
+
+def test_crash_before_commit_keeps_previous_rows(tmp_path, monkeypatch):
+    store = SeriesStore(tmp_path)
+    store.write('IBM', 'daily', series(0, 5))
+
+    def crash(*args):
+        raise OSError('crash')
+
+    monkeypatch.setattr(SeriesStore, '_commit', staticmethod(crash))
+    with pytest.raises(OSError):
+        store.write('IBM', 'daily', series(5, 3, 2.0))
+    monkeypatch.undo()
+    stored = store.read('IBM', 'daily')
+    assert len(stored) == 5 and list(stored.close) == [1.0] * 5
+    # the uncommitted tail is overwritten by the next append
+    assert store.write('IBM', 'daily', series(5, 1, 3.0)) == 6
+    assert list(store.read('IBM', 'daily').close) == [1.0] * 5 + [3.0]
+
+
+def test_files_never_shrink_on_append(tmp_path):
+    store = SeriesStore(tmp_path)
+    store.write('IBM', 'daily', series(0, 5))
+    store.write('IBM', 'daily', series(5, 3))
+    index, close = size(store, INDEX), size(store, _column_file('close'))
+    store.write('IBM', 'daily', series(8, 1))
+    assert size(store, INDEX) >= index and size(store, _column_file('close')) >= close
+
+
+def test_crash_in_rewrite_keeps_previous_generation(tmp_path, monkeypatch):
+    store = SeriesStore(tmp_path)
+    store.write('IBM', 'daily', series(0, 5))
+    write, calls = SeriesStore._write, []
+
+    def crash_after_first(path, values):
+        if calls:
+            raise OSError('crash')
+        calls.append(path)
+        write(path, values)
+
+    monkeypatch.setattr(SeriesStore, '_write', staticmethod(crash_after_first))
+    with pytest.raises(OSError):
+        # older history in front: every stored row moves
+        store.write('IBM', 'daily', series(-3, 3, 2.0))
+    monkeypatch.undo()
+    stored = store.read('IBM', 'daily')
+    assert list(stored.timestamps) == list(np.arange(5) * DAY)
+    assert list(stored.close) == [1.0] * 5
+    assert store.write('IBM', 'daily', series(-3, 3, 2.0)) == 8
+    stored = store.read('IBM', 'daily')
+    assert list(stored.timestamps) == list(np.arange(-3, 5) * DAY)
+    assert list(stored.close) == [2.0] * 3 + [1.0] * 5
+    # only the committed generation is left on disk
+    assert sorted(os.listdir(store._dir('IBM', 'daily'))) == ['close.1.f64', 'meta.json', 'timestamps.1.i64']
+
+
+def test_reader_of_an_old_generation_keeps_its_files(tmp_path):
+    store = SeriesStore(tmp_path)
+    store.write('IBM', 'daily', series(0, 5))
+    before = store.read('IBM', 'daily')
+    store.write('IBM', 'daily', series(-3, 3, 2.0))
+    store.write('IBM', 'daily', series(-6, 3, 3.0))
+    assert list(before.close) == [1.0] * 5
+    assert len(store.read('IBM', 'daily')) == 11
@@ -0,0 +1,68 @@
+import csv
+import io
+
+import pytest
+import requests
+
+from AlphaUrl import Alpha_url, ApiError, RetryPolicy
+from AlphaUrl import client as client_module
+from AlphaUrl.client import _iter_lines
+
+BODY = 'symbol,name,note\r\nAIR,"Airbus ""SE""","Café\nline two"\nIBM,International Business Machines,ok\n'
+ROWS = [['symbol', 'name', 'note'],
+        ['AIR', 'Airbus "SE"', 'Café\nline two'],
+        ['IBM', 'International Business Machines', 'ok']]
+
+
+def split(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize('size', range(1, 17))
+def test_iter_lines_keeps_quoted_newlines_and_split_characters(size):
+    chunks = split(BODY.encode(), size)
+    assert list(csv.reader(_iter_lines(iter(chunks), 'utf-8'))) == ROWS
+
+
+def test_iter_lines_without_trailing_newline():
+    assert list(_iter_lines(iter([b'a,b\nc,', b'd']), 'utf-8')) == ['a,b\n', 'c,d']
+
+
+class Session:
+    """ requests.Session stand-in streaming one body """
+    def __init__(self, body):
+        self.body = body
+        self.calls = []
+
+    def get(self, url, params=None, timeout=None, stream=False):
+        self.calls.append((url, params, stream))
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response.encoding = 'utf-8'
+        response.raw = io.BytesIO(self.body)
+        return response
+
+    def close(self):
+        pass
+
+
+def client(session):
+    return Alpha_url('demo', session=session, retry=RetryPolicy(max_retries=0, backoff=0, jitter=False))
+
+
+@pytest.mark.parametrize('size', [1, 2, 3, 5, 7])
+def test_iter_rows_across_chunk_boundaries(monkeypatch, size):
+    monkeypatch.setattr(client_module, 'STREAM_CHUNK_SIZE', size)
+    session = Session(BODY.encode())
+    rows = list(client(session).iter_rows('LISTING_STATUS'))
+    assert rows == [dict(zip(ROWS[0], row)) for row in ROWS[1:]]
+    url, params, stream = session.calls[0]
+    assert stream and params['datatype'] == 'csv'
+
+
+def test_iter_rows_raises_json_error_in_place_of_csv(monkeypatch):
+    monkeypatch.setattr(client_module, 'STREAM_CHUNK_SIZE', 4)
+    session = Session(b'{"Error Message": "Invalid API call."}')
+    with pytest.raises(ApiError):
+        list(client(session).iter_rows('LISTING_STATUS'))